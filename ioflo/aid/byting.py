@@ -345,6 +345,171 @@ def unpackify(fmt=u'1 1 1 1 1 1 1 1',
         fields.append(bits) #assign to fields list
     return tuple(fields) #convert to tuple
 
+class Packifier(object):
+    """
+    Packifier is compiled bit field codec for a packify format string.
+    Equivalent to packify/packifyInto/unpackify with the same fmt, size and
+    reverse but the bit field shifts and masks are computed once from fmt
+    instead of on every call.
+
+    Attributes:
+        .fmt is packify format string of white space separated bit field lengths
+        .size is number of bytes packed
+        .reverse is True if bytes are reversed (little endian)
+        .fields is tuple of (shift, mask, flag) per bit field where flag
+            is True when bit field length is 1
+        .remnant is number of low order bits left over after last bit field
+    """
+    __slots__ = ('fmt', 'size', 'reverse', 'fields', 'remnant', 'order')
+
+    def __init__(self, fmt=u'8', size=None, reverse=False):
+        """
+        Initialization method for instance.
+
+        Parameters:
+            fmt is packify format string
+            size is number of bytes or None for least that hold fmt
+            reverse is True to reverse byte order
+        """
+        lengths = [int(x) for x in fmt.split()]
+        tbfl = sum(lengths)
+        if size is None:
+            size = (tbfl // 8) + 1 if tbfl % 8 else tbfl // 8
+
+        if not (0 <= tbfl <= (size * 8)):
+            raise ValueError("Total bit field lengths in fmt not in [0, {0}]".format(size * 8))
+
+        self.fmt = fmt
+        self.size = size
+        self.reverse = True if reverse else False
+        self.order = 'little' if self.reverse else 'big'
+        fields = []
+        bfp = 8 * size  # bit field position
+        for bfl in lengths:
+            bfp -= bfl
+            fields.append((bfp, 2**bfl - 1, bfl == 1))
+        self.fields = tuple(fields)
+        self.remnant = bfp
+
+    def _integize(self, fields):
+        """
+        Returns unsigned int of bit fields sequence fields
+        """
+        if len(fields) < len(self.fields):
+            raise IndexError("Need {0} fields, got {1}.".format(len(self.fields),
+                                                              len(fields)))
+        n = 0
+        for (shift, mask, flag), value in zip(self.fields, fields):
+            if flag:
+                value = 1 if value else 0
+            else:
+                value &= mask
+            n |= value << shift
+        return n
+
+    def _fieldize(self, n, boolean=False):
+        """
+        Returns tuple of bit field values of unsigned int n
+        """
+        result = []
+        for shift, mask, flag in self.fields:
+            bits = (n >> shift) & mask
+            if flag and boolean:
+                bits = True if bits else False
+            result.append(bits)
+        if self.remnant:  # remaining bits
+            bits = n & (2**self.remnant - 1)
+            if self.remnant == 1 and boolean:
+                bits = True if bits else False
+            result.append(bits)
+        return tuple(result)
+
+    def pack(self, fields):
+        """
+        Returns bytearray of bit fields sequence fields like packify
+        """
+        return bytearray(self._integize(fields).to_bytes(self.size, self.order))
+
+    def packInto(self, b, fields, offset=0):
+        """
+        Packs bit fields sequence fields into bytearray b at offset like
+        packifyInto. Extends b if not long enough. Returns .size
+        """
+        end = offset + self.size
+        if len(b) < end:
+            b.extend(bytes(end - len(b)))
+        b[offset:end] = self._integize(fields).to_bytes(self.size, self.order)
+        return self.size
+
+    def unpack(self, b, offset=0, boolean=False):
+        """
+        Returns tuple of bit field values unpacked from .size bytes of b at
+        offset like unpackify. b is bytes like such as memoryview.
+        Reverse applies to the .size bytes at offset only.
+        """
+        if len(b) < offset + self.size:
+            raise ValueError("Need {0} bytes, got {1} bytes.".format(self.size,
+                                                                   len(b) - offset))
+        n = int.from_bytes(b[offset:offset + self.size], self.order)
+        return self._fieldize(n, boolean=boolean)
+
+    def packMany(self, records, b=None, offset=0):
+        """
+        Returns bytearray b with each bit fields sequence in records packed
+        contiguously starting at offset. Creates b if None.
+        """
+        size = self.size
+        end = offset + size * len(records)
+        if b is None:
+            b = bytearray(end)
+        elif len(b) < end:
+            b.extend(bytes(end - len(b)))
+        order = self.order
+        for record in records:
+            b[offset:offset + size] = self._integize(record).to_bytes(size, order)
+            offset += size
+        return b
+
+    def unpackMany(self, b, offset=0, count=None, boolean=False):
+        """
+        Returns list of tuples of bit field values unpacked from count
+        contiguous .size byte records of b starting at offset.
+        If count is None unpacks as many whole records as b holds.
+        """
+        size = self.size
+        if not size:
+            return []
+        available = (len(b) - offset) // size
+        if count is None:
+            count = available
+        elif count > available:
+            raise ValueError("Need {0} bytes, got {1} bytes.".format(size * count,
+                                                                   len(b) - offset))
+        view = memoryview(b)
+        try:
+            order = self.order
+            results = []
+            for i in range(count):
+                n = int.from_bytes(view[offset:offset + size], order)
+                results.append(self._fieldize(n, boolean=boolean))
+                offset += size
+        finally:
+            view.release()
+        return results
+
+
+_packifiers = {}  # compiled Packifiers keyed by (fmt, size, reverse)
+
+def compilePackifier(fmt=u'8', size=None, reverse=False):
+    """
+    Returns cached compiled Packifier for fmt, size, and reverse
+    """
+    key = (fmt, size, reverse)
+    packifier = _packifiers.get(key)
+    if packifier is None:
+        packifier = _packifiers[key] = Packifier(fmt=fmt, size=size, reverse=reverse)
+    return packifier
+
 def signExtend(x, n=8):
     """
     Returns signed integer that is the sign extention of n bit unsigned integer x
@@ -531,3 +696,161 @@ def printDecimal(s):
     print(ps)
 
 
+class Bytebuffer(object):
+    """
+    Growable preallocated byte buffer for zero copy receives with recv_into
+    and consumption through memoryview views instead of copies.
+
+    Unconsumed data is .buf[.start:.end]. Space after .end is reserved for
+    receives. Consumed space at the front is reclaimed by moving unconsumed
+    data to the front when space is reserved and when still too small .buf
+    is replaced by a larger one.
+
+    Views returned by view, tail, cat, reserve and slicing refer to .buf so
+    are only valid until the next reserve or extend.
+
+    Supports len, truth, bytes, find, int index, slice views and deletion of
+    leading slice such as del buffer[:n] which consumes n bytes.
+    """
+    __slots__ = ('buf', 'start', 'end')
+
+    def __init__(self, size=8096):
+        """
+        Initialize instance
+
+        Parameters:
+            size = initial capacity in bytes
+        """
+        self.buf = bytearray(max(1, int(size)))
+        self.start = 0  # index of first unconsumed byte
+        self.end = 0  # index after last unconsumed byte
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __bool__(self):
+        return self.end > self.start
+
+    def __bytes__(self):
+        return bytes(self.buf[self.start:self.end])
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, bytes(self))
+
+    def __eq__(self, other):
+        if isinstance(other, Bytebuffer):
+            other = other.view()
+        return self.view() == other
+
+    __hash__ = None
+
+    def __getitem__(self, key):
+        """
+        Returns int for int key or memoryview for slice key of unconsumed data
+        """
+        if isinstance(key, slice):
+            return self.view()[key]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Bytebuffer index out of range")
+        return self.buf[self.start + key]
+
+    def __delitem__(self, key):
+        """
+        Consume leading slice of unconsumed data such as del buffer[:n]
+        """
+        if not isinstance(key, slice) or key.start not in (None, 0) or key.step not in (None, 1):
+            raise TypeError("Bytebuffer only supports deletion of leading slice")
+        stop = len(self) if key.stop is None else key.stop
+        if stop < 0:
+            stop += len(self)
+        self.consume(max(0, stop))
+
+    @property
+    def capacity(self):
+        """ Returns size of .buf """
+        return len(self.buf)
+
+    def view(self, start=0, stop=None):
+        """
+        Returns memoryview of unconsumed data from start to stop
+        """
+        end = self.end if stop is None else min(self.start + stop, self.end)
+        return memoryview(self.buf)[self.start + start:end]
+
+    def find(self, sub, start=0, stop=None):
+        """
+        Returns lowest index of sub in unconsumed data from start to stop or -1
+        """
+        end = self.end if stop is None else min(self.start + stop, self.end)
+        index = self.buf.find(sub, self.start + start, end)
+        return index - self.start if index >= 0 else -1
+
+    def reserve(self, size):
+        """
+        Returns writable memoryview of at least size bytes after unconsumed
+        data into which to receive. Call advance with the count received.
+        """
+        if len(self.buf) - self.end >= size:
+            return memoryview(self.buf)[self.end:]
+
+        count = self.end - self.start
+        if len(self.buf) - count >= size and self.start:  # reclaim consumed space
+            self.buf[:count] = self.buf[self.start:self.end]
+        else:  # grow into replacement so outstanding views are not resized
+            capacity = len(self.buf)
+            while capacity - count < size:
+                capacity *= 2
+            buf = bytearray(capacity)
+            buf[:count] = self.buf[self.start:self.end]
+            self.buf = buf
+        self.start = 0
+        self.end = count
+        return memoryview(self.buf)[self.end:]
+
+    def advance(self, count):
+        """
+        Append count bytes received into reserved space to unconsumed data
+        """
+        if count < 0 or self.end + count > len(self.buf):
+            raise ValueError("Invalid advance count {0}".format(count))
+        self.end += count
+
+    def extend(self, data):
+        """
+        Append copy of bytes like data to unconsumed data
+        """
+        count = len(data)
+        self.reserve(count)[:count] = data
+        self.end += count
+
+    def consume(self, count):
+        """
+        Consume up to count bytes from front of unconsumed data
+        """
+        self.start = min(self.start + count, self.end)
+        if self.start == self.end:  # empty so reuse from front
+            self.start = self.end = 0
+
+    def clear(self):
+        """
+        Consume all unconsumed data
+        """
+        self.start = self.end = 0
+
+    def tail(self, index):
+        """
+        Returns duple of (view, length) where view is memoryview of unconsumed
+        data from index to end and length is length of unconsumed data to be
+        used to update index
+        """
+        return (self.view(index), len(self))
+
+    def cat(self):
+        """
+        Returns memoryview of all unconsumed data and consumes it
+        """
+        view = self.view()
+        self.clear()
+        return view
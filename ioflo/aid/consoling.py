@@ -29,6 +29,11 @@ class Console(object):
        If the write verbosity is less than or equal the allowed verbosity level
        THEN write
 
+       The level methods .terse .concise .verbose .profuse defer formatting.
+       console.profuse("Ran {0} at {1}\n", name, stamp) only calls
+       "Ran {0} at {1}\n".format(name, stamp) when the profuse level is allowed
+       so hot paths pay no formatting cost at lower verbosity.
+
     """
     # Class attribute instance of verbosity levels
     Wordage = Verbiage(mute=0, terse=1, concise=2, verbose=3, profuse=4)
@@ -123,25 +128,37 @@ class Console(object):
             if self._flushy:
                 self.flush()
 
-    def terse(self, msg):
+    def terse(self, msg, *pa, **kwa):
         """Write at terse verbosity level
+           When pa or kwa provided Then msg is format string that is only
+           formatted with them if write is allowed at this verbosity
         """
-        self.write(msg, verbosity=self.Wordage.terse)
+        if self.Wordage.terse <= self._verbosity:
+            self.write(msg.format(*pa, **kwa) if (pa or kwa) else msg)
 
-    def concise(self, msg):
+    def concise(self, msg, *pa, **kwa):
         """Write at concise verbosity level
+           When pa or kwa provided Then msg is format string that is only
+           formatted with them if write is allowed at this verbosity
         """
-        self.write(msg, verbosity=self.Wordage.concise)
+        if self.Wordage.concise <= self._verbosity:
+            self.write(msg.format(*pa, **kwa) if (pa or kwa) else msg)
 
-    def verbose(self, msg):
+    def verbose(self, msg, *pa, **kwa):
         """Write at verbose verbosity level
+           When pa or kwa provided Then msg is format string that is only
+           formatted with them if write is allowed at this verbosity
         """
-        self.write(msg, verbosity=self.Wordage.verbose)
+        if self.Wordage.verbose <= self._verbosity:
+            self.write(msg.format(*pa, **kwa) if (pa or kwa) else msg)
 
-    def profuse(self, msg):
+    def profuse(self, msg, *pa, **kwa):
         """Write at profuse verbosity level
+           When pa or kwa provided Then msg is format string that is only
+           formatted with them if write is allowed at this verbosity
         """
-        self.write(msg, verbosity=self.Wordage.profuse)
+        if self.Wordage.profuse <= self._verbosity:
+            self.write(msg.format(*pa, **kwa) if (pa or kwa) else msg)
 
     @staticmethod
     def ocfn(filename, openMode = 'r+'):
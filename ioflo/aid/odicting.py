@@ -11,6 +11,8 @@ Based on various ordered dict implementations found in the wild
 """
 from __future__ import absolute_import, division, print_function
 
+from itertools import islice
+
 from .sixing import *
 
 
@@ -25,13 +27,11 @@ class odict(dict):
     The first key added to the dictionary is the first key in .keys()
     Changing the value of a key does not affect the order of the key
 
-    """
-    __slots__ = ['_keys']
+    Relies on the insertion ordering of the builtin dict so that set, delete
+    and contains are O(1). Only .insert and .reorder rearrange keys.
 
-    def __new__(cls, *args, **kwargs):
-        self = dict.__new__(cls,*args, **kwargs)
-        self._keys = []
-        return self
+    """
+    __slots__ = ()
 
     def __init__(self, *pa, **kwa):
         """
@@ -62,7 +62,7 @@ class odict(dict):
         for k, v in kwa:
            d[k] = v
 
-        in this case key ordering is not preserved due to limitation of python
+        in this case key ordering is preserved as keyword argument order
         """
         dict.__init__(self)
 
@@ -77,16 +77,6 @@ class odict(dict):
         for k in kwa:
             self[k] = kwa[k]
 
-    def __delitem__(self, key):
-        """ del x[y] """
-        dict.__delitem__(self, key)
-        self._keys.remove(key)
-
-    def __iter__(self):
-        """ iter(x)"""
-        for key in self._keys:
-            yield key
-
     def __repr__(self):
         """
         odict representation
@@ -94,17 +84,9 @@ class odict(dict):
         return ("{0}({1})".format(self.__class__.__name__,
                                   repr(self.items())))
 
-    def __setitem__(self, key, val):
-        """ x[key]=val"""
-        dict.__setitem__(self, key, val)
-        if not hasattr(self, '_keys'):
-            self._keys = [key]
-        if key not in self._keys:
-            self._keys.append(key)
-
     def __getnewargs__(self):
         """
-        Needed to force __new__ which creates _keys.
+        Needed to force __new__ on unpickle.
         if empty odict then __getstate__ returns empty list which is logically false so
         __setstate__ is not called.
         """
@@ -130,17 +112,11 @@ class odict(dict):
             raise KeyError('append(): key %r already in dictionary' % key)
         self[key] = item
 
-    def clear(self):
-        """ Remove all items from odict"""
-        dict.clear(self)
-        self._keys = []
-
     def copy(self):
         """
         Make a shallow copy of odict
         """
-        items = [(key, dict.__getitem__(self, key)) for key in self._keys]
-        return self.__class__(items) #creates new odict and populates with items
+        return self.__class__(list(dict.items(self))) #creates new odict and populates with items
 
     def create(self, *pa, **kwa):
         """
@@ -151,15 +127,15 @@ class odict(dict):
         for a in pa:
             if hasattr(a,'get'): #positional arg is dictionary
                 for k in a:
-                    if k not in self._keys:
+                    if k not in self:
                         self[k] = a[k]
             else: #positional arg is sequence of duples (k,v)
                 for k, v in a:
-                    if k not in self._keys:
+                    if k not in self:
                         self[k] = v
 
         for k in kwa:
-            if k not in self._keys:
+            if k not in self:
                 self[k] = kwa[k]
 
     def sift(self, fields=None):
@@ -181,14 +157,25 @@ class odict(dict):
     def insert(self, index, key, val):
         """
         Insert val at index if key not in odict
+        Moves the items at and after index so cost is O(len - index)
         """
         if key in self:
             raise KeyError('Key %r already exists.' % key)
+        size = len(self)
+        if index < 0:
+            index = max(size + index, 0)
+        tail = list(islice(dict.items(self), index, None))
+        for k, v in tail:
+            dict.__delitem__(self, k)
         dict.__setitem__(self, key, val)
-        self._keys.insert(index, key)
+        for k, v in tail:
+            dict.__setitem__(self, k, v)
 
     def items(self):
-        return [(key, dict.__getitem__(self, key)) for key in self._keys]
+        """
+        Return the list of (key, value) items of odict.
+        """
+        return list(dict.items(self))
 
     def iterkeys(self):
         """
@@ -200,46 +187,37 @@ class odict(dict):
         """
         Return an iterator over the items (key, value)  of odict.
         """
-        return ((key, dict.__getitem__(self, key)) for key in self._keys)
+        return iter(dict.items(self))
 
     def itervalues(self):
         """
         Return an iterator over the values of odict.
         """
-        return (dict.__getitem__(self, key) for key in self._keys)
+        return iter(dict.values(self))
 
     def keys(self):
         """
         Return the list of keys of odict.
         """
-        return self._keys[:]
+        return list(dict.keys(self))
 
-    def pop(self, key, *default):
-        """
-        Remove key and the associated item and return the associated value
-        If key not found return default if given otherwise raise KeyError
-        """
-        value = dict.pop(self, key, *default)
-        if key in self._keys:
-            self._keys.remove(key)
-        return value
-
-    def popitem(self):
+    def popitem(self, last=True):
         """
         Remove and return last item (key, value) duple
+        If last is False remove and return first item instead
         If odict is empty raise KeyError
         """
-        try:
-            key = self._keys[-1]
-        except IndexError:
+        if not self:
             raise KeyError('Empty odict.')
-        value = dict.__getitem__(self, key)
-        del self[key]
-        return (key, value)
+        if last:
+            return dict.popitem(self)
+        key = next(iter(self))
+        return (key, dict.pop(self, key))
 
     def reorder(self, other):
         """
         Update values in this odict based on the `other` odict.
+        Keys in other are moved to the end in the order of other.
         Raises ValueError if other is not an odict
         """
         if not isinstance(other, odict):
@@ -247,25 +225,12 @@ class odict(dict):
 
         if other is self:
             #raise ValueError('other cannot be the same odict')
-            pass #updating with self makes no changes
-
-        dict.update(self, other)
-        keys = self._keys
+            return #updating with self makes no changes
 
         for key in other:
-            if key in keys:
-                keys.remove(key)
-            keys.append(key)
-
-    def setdefault(self, key, default=None):
-        """
-        If key in odict, return value at key
-        Otherwise set value at key to default and return default
-        """
-        value = dict.setdefault(self, key, default)
-        if key not in self._keys:
-            self._keys.append(key)
-        return value
+            val = dict.__getitem__(other, key)
+            dict.pop(self, key, None)
+            dict.__setitem__(self, key, val)
 
     def update(self, *pa, **kwa):
         """
@@ -285,7 +250,10 @@ class odict(dict):
             self[k] = kwa[k]
 
     def values(self):
-        return [dict.__getitem__(self, key) for key in self._keys]
+        """
+        Return the list of values of odict.
+        """
+        return list(dict.values(self))
 
 ODict = odict  # alias
 
@@ -340,6 +308,12 @@ class lodict(odict):
         """
         return super(lodict, self).get(key.lower(), default)
 
+    def insert(self, index, key, val):
+        """
+        Make key lowercase then insert
+        """
+        super(lodict, self).insert(index, key.lower(), val)
+
     def setdefault(self, key, default=None, kind=None):
         """
         convert key to lower and then
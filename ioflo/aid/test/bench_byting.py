@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Micro benchmarks of bit field packing
+
+Compares the compiled Packifier against packify and unpackify which reparse
+the fmt string on every call. Per record calls and bulk packMany/unpackMany
+of many records into one contiguous buffer are both timed.
+
+$ python bench_byting.py [records]
+
+"""
+import sys
+import timeit
+
+from ioflo.aid.byting import packify, unpackify, compilePackifier
+
+
+FORMATS = (u'1 3 2 2', u'8 6 7 3', u'1 1 1 1 4 8 16 32')
+
+def bench(fmt, count=1000):
+    """
+    Returns list of (name, prior ns/record, compiled ns/record) for count
+    records of fmt
+    """
+    packifier = compilePackifier(fmt)
+    lengths = [int(x) for x in fmt.split()]
+    records = [tuple((i * 7919 + j) & (2**bfl - 1) for j, bfl in enumerate(lengths))
+               for i in range(count)]
+    packeds = [packify(fmt=fmt, fields=record) for record in records]
+    raw = packifier.packMany(records)
+    size = packifier.size
+
+    def priorPack():
+        for record in records:
+            packify(fmt=fmt, fields=record)
+    def compiledPack():
+        for record in records:
+            packifier.pack(record)
+    def priorUnpack():
+        for packed in packeds:
+            unpackify(fmt=fmt, b=packed, boolean=True)
+    def compiledUnpack():
+        for packed in packeds:
+            packifier.unpack(packed, boolean=True)
+    def priorPackMany():
+        b = bytearray()
+        for record in records:
+            b.extend(packify(fmt=fmt, fields=record))
+    def compiledPackMany():
+        packifier.packMany(records)
+    def priorUnpackMany():
+        for i in range(0, len(raw), size):
+            unpackify(fmt=fmt, b=raw[i:i + size], boolean=True)
+    def compiledUnpackMany():
+        packifier.unpackMany(raw, boolean=True)
+
+    results = []
+    for name, prior, compiled in (("pack", priorPack, compiledPack),
+                                  ("unpack", priorUnpack, compiledUnpack),
+                                  ("pack many", priorPackMany, compiledPackMany),
+                                  ("unpack many", priorUnpackMany, compiledUnpackMany)):
+        old = min(timeit.repeat(prior, number=1, repeat=3))
+        new = min(timeit.repeat(compiled, number=1, repeat=3))
+        results.append((name, 1e9 * old / count, 1e9 * new / count))
+    return results
+
+
+def main(count=1000):
+    """ Print benchmark table """
+    print("{0:<22} {1:<12} {2:>14} {3:>14} {4:>8}".format(
+            "fmt", "operation", "prior ns/rec", "compiled ns/rec", "speedup"))
+    for fmt in FORMATS:
+        for name, old, new in bench(fmt, count=count):
+            print("{0:<22} {1:<12} {2:>14.1f} {3:>14.1f} {4:>7.1f}x".format(
+                    fmt, name, old, new, old / new))
+
+
+if __name__ == '__main__':
+    main(count=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
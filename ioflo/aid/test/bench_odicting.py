@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Micro benchmarks of odict
+
+Compares the builtin dict ordered odict against the prior implementation that
+kept key order in a separate ._keys list.
+
+$ python bench_odicting.py [ops]
+
+"""
+import sys
+import timeit
+
+from ioflo.aid.odicting import odict
+
+
+class listodict(dict):
+    """
+    Prior odict implementation with key order held in list ._keys
+    Only the methods exercised by the benchmarks are kept.
+    """
+    __slots__ = ['_keys']
+
+    def __new__(cls, *args, **kwargs):
+        self = dict.__new__(cls,*args, **kwargs)
+        self._keys = []
+        return self
+
+    def __init__(self, items=None):
+        dict.__init__(self)
+        if items:
+            dict.update(self, items)
+            self._keys = [k for k, v in items]
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._keys.remove(key)
+
+    def __iter__(self):
+        for key in self._keys:
+            yield key
+
+    def __setitem__(self, key, val):
+        dict.__setitem__(self, key, val)
+        if key not in self._keys:
+            self._keys.append(key)
+
+    def insert(self, index, key, val):
+        if key in self:
+            raise KeyError('Key %r already exists.' % key)
+        dict.__setitem__(self, key, val)
+        self._keys.insert(index, key)
+
+
+SIZES = (10, 1000, 100000)
+
+def bench(cls, size, ops=1000):
+    """
+    Returns dict of per operation nanoseconds keyed by operation name for
+    an instance of cls with size keys
+    """
+    items = [("k{0}".format(i), i) for i in range(size)]
+    d = cls(items)
+    news = ["n{0}".format(i) for i in range(ops)]
+    olds = [items[(i * 7919) % size][0] for i in range(ops)]
+    results = {}
+
+    def setnew():
+        for key in news:
+            d[key] = 0
+    def delete():
+        for key in news:
+            del d[key]
+    def setold():
+        for key in olds:
+            d[key] = 1
+    def contains():
+        for key in olds:
+            key in d
+    def iterate():
+        for key in d:
+            pass
+    def insert():
+        for key in news[:10]:
+            d.insert(size // 2, key, 0)
+        for key in news[:10]:
+            del d[key]
+
+    for name, func, count in (("set new", setnew, ops),
+                              ("delete", delete, ops),
+                              ("set existing", setold, ops),
+                              ("contains", contains, ops),
+                              ("iterate", iterate, size),
+                              ("insert+delete", insert, 10)):
+        if name == "delete":  # needs keys from set new
+            setnew()
+            seconds = timeit.timeit(func, number=1)
+        elif name == "set new":
+            seconds = timeit.timeit(func, number=1)
+            delete()
+        else:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+        results[name] = 1e9 * seconds / count
+    return results
+
+
+def main(ops=1000):
+    """ Print benchmark table """
+    print("{0:<14} {1:>8} {2:>14} {3:>14} {4:>8}".format(
+            "operation", "keys", "list ns/op", "dict ns/op", "speedup"))
+    for size in SIZES:
+        old = bench(listodict, size, ops=ops)
+        new = bench(odict, size, ops=ops)
+        for name in old:
+            print("{0:<14} {1:>8d} {2:>14.1f} {3:>14.1f} {4:>7.1f}x".format(
+                    name, size, old[name], new[name], old[name] / new[name]))
+
+
+if __name__ == '__main__':
+    main(ops=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -392,6 +392,66 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(size, 3)
         self.assertEqual(b, bytearray([0x41, 0xe0, 0xa5]))
 
+    def testPackifier(self):
+        """
+        Test compiled Packifier matches packify, packifyInto and unpackify
+        """
+        console.terse("{0}\n".format(self.testPackifier.__doc__))
+        cases = [(u'1 3 2 2', (True, 4, 0, 3), None),
+                 (u'8 6 7 3', (0xA5, 0x38, 0x08, 0x01), None),
+                 (u'4 3 1', (0x0f, 0x07, 0x01), 2),
+                 (u'1 1 5', (1, 0, 0x1f), None),
+                 (u'16 16', (0x1234, 0xfedc), None),
+                 (u'', (), None)]
+
+        for fmt, fields, size in cases:
+            for reverse in (False, True):
+                packifier = byting.Packifier(fmt=fmt, size=size, reverse=reverse)
+                packed = byting.packify(fmt=fmt, fields=fields, size=size,
+                                        reverse=reverse)
+                self.assertEqual(packifier.size, len(packed))
+                self.assertEqual(packifier.pack(fields), packed)
+                b = bytearray([0xff])
+                self.assertEqual(packifier.packInto(b, fields, offset=1), len(packed))
+                self.assertEqual(b, bytearray([0xff]) + packed)
+                for boolean in (False, True):
+                    self.assertEqual(packifier.unpack(packed, boolean=boolean),
+                                     byting.unpackify(fmt=fmt, b=packed,
+                                                      boolean=boolean,
+                                                      size=size,
+                                                      reverse=reverse))
+                self.assertEqual(packifier.unpack(memoryview(b), offset=1),
+                                 packifier.unpack(packed))
+
+        packifier = byting.compilePackifier(u'1 3 2 2')
+        self.assertIs(byting.compilePackifier(u'1 3 2 2'), packifier)
+        self.assertIsNot(byting.compilePackifier(u'1 3 2 2', reverse=True), packifier)
+        self.assertEqual(packifier.pack((True, 4, 0, 3)), bytearray([0xc3]))
+        self.assertEqual(packifier.unpack(bytearray([0xc3]), boolean=True),
+                         (True, 4, 0, 3))
+
+        with self.assertRaises(IndexError):
+            packifier.pack((True, 4))
+        with self.assertRaises(ValueError):
+            packifier.unpack(bytearray())
+        with self.assertRaises(ValueError):
+            byting.Packifier(fmt=u'8 8', size=1)
+
+        packifier = byting.compilePackifier(u'8 6 7 3')
+        records = [(i, i % 64, i % 128, i % 8) for i in range(256)]
+        b = packifier.packMany(records)
+        self.assertEqual(len(b), 3 * len(records))
+        self.assertEqual(b[:6], packifier.pack(records[0]) + packifier.pack(records[1]))
+        self.assertEqual(packifier.unpackMany(b), records)
+        self.assertEqual(packifier.unpackMany(b, offset=3, count=2), records[1:3])
+        with self.assertRaises(ValueError):
+            packifier.unpackMany(b, offset=3, count=256)
+
+        b = bytearray([0xaa])
+        self.assertIs(packifier.packMany(records[:2], b=b, offset=1), b)
+        self.assertEqual(len(b), 7)
+        self.assertEqual(packifier.unpackMany(b[:-1], offset=1), records[:1])
+
     def testSignExtend(self):
         """
         Test the signExtend function
@@ -437,6 +497,61 @@ class BasicTestCase(unittest.TestCase):
         z = byting.signExtend(x, n=5)
         self.assertEqual(z, 0)
 
+    def testBytebuffer(self):
+        """
+        Test the Bytebuffer class
+        """
+        console.terse("{0}\n".format(self.testBytebuffer.__doc__))
+        buf = byting.Bytebuffer(size=8)
+        self.assertEqual(len(buf), 0)
+        self.assertFalse(buf)
+        self.assertEqual(buf.capacity, 8)
+
+        view = buf.reserve(4)
+        self.assertEqual(len(view), 8)
+        view[:5] = b"hello"
+        buf.advance(5)
+        self.assertEqual(bytes(buf), b"hello")
+        self.assertEqual(buf, b"hello")
+        self.assertEqual(buf[0], ord(b"h"))
+        self.assertEqual(buf[-1], ord(b"o"))
+        self.assertIsInstance(buf[1:3], memoryview)
+        self.assertEqual(buf[1:3], b"el")
+        self.assertEqual(buf.find(b"l"), 2)
+        self.assertEqual(buf.find(b"l", 3), 3)
+        self.assertEqual(buf.find(b"x"), -1)
+        with self.assertRaises(ValueError):
+            buf.advance(4)
+
+        del buf[:2]  # consume
+        self.assertEqual(buf, b"llo")
+        self.assertEqual(buf.start, 2)
+        tail, length = buf.tail(1)
+        self.assertEqual(tail, b"lo")
+        self.assertEqual(length, 3)
+
+        buf.reserve(5)  # compacts in place
+        self.assertEqual(buf.capacity, 8)
+        self.assertEqual(buf.start, 0)
+        self.assertEqual(buf, b"llo")
+
+        old = buf.view()
+        buf.extend(b" world")  # grows
+        self.assertEqual(buf.capacity, 16)
+        self.assertEqual(buf, b"llo world")
+        self.assertEqual(old, b"llo")  # outstanding view unaffected
+
+        view = buf.cat()
+        self.assertEqual(view, b"llo world")
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(buf.end, 0)
+
+        buf.extend(b"abc")
+        buf.consume(3)
+        self.assertEqual(buf.start, 0)  # reset when empty
+        with self.assertRaises(TypeError):
+            del buf[1:]
+
 
 
 def runOne(test):
@@ -455,7 +570,9 @@ def runSome():
              'testBytifyUnbytify',
              'testPackifyUnpackify',
              'testPackifyInto',
+             'testPackifier',
              'testSignExtend',
+             'testBytebuffer',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
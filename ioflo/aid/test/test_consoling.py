@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Test Template
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+import unittest
+
+import os
+import io
+
+from ioflo.aid.sixing import *
+from ioflo.aid import consoling
+from ioflo.aid.consoling import getConsole
+
+console = getConsole()
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class Formatee(object):
+    """
+    Counts how many times it is formatted
+    """
+    def __init__(self):
+        self.count = 0
+
+    def __format__(self, spec):
+        self.count += 1
+        return "formatee"
+
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Example TestCase
+    """
+
+    def setUp(self):
+        """
+        Use private console writing into string buffer
+        """
+        self.console = consoling.Console(name="tester",
+                                         verbosity=consoling.Console.Wordage.terse)
+        self.console._file = io.StringIO()
+
+    def tearDown(self):
+        self.console._file = None
+
+    def testDeferredFormat(self):
+        """
+        Test level methods only format when verbosity allows
+        """
+        console.terse("{0}\n".format(self.testDeferredFormat.__doc__))
+        formatee = Formatee()
+
+        self.console.profuse("Profuse {0} {1}\n", formatee, 1)
+        self.console.verbose("Verbose {0} {name}\n", formatee, name="x")
+        self.console.concise("Concise {0}\n", formatee)
+        self.assertEqual(formatee.count, 0)
+        self.assertEqual(self.console._file.getvalue(), "")
+
+        self.console.terse("Terse {0} {name}\n", formatee, name="x")
+        self.assertEqual(formatee.count, 1)
+        self.assertEqual(self.console._file.getvalue(), "Terse formatee x\n")
+
+        self.console.reinit(verbosity=consoling.Console.Wordage.profuse)
+        self.console.profuse("Profuse {0:0.2f}\n", 1.0)
+        self.assertEqual(self.console._file.getvalue(),
+                         "Terse formatee x\nProfuse 1.00\n")
+
+    def testUnformatted(self):
+        """
+        Test level methods without format args write msg unchanged
+        """
+        console.terse("{0}\n".format(self.testUnformatted.__doc__))
+        self.console.terse("Braces {0} {} kept\n")
+        self.assertEqual(self.console._file.getvalue(), "Braces {0} {} kept\n")
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testDeferredFormat',
+             'testUnformatted',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testBasic')
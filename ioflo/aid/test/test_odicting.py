@@ -70,6 +70,43 @@ class BasicTestCase(unittest.TestCase):
         stuff = od.sift()
         self.assertEqual(stuff.items(), od.items())
 
+    def testODictOrdering(self):
+        """
+        Test odict insert reorder pop and pickle keep key order
+        """
+        console.terse("{0}\n".format(self.testODictOrdering.__doc__))
+        import pickle
+
+        od = odicting.odict([("x", 1), ("y", 2), ("a", 3)])
+        od.insert(1, "b", 4)
+        self.assertEqual(od.keys(), ["x", "b", "y", "a"])
+        with self.assertRaises(KeyError):
+            od.insert(0, "a", 5)
+
+        del od["b"]
+        self.assertEqual(od.keys(), ["x", "y", "a"])
+        self.assertNotIn("b", od)
+        od["b"] = 5
+        od["x"] = 6  # update does not change order
+        self.assertEqual(od.items(), [("x", 6), ("y", 2), ("a", 3), ("b", 5)])
+
+        od.reorder(odicting.odict([("y", 7), ("c", 8)]))
+        self.assertEqual(od.items(), [("x", 6), ("a", 3), ("b", 5), ("y", 7), ("c", 8)])
+        od.reorder(od)
+        self.assertEqual(od.keys(), ["x", "a", "b", "y", "c"])
+
+        self.assertEqual(od.popitem(), ("c", 8))
+        self.assertEqual(od.popitem(last=False), ("x", 6))
+        self.assertEqual(od.pop("a"), 3)
+        self.assertEqual(od.keys(), ["b", "y"])
+
+        od = odicting.odict([("z", 1), ("a", 2), ("r", 3)])
+        pod = pickle.loads(pickle.dumps(od, 2))
+        self.assertIsInstance(pod, odicting.odict)
+        self.assertEqual(pod.items(), od.items())
+        pod = pickle.loads(pickle.dumps(odicting.odict(), 2))
+        self.assertEqual(pod.items(), [])
+
     def testLoDict(self):
         """
         Test the lodict
@@ -127,6 +164,7 @@ def runSome():
     tests =  []
     names = [
                 'testODict',
+                'testODictOrdering',
                 'testLoDict',
                 'testMoDict',
             ]
@@ -1,5 +1,5 @@
 """
 http package
 """
-from .clienting import Patron
+from .clienting import Patron, PatronPool
 from .serving import Valet
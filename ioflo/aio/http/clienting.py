@@ -533,48 +533,41 @@ class Respondent(httping.Parsent):
         if self.length and self.length < 0:
             raise ValueError("Invalid content length of {0}".format(self.length))
 
-        del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        if self.evented:  # event source parses .body in place
+            del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        else:  # fresh body so body of prior response is not clobbered
+            self.body = bytearray()
 
         if self.chunked:  # content-length is ignored if chunked
             self.parms = odict()
+            dechunker = httping.Dechunker(raw=self.msg,
+                                          body=self.body,
+                                          streamer=self.streamer,
+                                          parms=self.parms)
             while True:  # parse all chunks here
-                chunkParser = httping.parseChunk(raw=self.msg)
-                while True:  # parse another chunk
-                    if self.closed and not self.msg:  # connection closed prematurely
-                        raise httping.PrematureClosure("Connection closed "
-                                "unexpectedly while parsing response body chunk")
-                    result = next(chunkParser)
-                    if result is not None:
-                        chunkParser.close()
-                        break
-                    (yield None)
-
-                size, parms, trails, chunk = result
-
-                if parms:  # chunk extension parms
-                    self.parms.update(parms)
-
-                if size:  # size non zero so append chunk but keep iterating
-                    self.body.extend(chunk)
-                    if self.evented:
-                        self.eventSource.parse()  # parse events here
-                        if (self.eventSource.retry is not None and
-                                self.retry != self.eventSource.retry):
-                            self.retry = self.eventSource.retry
-                        if (self.eventSource.leid is not None and
-                                self.leid != self.eventSource.leid):
-                            self.leid = self.eventSource.leid
-
-                    if self.closed and not self.msg:  # no more data so finish
-                        chunkParser.close()
-                        break
-
-                else:  # last chunk when empty chunk so done
-                    if trails:
-                        self.trails = trails
-                    chunkParser.close()
+                done = dechunker.parse()
+                if self.evented and self.body:
+                    self.eventSource.parse()  # parse events here
+                    if (self.eventSource.retry is not None and
+                            self.retry != self.eventSource.retry):
+                        self.retry = self.eventSource.retry
+                    if (self.eventSource.leid is not None and
+                            self.leid != self.eventSource.leid):
+                        self.leid = self.eventSource.leid
+
+                if done:  # last chunk when empty chunk so done
                     break
 
+                if self.closed and not self.msg:
+                    if dechunker.count and dechunker.size is None:
+                        break  # no more data after whole chunk so finish
+                    raise httping.PrematureClosure("Connection closed "
+                            "unexpectedly while parsing response body chunk")
+                (yield None)
+
+            if dechunker.trails:
+                self.trails = dechunker.trails
+
         elif self.length != None:  # known content length
             while len(self.msg) < self.length:
                 if self.closed and not self.msg:  # connection closed prematurely
@@ -617,6 +610,9 @@ class Patron(object):
     """
     Patron class nonblocking HTTP client connection manager
     """
+    Depth = 8  # default max pipelined requests in flight
+    Idempotents = (u'GET', u'HEAD', u'PUT', u'DELETE', u'OPTIONS', u'TRACE')
+
     def __init__(self,
                  store=None,
                  connector=None,
@@ -644,6 +640,8 @@ class Patron(object):
                  redirectable=True,
                  redirects=None,
                  responses=None,
+                 pipelined=False,
+                 depth=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -685,7 +683,9 @@ class Patron(object):
                 each redirect is dict
             responses is deque of responses if any processed by respondent
                  each response is dict
-
+            pipelined is Boolean True means send requests without waiting for
+                the responses to earlier requests on the connection
+            depth is max number of pipelined requests in flight
 
         """
         # .requests is deque of dicts of request data
@@ -698,6 +698,10 @@ class Patron(object):
         self.events = events if events is not None else deque()
         self.waited = False  # Boolean True If sent request but waiting for response
         self.latest = None  # latest request odict from .requests in process if any
+        self.pipelined = True if pipelined else False
+        self.depth = max(1, depth if depth is not None else self.Depth)
+        # .pendings is deque of request odicts sent in order awaiting response
+        self.pendings = deque()
         self.store = store or storing.Store(stamp=0.0)
 
         # see if path also includes scheme, netloc, host, port, query, fragment
@@ -828,6 +832,14 @@ class Patron(object):
         """
         self.connector.close()
 
+    @property
+    def load(self):
+        """
+        Returns number of requests queued or awaiting response
+        """
+        return len(self.requests) + (len(self.pendings) if self.pipelined
+                                     else int(self.waited))
+
     @staticmethod
     def attrify(response):
         """
@@ -943,10 +955,32 @@ class Patron(object):
 
         self.connector.tx(request)
 
-        if method is not None:
-            self.respondent.reinit(method=self.requester.method)
-        else:
-            self.respondent.reinit()  # reset code status reason
+        if not self.pendings:  # respondent not parsing earlier pipelined response
+            if method is not None:
+                self.respondent.reinit(method=self.requester.method)
+            else:
+                self.respondent.reinit()  # reset code status reason
+
+    def snapshot(self, request=None):
+        """
+        Returns copy of request odict if any updated with current .requester
+        values so response may be associated with its request
+        """
+        request = copy.copy(request) if request else odict()
+        request.update([
+                        ('host', self.requester.hostname),
+                        ('port', self.requester.port),
+                        ('scheme', self.requester.scheme),
+                        ('method', self.requester.method),
+                        ('path', self.requester.path),
+                        ('fragment', self.requester.fragment),
+                        ('qargs', copy.copy(self.requester.qargs)),
+                        ('headers', copy.copy(self.requester.headers)),
+                        ('body', self.requester.body),
+                        ('data', self.requester.data),
+                        ('fargs', copy.copy(self.requester.fargs)),
+                       ])
+        return request
 
     def redirect(self):
         """
@@ -1024,7 +1058,20 @@ class Patron(object):
     def serviceRequests(self):
         """
         Service requests deque
+        When .pipelined send up to .depth requests without waiting but not
+        after a non idempotent request or while its response is evented
         """
+        if self.pipelined:
+            while (self.requests and len(self.pendings) < self.depth and
+                    (not self.pendings or
+                     (self.pendings[-1]['method'] in self.Idempotents and
+                      not self.respondent.evented))):
+                request = self.requests.popleft()
+                self.waited = True
+                self.transmit(**request)  # expand items in request
+                self.pendings.append(self.snapshot(request))
+            return
+
         if not self.waited:
             if self.requests:
                 self.latest = request = self.requests.popleft()
@@ -1043,9 +1090,10 @@ class Patron(object):
     def serviceResponse(self):
         """
         Service Rx on connection and parse
+        When .pipelined parse all the responses received in request order
         """
         self.connector.serviceReceives()
-        if self.waited:
+        while self.waited:
             try:
                 self.respondent.parse()
             except httping.HTTPException as ex:
@@ -1053,60 +1101,50 @@ class Patron(object):
                 self.respondent.error = str(ex)
                 self.respondent.ended = True
 
-            if self.respondent.ended:
-                self.respondent.dictify()
-
-                if not self.respondent.evented:
-                    if self.latest:  # use saved request attribute
-                        request = copy.copy(self.latest)
-                        request.update([
-                                        ('host', self.requester.hostname),
-                                        ('port', self.requester.port),
-                                        ('scheme', self.requester.scheme),
-                                        ('method', self.requester.method),
-                                        ('path', self.requester.path),
-                                        ('fragment', self.requester.fragment),
-                                        ('qargs', copy.copy(self.requester.qargs)),
-                                        ('headers', copy.copy(self.requester.headers)),
-                                        ('body', self.requester.body),
-                                        ('data', self.requester.data),
-                                        ('fargs', copy.copy(self.requester.fargs)),
-                                       ])
-                        self.latest = None
-                    else:
-                        request = odict([
-                                         ('host', self.requester.hostname),
-                                         ('port', self.requester.port),
-                                         ('scheme', self.requester.scheme),
-                                         ('method', self.requester.method),
-                                         ('path', self.requester.path),
-                                         ('fragment', self.requester.fragment),
-                                         ('qargs', copy.copy(self.requester.qargs)),
-                                         ('headers', copy.copy(self.requester.headers)),
-                                         ('body', self.requester.body),
-                                         ('data', self.requester.data),
-                                         ('fargs', copy.copy(self.requester.fargs)),
-                                        ])
-                    response = odict([('version', self.respondent.version),
-                                      ('status', self.respondent.status),
-                                      ('reason', self.respondent.reason),
-                                      ('headers', copy.copy(self.respondent.headers)),
-                                      ('body', self.respondent.body),
-                                      ('data', self.respondent.data),
-                                      ('request', request),
-                                      ('errored', self.respondent.errored),
-                                      ('error', self.respondent.error),
-                                     ])
-                    if self.respondent.redirectable and self.respondent.redirectant:
-                        self.redirects.append(copy.copy(response))
-                        self.redirect()
-                    else:
-                        if self.redirects:
-                            response['redirects'] = copy.copy(self.redirects)
-                        self.redirects = []
-                        self.responses.append(response)
-                        self.waited = False
-                self.respondent.makeParser()  #set up for next time
+            if not self.respondent.ended:
+                break
+
+            self.respondent.dictify()
+
+            if not self.respondent.evented:
+                if self.pipelined:
+                    request = self.pendings.popleft()
+                else:
+                    request = self.snapshot(self.latest)  # use saved request attribute
+                    self.latest = None
+                response = odict([('version', self.respondent.version),
+                                  ('status', self.respondent.status),
+                                  ('reason', self.respondent.reason),
+                                  ('headers', copy.copy(self.respondent.headers)),
+                                  ('body', self.respondent.body),
+                                  ('data', self.respondent.data),
+                                  ('request', request),
+                                  ('errored', self.respondent.errored),
+                                  ('error', self.respondent.error),
+                                 ])
+                # redirect not followed ahead of pipelined requests in flight
+                if (self.respondent.redirectable and self.respondent.redirectant
+                        and not self.pendings):
+                    self.redirects.append(copy.copy(response))
+                    self.redirect()
+                    if self.pipelined:
+                        self.pendings.append(self.snapshot(request))
+                else:
+                    if self.redirects:
+                        response['redirects'] = copy.copy(self.redirects)
+                    self.redirects = []
+                    self.responses.append(response)
+                    if self.pendings:
+                        if self.respondent.persisted:
+                            self.respondent.reinit(method=self.pendings[0]['method'])
+                        else:  # server closes connection so requeue unanswered
+                            self.requests.extendleft(reversed(self.pendings))
+                            self.pendings.clear()
+                    self.waited = True if self.pendings else False
+            self.respondent.makeParser()  #set up for next time
+
+            if not self.pipelined:
+                break
 
     def serviceAll(self):
         """
@@ -1184,3 +1222,209 @@ class Patron(object):
                 raise ex
             yield b''  # this is eventually yielded by wsgi app while waiting
         return self.respond()
+
+
+class PatronPool(object):
+    """
+    PatronPool class nonblocking pool of keep alive Patron connections
+    keyed by (host, port, scheme). Queued requests are dispatched in order
+    to the idle or else least loaded patron of their key.
+    """
+    Size = 4  # default max patrons per (host, port, scheme)
+
+    def __init__(self,
+                 store=None,
+                 size=None,
+                 pipelined=True,
+                 depth=None,
+                 bufsize=8096,
+                 wlog=None,
+                 requests=None,
+                 responses=None,
+                 **kwa):
+        """
+        Initialization method for instance.
+        Parameters:
+            store is reference to data store instance
+            size is max number of patrons per (host, port, scheme)
+            pipelined is Boolean True means patrons pipeline requests
+            depth is max number of requests in flight per patron when pipelined
+            bufsize is buffer size for patron connectors
+            wlog is opened WireLog instance if any for patron connectors
+            requests is deque of requests if any to be dispatched
+                each request is dict with host port scheme items
+            responses is deque of responses if any from all patrons
+                each response is dict
+            kwa are passed as other init parameters to patrons
+
+        .stats is odict of pool statistics
+            queued = number of requests waiting for dispatch to a patron
+            inflight = number of requests dispatched awaiting response
+            peak = maximum of queued plus inflight
+            count = number of responses
+            total = cumulative latency seconds from dispatch to response
+            max = maximum latency seconds
+            last = latency seconds of latest response
+        """
+        self.store = store or storing.Store(stamp=0.0)
+        self.size = max(1, size if size is not None else self.Size)
+        self.pipelined = True if pipelined else False
+        self.depth = depth
+        self.bufsize = bufsize
+        self.wlog = wlog
+        self.kwa = kwa
+        self.requests = requests if requests is not None else deque()
+        self.responses = responses if responses is not None else deque()
+        self.patrons = odict()  # lists of patrons keyed by (host, port, scheme)
+        self.starts = dict()  # deques of dispatch times keyed by patron
+        self.stats = odict([('queued', 0),
+                            ('inflight', 0),
+                            ('peak', 0),
+                            ('count', 0),
+                            ('total', 0.0),
+                            ('max', 0.0),
+                            ('last', 0.0)])
+
+    def close(self):
+        """
+        Close all patrons
+        """
+        for patrons in self.patrons.values():
+            for patron in patrons:
+                patron.close()
+
+    def respond(self):
+        """
+        Pops and returns next response from .responses if any
+        Otherwise returns None
+        """
+        if self.responses:
+            return Patron.attrify(self.responses.popleft())
+        return None
+
+    def request(self,
+                method=u'GET',
+                path=u'/',
+                qargs=None,
+                fragment=u'',
+                headers=None,
+                body=b'',
+                data=None,
+                fargs=None,
+                hostname=u'127.0.0.1',
+                port=None,
+                scheme=u'',
+                **kwa):
+        """
+        Create and append request odict onto .requests
+        path may include scheme and netloc which takes priority over
+        hostname port scheme
+        """
+        splits = urlsplit(path)
+        scheme = (splits.scheme or scheme).lower()
+        scheme = u'https' if scheme == u'https' else u'http'
+        defaultPort = 443 if scheme == u'https' else 80
+        hostname, port = httping.normalizeHostPort(host=splits.hostname or hostname,
+                                                   port=splits.port or port,
+                                                   defaultPort=defaultPort)
+        qargs = qargs or odict()
+        qargs, query = httping.updateQargsQuery(qargs, splits.query)
+
+        if isinstance(body, str):
+            # RFC 2616 Section 3.7.1 default charset of iso-8859-1.
+            body = body.encode('iso-8859-1')
+
+        request = odict([('host', hostname),
+                         ('port', port),
+                         ('scheme', scheme),
+                         ('method', method.upper()),
+                         ('path', splits.path or u'/'),
+                         ('qargs', qargs),
+                         ('fragment', splits.fragment or fragment),
+                         ('headers', lodict(headers) if headers is not None else lodict()),
+                         ('body', body if body is not None else b''),
+                         ('data', data),
+                         ('fargs', fargs),
+                        ])
+        for k, v in kwa.items():  # extra stuff not sent
+            if v is not None:
+                request[k] = v
+        self.requests.append(request)
+
+    def add(self, key):
+        """
+        Create, open, and return new patron for key (host, port, scheme)
+        """
+        hostname, port, scheme = key
+        patron = Patron(store=self.store,
+                        name="{0}:{1}#{2}".format(hostname, port,
+                                                  len(self.patrons[key])),
+                        bufsize=self.bufsize,
+                        wlog=self.wlog,
+                        hostname=hostname,
+                        port=port,
+                        scheme=scheme,
+                        pipelined=self.pipelined,
+                        depth=self.depth,
+                        **self.kwa)
+        patron.open()
+        self.patrons[key].append(patron)
+        self.starts[patron] = deque()
+        return patron
+
+    def dispatch(self):
+        """
+        Dispatch queued requests in order to the idle or else least loaded
+        patron of their key adding patrons up to .size per key.
+        Requests of a key whose patrons are all full keep waiting in order.
+        """
+        waits = deque()
+        fulls = set()  # keys whose patrons are all full
+        while self.requests:
+            request = self.requests.popleft()
+            key = (request.get('host', u'127.0.0.1'),
+                   request.get('port', 80),
+                   request.get('scheme', u'http'))
+            if key in fulls:
+                waits.append(request)
+                continue
+
+            patrons = self.patrons.setdefault(key, [])
+            patron = min(patrons, key=lambda patron: patron.load) if patrons else None
+            if patron is None or (patron.load and len(patrons) < self.size):
+                patron = self.add(key)
+            elif patron.load >= (patron.depth if patron.pipelined else 1):
+                fulls.add(key)
+                waits.append(request)
+                continue
+
+            patron.requests.append(request)
+            self.starts[patron].append(time.perf_counter())
+        self.requests.extend(waits)
+
+    def serviceAll(self):
+        """
+        Dispatch requests, service all patrons, collect their responses
+        and update .stats
+        """
+        self.dispatch()
+        stats = self.stats
+        inflight = 0
+        for patrons in self.patrons.values():
+            for patron in patrons:
+                patron.serviceAll()
+                starts = self.starts[patron]
+                while patron.responses:
+                    self.responses.append(patron.responses.popleft())
+                    if starts:
+                        latency = time.perf_counter() - starts.popleft()
+                        stats['count'] += 1
+                        stats['total'] += latency
+                        stats['last'] = latency
+                        if latency > stats['max']:
+                            stats['max'] = latency
+                inflight += patron.load
+        stats['queued'] = len(self.requests)
+        stats['inflight'] = inflight
+        if stats['queued'] + inflight > stats['peak']:
+            stats['peak'] = stats['queued'] + inflight
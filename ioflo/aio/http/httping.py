@@ -8,6 +8,8 @@ from __future__ import absolute_import, division, print_function
 
 import sys
 import os
+import time
+import datetime
 from collections import deque
 import codecs
 import json
@@ -33,6 +35,11 @@ LF = b"\n"
 CR = b"\r"
 MAX_LINE_SIZE = 65536
 MAX_HEADERS = 100
+MAX_PACKED = 1024  # max entries in caches of packed status lines and header names
+# lower case names of headers whose whole lines are cached since their values
+# are static and repeat from message to message. Others cache only the name
+STATIC_HEADERS = frozenset(['server', 'content-type', 'transfer-encoding',
+                            'connection', 'accept-encoding', 'cache-control'])
 
 HTTP_PORT = 80
 HTTPS_PORT = 443
@@ -296,6 +303,19 @@ def httpDate1123(dt):
     return "%s, %02d %s %04d %02d:%02d:%02d GMT" % (weekday, dt.day, month,
         dt.year, dt.hour, dt.minute, dt.second)
 
+_dateStamp = [None, u'']  # (epoch second, RFC 1123 date string) of latest
+
+def httpDateNow():
+    """
+    Return RFC 1123 date string of current UTC time
+    Formatted at most once per second and otherwise reused
+    """
+    now = int(time.time())
+    if now != _dateStamp[0]:
+        dt = datetime.datetime.fromtimestamp(now, datetime.timezone.utc)
+        _dateStamp[:] = [now, httpDate1123(dt)]
+    return _dateStamp[1]
+
 def normalizeHostPort(host, port=None, defaultPort=80):
     """
     Given hostname host which could also be netloc which includes port
@@ -411,23 +431,80 @@ def unquoteQuery(query):
     return query
 
 
+_packedStatuses = {}  # packed status lines keyed by (version, status)
+
+def packStatusLine(status, version=HTTP_11_VERSION_STRING):
+    """
+    Format and return a response status line.
+    status is int code or string with code and reason
+
+    For example: h.packStatusLine(200) == b'HTTP/1.1 200 OK'
+    """
+    key = (version, status)
+    line = _packedStatuses.get(key)
+    if line is None:
+        if isinstance(status, int):
+            status = "{0} {1}".format(status, STATUS_DESCRIPTIONS[status])
+        line = "{0} {1}".format(version, status)
+        try:
+            line = line.encode('ascii')
+        except UnicodeEncodeError:
+            line = line.encode('idna')
+        if len(_packedStatuses) >= MAX_PACKED:
+            _packedStatuses.clear()
+        _packedStatuses[key] = line
+    return line
+
+_packedNames = {}  # packed title case header names with separator keyed by name
+_packedStatics = {}  # packed lines of STATIC_HEADERS keyed by (name, value)
+
 def packHeader(name, *values):
     """
     Format and return a header line.
+    Encoded title case names are cached. Whole lines are cached only for
+    single valued STATIC_HEADERS such as Server and Content-Type so per
+    message values such as Content-Length, Set-Cookie, or Authorization
+    are never retained.
 
     For example: h.packHeader('Accept', 'text/html')
     """
-    if isinstance(name, str):  # not bytes
-        name = name.encode('ascii')
-    name = name.title()  # make title case
+    if len(values) == 1 and isinstance(name, str) and name.lower() in STATIC_HEADERS:
+        key = (name, values[0])
+        line = _packedStatics.get(key)
+        if line is None:
+            line = _packHeader(name, *values)
+            if len(_packedStatics) >= MAX_PACKED:
+                _packedStatics.clear()
+            _packedStatics[key] = line
+        return line
+    return _packHeader(name, *values)
+
+def packHeaderName(name):
+    """
+    Returns cached encoded title case header name with separator
+    For example: h.packHeaderName('content-length') == b'Content-Length: '
+    """
+    packed = _packedNames.get(name)
+    if packed is None:
+        packed = name.encode('ascii') if isinstance(name, str) else bytes(name)
+        packed = packed.title() + b': '
+        if len(_packedNames) >= MAX_PACKED:
+            _packedNames.clear()
+        _packedNames[name] = packed
+    return packed
+
+def _packHeader(name, *values):
+    """
+    Format and return a header line without caching the line
+    """
+    name = packHeaderName(name)
     values = list(values)  # make copy
     for i, value in enumerate(values):
         if isinstance(value, str):
             values[i] = value.encode('iso-8859-1')
         elif isinstance(value, int):
             values[i] = str(value).encode('ascii')
-    value = b', '.join(values)
-    return (name + b': ' + value)
+    return (name + b', '.join(values))
 
 def packChunk(msg):
     """
@@ -452,10 +529,15 @@ def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
     Consumes parsed portions of raw bytearray
 
     Raise error if eol not found before MAX_LINE_SIZE
+
+    Remembers scan offset across yields so each resume only searches the
+    bytes appended since the last search
     """
+    size = max(map(len, eols)) - 1  # overlap of eol with previous scan
+    scan = 0  # offset in raw before which no eol found
     while True:
         for eol in eols:  # loop over eols unless found
-            index = raw.find(eol)  # not found index == -1
+            index = raw.find(eol, scan)  # not found index == -1
             if index >= 0:
                 break
 
@@ -463,6 +545,7 @@ def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
             if len(raw) > MAX_LINE_SIZE:
                 raise LineTooLong(kind)
             else:
+                scan = len(raw) - size if len(raw) > size else 0
                 (yield None)  # more data needed not done parsing header
                 continue
 
@@ -472,6 +555,7 @@ def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
         line = raw[:index]
         index += len(eol)  # strip eol
         del raw[:index] # remove used bytes
+        scan = 0
         (yield line)
     return
 
@@ -483,27 +567,35 @@ def parseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
     Yields lodict of headers Otherwise as indicated by empty headers
 
     Raise error if eol not found before  MAX_LINE_SIZE
+
+    Remembers line and scan offsets across yields and consumes raw once
+    when the entire leader is parsed
     """
     headers = headers if headers is not None else lodict()
+    size = max(map(len, eols)) - 1  # overlap of eol with previous scan
+    start = 0  # offset in raw of current line
+    scan = 0  # offset in raw before which no eol found in current line
     while True:  # loop until entire heading indicated by empty line
         for eol in eols:  # loop over eols unless found
-            index = raw.find(eol)  # not found index == -1
+            index = raw.find(eol, scan)  # not found index == -1
             if index >= 0:
                 break
 
         if index < 0:  # not found
-            if len(raw) > MAX_LINE_SIZE:
+            if len(raw) - start > MAX_LINE_SIZE:
                 raise LineTooLong(kind)
             else:
+                scan = len(raw) - size
+                if scan < start:
+                    scan = start
                 (yield None)  # more data needed not done parsing header
                 continue
 
-        if index > MAX_LINE_SIZE:  # found but line too long
+        if index - start > MAX_LINE_SIZE:  # found but line too long
             raise LineTooLong(kind)
 
-        line = raw[:index]
-        index += len(eol)  # strip eol
-        del raw[:index] # remove used bytes
+        line = raw[start:index]
+        start = scan = index + len(eol)  # strip eol
         if line:
             line = line.decode('iso-8859-1')  # convert to unicode string
             key, value = line.split(': ', 1)
@@ -513,6 +605,8 @@ def parseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
             raise HTTPException("Too many headers, more than {0}".format(MAX_HEADERS))
 
         if not line:  # empty line so entire leader done
+            del raw[:start]  # remove used bytes
+            start = scan = 0
             (yield headers) # leader done
     return
 
@@ -882,6 +976,124 @@ class EventSource(object):
                 self.parser = None
 
 
+class Dechunker(object):
+    """
+    Stateful decoder of chunked transfer encoded body in raw bytearray that
+    persists across calls to parse instead of a generator per chunk.
+    Chunk payload is appended directly to .body as it arrives or when
+    .streamer is provided is handed to .streamer instead of buffered.
+    Consumes parsed portions of raw once per call to parse.
+
+    Attributes:
+        .raw = bytearray of received bytes to parse
+        .body = bytearray to append payload to
+        .streamer = callable to receive payload bytes instead of .body if any
+        .parms = odict of chunk extension parameters
+        .trails = lodict of chunk trailer headers
+        .size = int size of current chunk or None when between chunks
+        .remaining = int number of payload bytes of current chunk not parsed
+        .count = int number of chunk size lines parsed
+        .ended = True once last chunk and trailers parsed
+    """
+    def __init__(self, raw, body=None, streamer=None, parms=None):
+        """
+        Initialize Instance
+        raw = bytearray of received bytes to parse
+        body = bytearray to append payload to
+        streamer = callable to receive payload bytes instead of body
+        parms = odict to update with chunk extension parameters
+        """
+        self.raw = raw
+        self.body = body if body is not None else bytearray()
+        self.streamer = streamer
+        self.parms = parms if parms is not None else odict()
+        self.trails = lodict()
+        self.size = None
+        self.remaining = 0
+        self.count = 0
+        self.ended = False
+        self.scan = 0  # offset in raw before which no eol found in line
+        self.leaderParser = None  # trailer parser generator after last chunk
+
+    def parse(self):
+        """
+        Parse as much of .raw as available
+        Returns True when last chunk and trailers parsed False otherwise
+
+        Chunked-Body   = *chunk
+                    last-chunk
+                    trailer
+                    CRLF
+        chunk          = chunk-size [ chunk-extension ] CRLF
+                         chunk-data CRLF
+        """
+        raw = self.raw
+        pos = 0  # offset in raw of unparsed bytes
+        try:
+            while not self.ended:
+                if self.size is None:  # chunk size line
+                    index = raw.find(CRLF, self.scan if self.scan > pos else pos)
+                    if index < 0 or index - pos > MAX_LINE_SIZE:
+                        if index >= 0 or len(raw) - pos > MAX_LINE_SIZE:
+                            raise LineTooLong("chunk size line")
+                        self.scan = len(raw) - 1 if len(raw) > pos else pos
+                        break
+                    size, sep, exts = bytes(raw[pos:index]).partition(b';')
+                    pos = self.scan = index + len(CRLF)
+                    self.size = self.remaining = int(size.strip().decode('ascii'), 16)
+                    self.count += 1
+                    if exts:  # parse extensions parameters
+                        for ext in exts.split(b';'):
+                            name, sep, value = ext.strip().partition(b'=')
+                            self.parms[name.strip()] = value.strip() or None
+
+                elif self.remaining:  # chunk data
+                    count = min(self.remaining, len(raw) - pos)
+                    if not count:
+                        break
+                    with memoryview(raw) as view:
+                        if self.streamer:
+                            self.streamer(bytes(view[pos:pos + count]))
+                        else:
+                            self.body += view[pos:pos + count]
+                    pos += count
+                    self.remaining -= count
+
+                elif self.size:  # chunk end line
+                    index = raw.find(CRLF, self.scan if self.scan > pos else pos)
+                    if index < 0:
+                        if len(raw) - pos > MAX_LINE_SIZE:
+                            raise LineTooLong("chunk end line")
+                        self.scan = len(raw) - 1 if len(raw) > pos else pos
+                        break
+                    if index > pos:  # not empty so raise error
+                        raise ValueError("Chunk end error. Expected empty got "
+                                 "'{0}' instead".format(raw[pos:index].decode('iso-8859-1')))
+                    pos = self.scan = index + len(CRLF)
+                    self.size = None
+
+                else:  # last chunk so parse trailing headers if any
+                    if self.leaderParser is None:
+                        self.leaderParser = parseLeader(raw=raw,
+                                                        eols=(CRLF, LF),
+                                                        kind="trailer header line")
+                    del raw[:pos]  # leader parser parses from start of raw
+                    self.scan = pos = 0
+                    headers = next(self.leaderParser)
+                    if headers is None:
+                        break
+                    self.leaderParser.close()
+                    self.leaderParser = None
+                    self.trails.update(headers)
+                    self.ended = True
+        finally:
+            if pos:
+                del raw[:pos]  # remove used bytes
+                self.scan = self.scan - pos if self.scan > pos else 0
+
+        return self.ended
+
+
 class Parsent(object):
     """
     Base class for objects that parse HTTP messages
@@ -889,12 +1101,14 @@ class Parsent(object):
     def __init__(self,
                  msg=None,
                  dictable=None,
-                 method=u'GET'):
+                 method=u'GET',
+                 streamer=None):
         """
         Initialize Instance
         msg = bytearray of request msg to parse
         dictable = True If should attempt to convert body to json
         method = method of associated request
+        streamer = callable to receive chunked body payload instead of .body
         """
         self.msg = msg if msg is not None else bytearray()
         self.dictable = True if dictable else False  # convert body json
@@ -917,6 +1131,7 @@ class Parsent(object):
         self.parms = None  # chunked encoding extension parameters
         self.trails = None  # chunked encoding trailing headers
         self.body = bytearray()  # body data bytearray
+        self.streamer = streamer  # callable to receive chunked body payload
         self.text = u''  # body decoded as unicode string
         self.data = None  # content dict deserialized from body json
         self.method = method.upper() if method else u'GET'
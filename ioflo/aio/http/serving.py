@@ -13,13 +13,14 @@ import os
 import socket
 import errno
 import io
+import stat
+import tempfile
 from collections import deque
 import codecs
 import json
 import ssl
 import copy
 import random
-import datetime
 
 from urllib.parse import urlsplit, quote, quote_plus, unquote, unquote_plus
 
@@ -50,21 +51,198 @@ CR = b"\r"
 
 #  Class Definitions
 
+class InputStream(object):
+    """
+    Nonblocking file like WSGI wsgi.input reader of request body streamed
+    into it as it is received. Body is held in memory until it exceeds
+    .spoolsize bytes and then is spilled to a temporary file. Space of read
+    bytes is reclaimed whenever all written bytes have been read.
+
+    Reads never block. A read returns None when no bytes are available yet
+    and empty bytes once the body has ended and all of it has been read.
+    Once closed the spool file is released, writes are discarded and reads
+    return empty bytes.
+    """
+    SpoolSize = 1048576  # default max bytes held in memory before spill
+
+    def __init__(self, spoolsize=None):
+        """
+        Initialize Instance
+        spoolsize = max bytes held in memory before spilling to temporary file
+        """
+        self.spoolsize = spoolsize if spoolsize is not None else self.SpoolSize
+        self.file = tempfile.SpooledTemporaryFile(max_size=self.spoolsize)
+        self.rpos = 0  # file position of next byte to read
+        self.wpos = 0  # file position of next byte to write
+        self.size = 0  # total number of body bytes written
+        self.ended = False  # True once entire body written
+        self.closed = False  # True once spool file closed
+
+    def __len__(self):
+        """ Returns number of bytes available to read """
+        return self.wpos - self.rpos
+
+    def write(self, data):
+        """
+        Append body data bytes
+        """
+        if self.closed:
+            return
+        self.file.seek(self.wpos)
+        self.file.write(data)
+        self.wpos += len(data)
+        self.size += len(data)
+
+    def end(self):
+        """
+        Mark end of body
+        """
+        self.ended = True
+
+    def _advance(self, count):
+        """
+        Advance read position by count and reclaim space once all read
+        """
+        self.rpos += count
+        if self.rpos == self.wpos and self.rpos:  # all read so reclaim
+            self.file.seek(0)
+            self.file.truncate()
+            self.rpos = self.wpos = 0
+
+    def read(self, size=-1):
+        """
+        Returns up to size bytes or all available bytes if size is negative
+        Returns None if none available yet or empty bytes at end of body
+        """
+        if self.closed:
+            return b''
+        count = self.wpos - self.rpos
+        if size is not None and 0 <= size < count:
+            count = size
+        if not count:
+            return b'' if (self.ended or size == 0) else None
+        self.file.seek(self.rpos)
+        data = self.file.read(count)
+        self._advance(len(data))
+        return data
+
+    def readline(self, size=-1):
+        """
+        Returns next line of up to size bytes including newline
+        Returns None if entire line not available yet or empty bytes at end
+        """
+        if self.closed:
+            return b''
+        count = self.wpos - self.rpos
+        if size is not None and 0 <= size < count:
+            count = size
+        self.file.seek(self.rpos)
+        line = self.file.readline(count)
+        if (not line.endswith(b'\n') and len(line) != size and
+                not self.ended):  # rest of line not received yet
+            return None if line or size != 0 else b''
+        self._advance(len(line))
+        return line
+
+    def readlines(self, hint=-1):
+        """
+        Returns list of available lines up to hint total bytes
+        """
+        lines = []
+        total = 0
+        for line in self:
+            lines.append(line)
+            total += len(line)
+            if hint is not None and 0 < hint <= total:
+                break
+        return lines
+
+    def __iter__(self):
+        """
+        Generator of lines available so far
+        """
+        while True:
+            line = self.readline()
+            if not line:  # None when more to come or empty when ended
+                break
+            yield line
+
+    def close(self):
+        """
+        Close spool file
+        """
+        if not self.closed:
+            self.file.close()
+            self.closed = True
+
+
+class FileWrapper(object):
+    """
+    WSGI wsgi.file_wrapper iterable of blocks of file like object.
+    Responder sends a regular file with os.sendfile instead of iterating.
+    """
+    BlockSize = 8192  # default bytes per block when iterated
+
+    def __init__(self, filelike, blksize=None):
+        """
+        Initialize Instance
+        Parameters:
+            filelike = file like object with .read
+            blksize = bytes per block when iterated
+        """
+        self.filelike = filelike
+        self.blksize = blksize if blksize is not None else self.BlockSize
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        data = self.filelike.read(self.blksize)
+        if data:
+            return data
+        raise StopIteration
+
+    def fileno(self):
+        """
+        Returns file descriptor of .filelike if regular file otherwise None
+        """
+        try:
+            fd = self.filelike.fileno()
+            if stat.S_ISREG(os.fstat(fd).st_mode):
+                return fd
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+        return None
+
+    def close(self):
+        """
+        Close .filelike if closable
+        """
+        if hasattr(self.filelike, 'close'):
+            self.filelike.close()
+
+
 class Requestant(httping.Parsent):
     """
     Nonblocking HTTP Server Requestant class
     Parses request msg
     """
 
-    def __init__(self, incomer=None, **kwa):
+    def __init__(self, incomer=None, streamable=False, spoolsize=None, **kwa):
         """
         Initialize Instance
         Parameters:
             incomer = Incomer connection instance
+            streamable = True if body streamed into .input as it is received
+                instead of buffered into .body
+            spoolsize = max bytes of .input held in memory before spill
 
         """
         super(Requestant, self).__init__(**kwa)
         self.incomer = incomer
+        self.streamable = True if streamable else False
+        self.spoolsize = spoolsize
+        self.input = None  # InputStream of body when .streamable
         self.url = u''   # full path in request line either relative or absolute
         self.scheme = u''  # scheme used in request line path
         self.hostname = u''  # hostname used in request line path
@@ -217,38 +395,41 @@ class Requestant(httping.Parsent):
 
         del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
 
+        if self.streamable:  # stream body into new input once head parsed
+            self.input = InputStream(spoolsize=self.spoolsize)
+            self.streamer = self.input.write
+
         if self.chunked:  # chunked takes precedence over length
             self.parms = odict()
-            while True:  # parse all chunks here
-                if self.closed:  # connection closed prematurely
+            dechunker = httping.Dechunker(raw=self.msg,
+                                          body=self.body,
+                                          streamer=self.streamer,
+                                          parms=self.parms)
+            while not dechunker.parse():  # parse all chunks here
+                if self.closed:
+                    if dechunker.count and dechunker.size is None:
+                        break  # no more data after whole chunk so finish
                     raise httping.PrematureClosure("Connection closed unexpectedly"
                                                    " while parsing request body chunk")
+                (yield None)
 
-                chunkParser = httping.parseChunk(raw=self.msg)
-                while True:  # parse another chunk
-                    result = next(chunkParser)
-                    if result is not None:
-                        chunkParser.close()
-                        break
-                    (yield None)
-
-                size, parms, trails, chunk = result
-
-                if parms:  # chunk extension parms
-                    self.parms.update(parms)
-
-                if size:  # size non zero so append chunk but keep iterating
-                    self.body.extend(chunk)
-
-                    if self.closed:  # no more data so finish
-                        chunkParser.close()
-                        break
-
-                else:  # last chunk when empty chunk so done
-                    if trails:
-                        self.trails = trails
-                    chunkParser.close()
+            if dechunker.trails:
+                self.trails = dechunker.trails
+
+        elif self.length != None and self.streamable:  # stream as received
+            remaining = self.length
+            while True:
+                if self.msg and remaining:
+                    size = min(remaining, len(self.msg))
+                    self.streamer(bytes(self.msg[:size]))
+                    del self.msg[:size]
+                    remaining -= size
+                if not remaining:
                     break
+                if self.closed:  # connection closed prematurely
+                    raise httping.PrematureClosure("Connection closed unexpectedly"
+                                                   " while parsing request body")
+                (yield None)
 
         elif self.length != None:  # known content length
             while len(self.msg) < self.length:
@@ -266,7 +447,11 @@ class Requestant(httping.Parsent):
 
         # only gets to here once content length has become finite
         # closed or not chunked or chunking has ended
-        self.length = len(self.body)
+        if self.streamable:
+            self.input.end()
+            self.length = self.input.size
+        else:
+            self.length = len(self.body)
         self.bodied = True
         (yield True)
         return
@@ -285,7 +470,9 @@ class Responder(object):
                  app,
                  environ,
                  chunkable=False,
-                 delay=None):
+                 delay=None,
+                 highwater=None,
+                 lowwater=None):
         """
         Initialize Instance
         Parameters:
@@ -293,6 +480,10 @@ class Responder(object):
             app = wsgi app callable
             environ = wsgi environment dict
             chunkable = True if may send body in chunks
+            highwater = unsent bytes of incomer at or above which app iterator
+                is not advanced until drained to lowwater. None means no limit
+            lowwater = unsent bytes of incomer at or below which app iterator
+                is advanced again. None means half of highwater
         """
         status = "200 OK"  # integer or string with reason, WSGI is string with reason
         self.incomer = incomer
@@ -310,20 +501,43 @@ class Responder(object):
         self.length = None  # if content-length provided must not exceed
         self.size = 0  # number of body bytes sent so far
         self.evented = False  # True if response is event-stream
+        self.filer = None  # FileWrapper of regular file sent with sendfile
+        self.offset = 0  # file offset of first body byte when .filer
+        self.highwater = highwater
+        if lowwater is None and highwater is not None:
+            lowwater = highwater // 2
+        self.lowwater = lowwater
+        self.throttled = False  # True when above highwater until lowwater
+        self.throttles = 0  # number of times throttled
+        self.peak = 0  # max unsent bytes of incomer seen when throttling
 
     def close(self):
         """
         Close any resources
         """
-        if not self.closed and not self.ended:
+        if not self.closed and not self.ended and self.started:
             self.write(b'')  # in case chunked send empty chunk to terminate
         self.ended = True
         self.closed = True
+        if self.filer:
+            self.filer.close()
+        self.closeInput()
+
+    def closeInput(self):
+        """
+        Close streamed wsgi.input InputStream of .environ if any so its spool
+        file is released
+        """
+        stream = self.environ.get('wsgi.input') if self.environ else None
+        if isinstance(stream, InputStream):
+            stream.close()
 
     def reset(self, environ, chunkable=None):
         """
         Reset attributes for another request-response
         """
+        if self.environ and self.environ.get('wsgi.input') is not environ.get('wsgi.input'):
+            self.closeInput()  # previous request input
         self.environ = environ
 
         if self.chunkable is not None:
@@ -338,43 +552,36 @@ class Responder(object):
         self.headers = lodict()
         self.length = None
         self.size = 0
+        self.filer = None
+        self.offset = 0
+        self.throttled = False
 
     def build(self):
         """
         Return built head bytes from .status and .headers
 
         """
-        lines = []
-
         _status = getattr(self.iterator, '_status', None)  # if AttributiveGenerator
         status = _status if _status is not None else self.status  # override
 
-        if isinstance(status, int):
-            status = "{0} {1}".format(status, httping.STATUS_DESCRIPTIONS[status])
-
-        startLine = "{0} {1}".format(self.HttpVersionString, status)
-        try:
-            startLine = startLine.encode('ascii')
-        except UnicodeEncodeError:
-            startLine = startLine.encode('idna')
-        lines.append(startLine)
+        lines = [httping.packStatusLine(status, self.HttpVersionString)]
 
-        # Override if AttributiveGenerator
-        self.headers.update(getattr(self.iterator, '_headers', lodict()))
+        _headers = getattr(self.iterator, '_headers', None)  # if AttributiveGenerator
+        if _headers:
+            self.headers.update(_headers)  # override
 
         if u'server' not in self.headers:  # create Server header
             self.headers[u'server'] = "Ioflo WSGI Server"
 
         if u'date' not in self.headers:  # create Date header
-            self.headers[u'date'] = httping.httpDate1123(datetime.datetime.utcnow())
+            self.headers[u'date'] = httping.httpDateNow()
 
         if self.chunkable and 'transfer-encoding' not in self.headers:
             self.chunked = True
             self.headers[u'transfer-encoding'] = u'chunked'
 
-        for name, value in self.headers.items():
-            lines.append(httping.packHeader(name, value))
-
+        lines.extend([httping.packHeader(name, value)
+                      for name, value in self.headers.items()])
         lines.extend((b"", b""))
         head = CRLF.join(lines)  # b'/r/n'
 
@@ -477,7 +684,19 @@ class Responder(object):
         """
         if not self.closed and not self.ended:
             if self.iterator is None:  # initiate application
-                self.iterator = iter(self.app(self.environ, self.start))
+                result = self.app(self.environ, self.start)
+                if (isinstance(result, FileWrapper) and self.started and
+                        hasattr(os, 'sendfile') and result.fileno() is not None):
+                    self.prepFile(result)
+                self.iterator = iter(result)
+
+            if self.filer:
+                self.serviceFile()
+                return
+
+            if self.highwater is not None and self.throttle():
+                return  # wait for incomer to drain
+
             try:
                 msg = next(self.iterator)
             except StopIteration as ex:
@@ -511,6 +730,66 @@ class Responder(object):
                         self.ended = True
 
 
+    def throttle(self):
+        """
+        Returns True if app iterator should not be advanced because unsent
+        bytes of incomer reached .highwater and not yet drained to .lowwater
+        """
+        unsent = self.incomer.unsent
+        if unsent > self.peak:
+            self.peak = unsent
+        if self.throttled:
+            if unsent > self.lowwater:
+                return True
+            self.throttled = False
+        elif unsent >= self.highwater:
+            self.throttled = True
+            self.throttles += 1
+        return self.throttled
+
+    def prepFile(self, filer):
+        """
+        Setup to send body from current position of regular file of FileWrapper
+        filer with sendfile. Content-Length is file remainder if not provided
+        so not chunked. A provided Content-Length larger than the file remainder
+        is corrected to the remainder since head is not yet sent.
+        """
+        self.filer = filer
+        self.offset = filer.filelike.tell()
+        remaining = max(0, os.fstat(filer.fileno()).st_size - self.offset)
+        if self.length is None or self.length > remaining:
+            if self.length is not None:
+                console.terse("Content-Length {0} exceeds file remainder {1}. "
+                              "Corrected.\n".format(self.length, remaining))
+            self.headers[u'content-length'] = str(remaining)
+            self.chunkable = False
+            self.length = remaining
+
+    def serviceFile(self):
+        """
+        Service sending body of .filer with sendfile on incomer socket once
+        head has been sent. Partial sends resume from file offset next time.
+        """
+        if not self.headed:
+            self.write(b'')  # queue head
+        if self.incomer.txes:  # head not yet all sent
+            return
+        if self.size < self.length and not self.incomer.cutoff:
+            try:
+                self.size += self.incomer.sendfile(self.filer.fileno(),
+                                                   self.offset + self.size,
+                                                   self.length - self.size)
+            except EOFError as ex:  # file shrank so body can not be completed
+                console.terse("Premature end of file sending body. {0}\n".format(ex))
+                self.filer.close()
+                self.ended = True
+                self.closed = True  # signal to close connection
+                return
+        if self.size >= self.length or self.incomer.cutoff:
+            self.ended = True
+            self.filer.close()
+
+
 class Valet(object):
     """
     Valet WSGI Server Class
@@ -532,6 +811,11 @@ class Valet(object):
                  eha=None,
                  scheme=u'',
                  timeout=None,
+                 selected=False,
+                 streamable=False,
+                 spoolsize=None,
+                 highwater=None,
+                 lowwater=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -557,6 +841,17 @@ class Valet(object):
             kwa needed to pass additional parameters to servant
 
             timeout is timeout in seconds for dropping idle connections
+            selected is Boolean True if servant services only sockets
+                selected ready by its selector
+            streamable is Boolean True if app is started once request head is
+                parsed with nonblocking wsgi.input InputStream of the body
+                as it is received instead of after entire body is buffered
+            spoolsize is max bytes of streamed body held in memory before
+                spilling to temporary file
+            highwater is unsent bytes per connection at or above which
+                responders stop advancing app iterators. None means no limit
+            lowwater is unsent bytes per connection at or below which
+                throttled responders resume. None means half of highwater
 
         Attributes:
             .store is Datastore for timers
@@ -567,6 +862,10 @@ class Valet(object):
             .timeout is timeout in seconds for dropping idle connections
             .scheme is http scheme http or https for servant and environment
             .secured is Boolean true if TLS
+            .streamable is Boolean True if request bodies streamed to app
+            .spoolsize is max bytes of streamed body held in memory
+            .highwater is unsent bytes per connection that throttles responder
+            .lowwater is unsent bytes per connection that resumes responder
 
         """
         self.app = app
@@ -578,6 +877,10 @@ class Valet(object):
         if not name:
             name = "Ioflo_WSGI_server"
         self.timeout = timeout if timeout is not None else self.Timeout
+        self.streamable = True if streamable else False
+        self.spoolsize = spoolsize
+        self.highwater = highwater
+        self.lowwater = lowwater
 
         ha = ha or (host, port)  # ha = host address takes precendence over host, port
         if servant:
@@ -625,6 +928,7 @@ class Valet(object):
                                     bufsize=bufsize,
                                     wlog=wlog,
                                     timeout=self.timeout,
+                                    selected=selected,
                                     **kwa)
             else:
                 servant = Server(store=self.store,
@@ -634,6 +938,7 @@ class Valet(object):
                                  bufsize=bufsize,
                                  wlog=wlog,
                                  timeout=self.timeout,
+                                 selected=selected,
                                  **kwa)
 
 
@@ -689,8 +994,13 @@ class Valet(object):
         # WSGI variables
         environ['wsgi.version'] = (1, 0)
         environ['wsgi.url_scheme'] = self.scheme
-        environ['wsgi.input'] = io.BytesIO(requestant.body)
+        if requestant.input is not None:  # streamed
+            environ['wsgi.input'] = requestant.input
+            environ['wsgi.input_terminated'] = True  # read until empty
+        else:
+            environ['wsgi.input'] = io.BytesIO(requestant.body)
         environ['wsgi.errors'] = sys.stderr
+        environ['wsgi.file_wrapper'] = FileWrapper
         environ['wsgi.multithread'] = False
         environ['wsgi.multiprocess'] = False
         environ['wsgi.run_once'] = False
@@ -725,6 +1035,8 @@ class Valet(object):
         """
         if ca in self.reqs:
             self.reqs[ca].close()  # this signals request parser
+            if self.reqs[ca].input is not None:
+                self.reqs[ca].input.close()  # release spool file
             del self.reqs[ca]
         if ca in self.reps:
             self.reps[ca].close()  # this signals response handler
@@ -746,7 +1058,10 @@ class Valet(object):
                 continue
 
             if ca not in self.reqs:  # point requestant.msg to incomer.rxbs
-                self.reqs[ca] = Requestant(msg=ix.rxbs, incomer=ix)
+                self.reqs[ca] = Requestant(msg=ix.rxbs,
+                                           incomer=ix,
+                                           streamable=self.streamable,
+                                           spoolsize=self.spoolsize)
 
             if ix.timeout > 0.0 and ix.timer.expired:
                 self.closeConnection(ca)
@@ -779,18 +1094,50 @@ class Valet(object):
                                                         requestant.version,
                                                         requestant.headers,
                                                         requestant.body))
-                    # create or restart wsgi app responder here
-                    environ = self.buildEnviron(requestant)
-                    if ca not in self.reps:
-                        chunkable = True if requestant.version >= (1, 1) else False
-                        responder = Responder(incomer=requestant.incomer,
-                                                  app=self.app,
-                                                  environ=environ,
-                                                  chunkable=chunkable)
-                        self.reps[ca] = responder
-                    else:  # reuse
-                        responder = self.reps[ca]
-                        responder.reset(environ=environ)
+                    if not self.streamable:
+                        self.dispatch(requestant)
+
+                if (requestant.input is not None and (ca not in self.reps or
+                        self.reps[ca].environ['wsgi.input'] is not requestant.input)):
+                    self.dispatch(requestant)  # head parsed so start streaming
+
+    def dispatch(self, requestant):
+        """
+        Create or restart wsgi app responder for requestant
+        """
+        ca = requestant.incomer.ca
+        environ = self.buildEnviron(requestant)
+        if ca not in self.reps:
+            chunkable = True if requestant.version >= (1, 1) else False
+            responder = Responder(incomer=requestant.incomer,
+                                      app=self.app,
+                                      environ=environ,
+                                      chunkable=chunkable,
+                                      highwater=self.highwater,
+                                      lowwater=self.lowwater)
+            self.reps[ca] = responder
+        else:  # reuse
+            responder = self.reps[ca]
+            responder.reset(environ=environ)
+
+    @property
+    def stats(self):
+        """
+        Returns odict keyed by ca of odicts of flow statistics of responder
+        connections
+            unsent = bytes queued not yet sent
+            peak = max unsent bytes seen when throttling
+            throttled = True if responder waiting for connection to drain
+            throttles = number of times responder throttled
+        """
+        stats = odict()
+        for ca, responder in self.reps.items():
+            ix = self.servant.ixes.get(ca)
+            stats[ca] = odict([('unsent', ix.unsent if ix is not None else 0),
+                               ('peak', responder.peak),
+                               ('throttled', responder.throttled),
+                               ('throttles', responder.throttles)])
+        return stats
 
     def serviceReps(self):
         """
@@ -805,6 +1152,7 @@ class Valet(object):
                 responder.service()
 
             if responder.ended:
+                responder.closeInput()  # release spool file of streamed body
                 requestant = self.reqs[ca]
                 if requestant.persisted:
                     if requestant.parser is None:  # reuse
@@ -905,22 +1253,13 @@ class CustomResponder(object):
                     headers=headers,
                     body=body,
                     data=data)
-        self.lines = []
-
-        startLine = "{0} {1} {2}".format(self.HttpVersionString,
-                                         self.status,
-                                         httping.STATUS_DESCRIPTIONS[self.status])
-        try:
-            startLine = startLine.encode('ascii')
-        except UnicodeEncodeError:
-            startLine = startLine.encode('idna')
-        self.lines.append(startLine)
+        self.lines = [httping.packStatusLine(self.status, self.HttpVersionString)]
 
         if u'server' not in self.headers:  # create Server header
             self.headers[u'server'] = "Ioflo Server"
 
         if u'date' not in self.headers:  # create Date header
-            self.headers[u'date'] = httping.httpDate1123(datetime.datetime.utcnow())
+            self.headers[u'date'] = httping.httpDateNow()
 
         if self.data is not None:
             body = ns2b(json.dumps(self.data, separators=(',', ':')))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Micro benchmarks of incremental http head parsing
+
+Compares httping.parseLeader against the prior implementation that rescanned
+raw from its start on every resume and consumed raw after every line.
+The head of a request with many headers is fed in small segments as from
+a slow network and parsed after each segment.
+
+$ python bench_httping.py [segment]
+
+"""
+import sys
+import timeit
+
+from ioflo.aio.http import httping
+from ioflo.aio.http.httping import CRLF, LF, MAX_LINE_SIZE, LineTooLong
+from ioflo.aid.odicting import lodict
+
+
+def priorParseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
+    """
+    Prior parseLeader that searches from the start of raw on each resume
+    """
+    headers = headers if headers is not None else lodict()
+    while True:
+        for eol in eols:
+            index = raw.find(eol)
+            if index >= 0:
+                break
+
+        if index < 0:
+            if len(raw) > MAX_LINE_SIZE:
+                raise LineTooLong(kind)
+            else:
+                (yield None)
+                continue
+
+        line = raw[:index]
+        index += len(eol)
+        del raw[:index]
+        if line:
+            line = line.decode('iso-8859-1')
+            key, value = line.split(': ', 1)
+            headers[key] = value
+
+        if not line:
+            (yield headers)
+    return
+
+
+def makeHead(count, width):
+    """
+    Returns bytes of leader of count headers each with value of width bytes
+    """
+    lines = [u"X-Header-{0}: {1}".format(i, u"v" * width) for i in range(count)]
+    return (u"\r\n".join(lines) + u"\r\n\r\n").encode('iso-8859-1')
+
+
+CASES = ((10, 20), (50, 200), (1, 60000))  # (headers, value width)
+
+def bench(parser, head, segment):
+    """
+    Returns seconds to parse head fed into raw segment bytes at a time
+    """
+    def parse():
+        raw = bytearray()
+        leaderParser = parser(raw=raw, headers=lodict())
+        for i in range(0, len(head), segment):
+            raw.extend(head[i:i + segment])
+            headers = next(leaderParser)
+        leaderParser.close()
+        assert headers is not None
+    return min(timeit.repeat(parse, number=1, repeat=5))
+
+
+def main(segment=16):
+    """ Print benchmark table """
+    print("{0:>8} {1:>8} {2:>8} {3:>12} {4:>12} {5:>8}".format(
+            "headers", "bytes", "segment", "prior ms", "new ms", "speedup"))
+    for count, width in CASES:
+        head = makeHead(count, width)
+        old = bench(priorParseLeader, head, segment)
+        new = bench(httping.parseLeader, head, segment)
+        print("{0:>8d} {1:>8d} {2:>8d} {3:>12.3f} {4:>12.3f} {5:>7.1f}x".format(
+                count, len(head), segment, old * 1e3, new * 1e3, old / new))
+
+
+if __name__ == '__main__':
+    main(segment=int(sys.argv[1]) if len(sys.argv) > 1 else 16)
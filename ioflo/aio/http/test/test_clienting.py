@@ -3861,6 +3861,146 @@ class BasicTestCase(unittest.TestCase):
 
 
 
+    def testPatronPipelined(self):
+        """
+        Test Patron pipelined requests with responses in request order
+        """
+        console.terse("{0}\n".format(self.testPatronPipelined.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            body = ns2b("{0} {1}".format(environ['REQUEST_METHOD'],
+                                         environ['PATH_INFO']))
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', str(len(body)))])
+            return [body]
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        beta = clienting.Patron(bufsize=131072,
+                                store=store,
+                                port=alpha.servant.eha[1],
+                                pipelined=True,
+                                depth=3)
+        self.assertIs(beta.pipelined, True)
+        self.assertEqual(beta.depth, 3)
+        self.assertIs(beta.connector.reopen(), True)
+
+        while not beta.connector.connected:
+            beta.serviceAll()
+            alpha.serviceAll()
+            time.sleep(0.05)
+
+        for i in range(4):
+            beta.request(method=u'GET', path=u'/thing/{0}'.format(i))
+        beta.request(method=u'POST', path=u'/thing', body=b'stuff')
+        beta.request(method=u'GET', path=u'/thing/last')
+        beta.serviceAll()
+        self.assertEqual(len(beta.pendings), 3)  # sent without waiting
+        self.assertEqual(beta.load, 6)
+        self.assertEqual([request['path'] for request in beta.pendings],
+                         [u'/thing/0', u'/thing/1', u'/thing/2'])
+
+        while len(beta.responses) < 6:
+            alpha.serviceAll()
+            time.sleep(0.05)
+            beta.serviceAll()
+            if len(beta.responses) < 4:
+                self.assertLessEqual(len(beta.pendings), 3)
+            elif len(beta.responses) == 4:
+                self.assertEqual(len(beta.pendings), 1)  # not after POST
+
+        self.assertIs(beta.waited, False)
+        self.assertEqual(len(beta.pendings), 0)
+        self.assertEqual(len(beta.connector.rxbs), 0)
+        paths = [u'/thing/0', u'/thing/1', u'/thing/2', u'/thing/3',
+                 u'/thing', u'/thing/last']
+        methods = [u'GET'] * 4 + [u'POST', u'GET']
+        for path, method in zip(paths, methods):
+            response = beta.respond()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.request['path'], path)
+            self.assertEqual(response.request['method'], method)
+            self.assertEqual(response.body, ns2b("{0} {1}".format(method, path)))
+
+        alpha.servant.closeAll()
+        beta.close()
+
+    def testPatronPool(self):
+        """
+        Test PatronPool dispatch of requests over pooled pipelined patrons
+        """
+        console.terse("{0}\n".format(self.testPatronPool.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            body = ns2b(environ['PATH_INFO'])
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', str(len(body)))])
+            return [body]
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        pool = clienting.PatronPool(store=store, size=2, depth=2, bufsize=131072)
+        self.assertEqual(pool.size, 2)
+        self.assertIs(pool.pipelined, True)
+
+        url = "http://localhost:{0}/item/".format(alpha.servant.eha[1])
+        for i in range(6):
+            pool.request(path=url + str(i), tag=i)
+        request = pool.requests[0]
+        self.assertEqual((request['host'], request['port'], request['scheme'],
+                          request['path']),
+                         ('localhost', alpha.servant.eha[1], 'http', '/item/0'))
+
+        pool.serviceAll()
+        key = ('localhost', alpha.servant.eha[1], 'http')
+        self.assertEqual(list(pool.patrons.keys()), [key])
+        patrons = pool.patrons[key]
+        self.assertEqual(len(patrons), 2)
+        self.assertEqual([patron.load for patron in patrons], [2, 2])
+        self.assertEqual([request['tag'] for request in pool.requests], [4, 5])
+        self.assertEqual(pool.stats['queued'], 2)
+        self.assertEqual(pool.stats['inflight'], 4)
+        self.assertEqual(pool.stats['peak'], 6)
+
+        while len(pool.responses) < 6:
+            alpha.serviceAll()
+            time.sleep(0.05)
+            pool.serviceAll()
+
+        self.assertEqual(len(pool.patrons[key]), 2)  # connections reused
+        self.assertEqual(pool.stats['queued'], 0)
+        self.assertEqual(pool.stats['inflight'], 0)
+        self.assertEqual(pool.stats['count'], 6)
+        self.assertGreater(pool.stats['total'], 0.0)
+        self.assertGreaterEqual(pool.stats['max'], pool.stats['last'])
+
+        tags = []
+        while pool.responses:
+            response = pool.respond()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.body,
+                             ns2b("/item/{0}".format(response.request['tag'])))
+            tags.append(response.request['tag'])
+        self.assertEqual(sorted(tags), list(range(6)))
+
+        alpha.servant.closeAll()
+        pool.close()
+
+
 def runOne(test):
     '''
     Unittest Runner
@@ -3897,6 +4037,8 @@ def runSome():
              'testPatronRedirectComplexSecure',
              'testMultiPartForm',
              'testQueryQuoting',
+             'testPatronPipelined',
+             'testPatronPool',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
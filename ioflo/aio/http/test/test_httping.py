@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for http httping module
+"""
+
+import sys
+
+import unittest
+
+# Import ioflo libs
+from ioflo.aid.sixing import *
+from ioflo.aid.odicting import lodict
+from ioflo.aid.consoling import getConsole
+
+from ioflo.aio.http import httping
+
+console = getConsole()
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def testParseLine(self):
+        """
+        Test parseLine resumes over bytes fed one at a time
+        """
+        console.terse("{0}\n".format(self.testParseLine.__doc__))
+        msg = b"GET /echo HTTP/1.1\r\nHost: localhost\r\n"
+        raw = bytearray()
+        lineParser = httping.parseLine(raw=raw, eols=(httping.CRLF, httping.LF),
+                                       kind="status line")
+        lines = []
+        for i in range(len(msg)):
+            raw.extend(msg[i:i + 1])
+            line = next(lineParser)
+            if line is not None:
+                lines.append(bytes(line))
+        lineParser.close()
+        self.assertEqual(lines, [b"GET /echo HTTP/1.1", b"Host: localhost"])
+        self.assertEqual(raw, b"")
+
+        raw = bytearray(b"first\nsecond\r\n")  # eols searched in order
+        lineParser = httping.parseLine(raw=raw, eols=(httping.CRLF, httping.LF))
+        self.assertEqual(next(lineParser), b"first\nsecond")
+        lineParser.close()
+
+        raw = bytearray(b"x" * (httping.MAX_LINE_SIZE + 1))
+        lineParser = httping.parseLine(raw=raw, eols=(httping.CRLF, ))
+        with self.assertRaises(httping.LineTooLong):
+            next(lineParser)
+
+    def testParseLeader(self):
+        """
+        Test parseLeader resumes over segments and consumes raw once
+        """
+        console.terse("{0}\n".format(self.testParseLeader.__doc__))
+        head = (b"Host: localhost\r\nContent-Type: text/plain\r\n"
+                b"Content-Length: 4\r\n\r\n")
+        body = b"Body"
+        for size in (1, 2, 3, 7, len(head) + len(body)):
+            raw = bytearray()
+            leaderParser = httping.parseLeader(raw=raw)
+            msg = head + body
+            headers = None
+            for i in range(0, len(msg), size):
+                raw.extend(msg[i:i + size])
+                if headers is None:
+                    headers = next(leaderParser)
+                    if headers is None:
+                        self.assertEqual(len(raw), i + len(msg[i:i + size]))
+            leaderParser.close()
+            self.assertEqual(list(headers.items()),
+                             [("host", "localhost"),
+                              ("content-type", "text/plain"),
+                              ("content-length", "4")])
+            self.assertEqual(raw, body)
+
+        raw = bytearray(b"Host: localhost\r\n" + b"x" * (httping.MAX_LINE_SIZE + 1))
+        leaderParser = httping.parseLeader(raw=raw)
+        with self.assertRaises(httping.LineTooLong):
+            next(leaderParser)
+
+        raw = bytearray(b"".join(b"X-" + ns2b(str(i)) + b": v\r\n"
+                                 for i in range(httping.MAX_HEADERS + 1)))
+        leaderParser = httping.parseLeader(raw=raw)
+        with self.assertRaises(httping.HTTPException):
+            next(leaderParser)
+
+
+    def testDechunker(self):
+        """
+        Test Dechunker decodes chunked body over segments
+        """
+        console.terse("{0}\n".format(self.testDechunker.__doc__))
+        msgs = [b"Hello", b" big" * 100, b" World"]
+        chunked = b"".join(httping.packChunk(msg) for msg in msgs)
+        chunked = chunked.replace(b"5\r\n", b"5;name=value;flag\r\n", 1)
+        chunked += b"0\r\nExpires: never\r\n\r\nNext"
+
+        for size in (1, 2, 5, 64, len(chunked)):
+            raw = bytearray()
+            dechunker = httping.Dechunker(raw=raw)
+            for i in range(0, len(chunked), size):
+                raw.extend(chunked[i:i + size])
+                if dechunker.parse():
+                    break
+            self.assertIs(dechunker.ended, True)
+            self.assertEqual(dechunker.body, b"".join(msgs))
+            self.assertEqual(dechunker.count, 4)
+            self.assertEqual(dechunker.parms, {b"name": b"value", b"flag": None})
+            self.assertEqual(list(dechunker.trails.items()), [("expires", "never")])
+            rest = chunked[i + size:] if i + size < len(chunked) else b""
+            self.assertEqual(raw + rest, b"Next")
+            self.assertIs(dechunker.parse(), True)  # no more once ended
+
+        pieces = []
+        raw = bytearray(chunked)
+        dechunker = httping.Dechunker(raw=raw, streamer=pieces.append)
+        self.assertIs(dechunker.parse(), True)
+        self.assertEqual(pieces, msgs)
+        self.assertEqual(dechunker.body, b"")
+
+        raw = bytearray(b"3\r\nabcd\r\n")
+        dechunker = httping.Dechunker(raw=raw)
+        with self.assertRaises(ValueError):
+            dechunker.parse()
+
+
+    def testPackHead(self):
+        """
+        Test cached packing of status lines, header lines, and date
+        """
+        console.terse("{0}\n".format(self.testPackHead.__doc__))
+        self.assertEqual(httping.packStatusLine(200), b"HTTP/1.1 200 OK")
+        self.assertIs(httping.packStatusLine(200), httping.packStatusLine(200))
+        self.assertEqual(httping.packStatusLine("404 Not Found"),
+                         b"HTTP/1.1 404 Not Found")
+        self.assertEqual(httping.packStatusLine(204, u'HTTP/1.0'),
+                         b"HTTP/1.0 204 No Content")
+
+        line = httping.packHeader(u'content-type', u'text/plain')
+        self.assertEqual(line, b"Content-Type: text/plain")
+        self.assertIs(httping.packHeader(u'content-type', u'text/plain'), line)
+        self.assertEqual(httping.packHeader(u'accept', u'text/html', b'*/*', 1),
+                         b"Accept: text/html, */*, 1")
+
+        # per message values are packed but never cached only their names
+        secret = u'Bearer 0123456789abcdef'
+        self.assertEqual(httping.packHeader(u'authorization', secret),
+                         b"Authorization: Bearer 0123456789abcdef")
+        self.assertEqual(httping.packHeader(u'content-length', 42),
+                         b"Content-Length: 42")
+        self.assertNotIn((u'authorization', secret), httping._packedStatics)
+        self.assertNotIn((u'content-length', 42), httping._packedStatics)
+        for line in httping._packedStatics.values():
+            self.assertNotIn(b'Bearer', line)
+        self.assertEqual(httping.packHeaderName(u'content-length'), b"Content-Length: ")
+        self.assertIs(httping.packHeaderName(u'content-length'),
+                      httping.packHeaderName(u'content-length'))
+
+        date = httping.httpDateNow()
+        self.assertRegex(date, r"^[A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4} "
+                               r"\d{2}:\d{2}:\d{2} GMT$")
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = [
+             'testParseLine',
+             'testParseLeader',
+             'testDechunker',
+             'testPackHead',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testParseLeader')
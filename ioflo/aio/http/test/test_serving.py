@@ -11,6 +11,7 @@ from urllib.parse import urlsplit, quote, quote_plus, unquote, unquote_plus
 
 
 import os
+import io
 import time
 import tempfile
 import shutil
@@ -29,7 +30,7 @@ from ioflo.aid.timing import Timer, StoreTimer
 from ioflo.aid.consoling import getConsole
 from ioflo.base import storing
 
-from ioflo.aio import wiring
+from ioflo.aio import wiring, tcp
 from ioflo.aio.http import httping, clienting, serving
 
 console = getConsole()
@@ -938,6 +939,417 @@ class BasicTestCase(unittest.TestCase):
         wireLogAlpha.close()
         wireLogBeta.close()
 
+    def testValetServiceSelected(self):
+        """
+        Test Valet WSGI service with selected secure TLS request responses
+        """
+        console.terse("{0}\n".format(self.testValetServiceSelected.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', '12')])
+            return [b"Hello World!"]
+
+        serverKeypath = self.certdirpath + '/server_key.pem'  # local server private key
+        serverCertpath = self.certdirpath + '/server_cert.pem'  # local server public cert
+        clientCafilepath = self.certdirpath + '/client.pem' # remote client public cert
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp,
+                              scheme='https',
+                              keypath=serverKeypath,
+                              certpath=serverCertpath,
+                              cafilepath=clientCafilepath,
+                              selected=True)
+        self.assertIs(alpha.servant.selected, True)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        clientKeypath = self.certdirpath + '/client_key.pem'  # local client private key
+        clientCertpath = self.certdirpath + '/client_cert.pem'  # local client public cert
+        serverCafilepath = self.certdirpath + '/server.pem' # remote server public cert
+
+        path = "https://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        beta = clienting.Patron(bufsize=131072,
+                                store=store,
+                                path=path,
+                                reconnectable=True,
+                                scheme='https',
+                                certedhost='localhost',
+                                keypath=clientKeypath,
+                                certpath=clientCertpath,
+                                cafilepath=serverCafilepath,
+                                selected=True)
+        self.assertIs(beta.connector.selected, True)
+        self.assertIs(beta.connector.reopen(), True)
+
+        for name in (u'fame', u'fortune'):  # persistent connection
+            request = odict([('method', u'GET'),
+                             ('path', u'/echo?name={0}'.format(name)),
+                             ('qargs', odict()),
+                             ('fragment', u''),
+                             ('headers', odict([('Accept', 'application/json'),
+                                                ('Content-Length', 0)])),
+                            ])
+            beta.requests.append(request)
+
+            while (beta.requests or beta.connector.txes or not beta.responses or
+                   not alpha.idle()):
+                alpha.serviceAll()
+                time.sleep(0.05)
+                beta.serviceAll()
+                time.sleep(0.05)
+
+            self.assertEqual(len(beta.responses), 1)
+            response = beta.responses.popleft()
+            self.assertEqual(response['body'],bytearray(b'Hello World!'))
+            self.assertEqual(response['status'], 200)
+            requestant = alpha.reqs.values()[0]
+            self.assertEqual(requestant.url, request['path'])
+
+        self.assertEqual(len(alpha.servant.ixes), 1)
+        ix = alpha.servant.ixes.values()[0]
+        self.assertIs(alpha.servant.selector.get_key(ix.cs).data, ix)
+        self.assertIsNotNone(beta.connector.selector)
+
+        alpha.servant.closeAll()
+        beta.connector.close()
+
+    def testInputStream(self):
+        """
+        Test nonblocking InputStream reads and spill
+        """
+        console.terse("{0}\n".format(self.testInputStream.__doc__))
+        reader = serving.InputStream(spoolsize=16)
+        self.assertIsNone(reader.read())
+        self.assertIsNone(reader.readline())
+        self.assertEqual(reader.read(0), b"")
+
+        reader.write(b"first line\nsecond")
+        self.assertEqual(len(reader), 17)
+        self.assertIs(reader.file._rolled, True)
+        self.assertEqual(reader.readline(), b"first line\n")
+        self.assertIsNone(reader.readline())  # partial line
+        self.assertEqual(reader.readline(3), b"sec")
+        reader.write(b" line\nthird")
+        self.assertEqual(reader.readlines(), [b"ond line\n"])
+        self.assertEqual(reader.read(2), b"th")
+        self.assertEqual(reader.read(), b"ird")
+        self.assertEqual(reader.wpos, 0)  # reclaimed once all read
+        self.assertIsNone(reader.read())
+
+        reader.write(b"last")
+        reader.end()
+        self.assertEqual(list(reader), [b"last"])
+        self.assertEqual(reader.read(), b"")
+        self.assertEqual(reader.readline(), b"")
+        self.assertEqual(reader.size, 32)
+        reader.close()
+        self.assertIs(reader.closed, True)
+        self.assertIs(reader.file.closed, True)
+        reader.write(b"dropped")  # discarded once closed
+        self.assertEqual(reader.read(), b"")
+        self.assertEqual(reader.readline(), b"")
+        reader.close()  # idempotent
+
+    def testValetServiceStreamable(self):
+        """
+        Test Valet WSGI service streaming request body into wsgi.input
+        """
+        console.terse("{0}\n".format(self.testValetServiceStreamable.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+        inputs = []
+
+        def wsgiApp(environ, start_response):
+            reader = environ['wsgi.input']
+            inputs.append(reader)
+            body = bytearray()
+            while True:
+                data = reader.read()
+                if data is None:  # more to come
+                    yield b''
+                    continue
+                if not data:  # ended
+                    break
+                body.extend(data)
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', str(len(body)))])
+            yield bytes(body)
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp,
+                              streamable=True,
+                              spoolsize=256)
+        self.assertIs(alpha.streamable, True)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        beta = tcp.Client(ha=alpha.servant.eha, bufsize=131072)
+        self.assertIs(beta.reopen(), True)
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.05)
+
+        body = b"".join(ns2b("{0:0>7d} ".format(i)) for i in range(250))
+        head = (b"PUT /upload HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: 2000\r\n\r\n")
+        beta.tx(head + body[:500])
+        while not inputs or inputs[0].size < 500:
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+
+        reader = inputs[0]
+        self.assertIsInstance(reader, serving.InputStream)
+        self.assertIs(reader.ended, False)  # app started before body received
+        self.assertIs(alpha.reps.values()[0].headed, False)
+        alpha.serviceAll()
+        self.assertEqual(len(reader), 0)  # app consumed what arrived
+
+        beta.tx(body[500:])
+        while not beta.rxbs.endswith(body):
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+            beta.serviceReceives()
+        self.assertIs(reader.ended, True)
+        self.assertEqual(reader.size, 2000)
+        self.assertIs(reader.file._rolled, True)  # spilled beyond spoolsize
+        self.assertIs(reader.closed, True)  # released once response ended
+        self.assertIs(reader.file.closed, True)
+        self.assertTrue(beta.rxbs.startswith(b"HTTP/1.1 200 OK\r\n"))
+        beta.clearRxbs()
+
+        # chunked request on persisted connection
+        chunked = b"".join(httping.packChunk(body[i:i + 300])
+                           for i in range(0, len(body), 300))
+        beta.tx(b"PUT /upload HTTP/1.1\r\nHost: localhost\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n" + chunked + b"0\r\n\r\n")
+        while not beta.rxbs.endswith(body):
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+            beta.serviceReceives()
+        self.assertEqual(len(inputs), 2)
+        self.assertIs(inputs[1].ended, True)
+        self.assertIs(inputs[1].closed, True)
+        self.assertEqual(alpha.reqs.values()[0].length, 2000)
+
+        # connection closed while body still streaming releases input
+        beta.tx(head + body[:500])
+        while len(inputs) < 3 or inputs[2].size < 500:
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+        self.assertIs(inputs[2].closed, False)
+        self.assertIs(inputs[2].file._rolled, True)
+        alpha.closeConnection(beta.ca)
+        self.assertIs(inputs[2].closed, True)
+        self.assertIs(inputs[2].file.closed, True)
+
+        alpha.servant.closeAll()
+        beta.close()
+
+
+    def testValetServiceFileWrapper(self):
+        """
+        Test Valet WSGI service of wsgi.file_wrapper response with sendfile
+        """
+        console.terse("{0}\n".format(self.testValetServiceFileWrapper.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+        content = b"".join(ns2b("{0:0>9d}\n".format(i)) for i in range(50000))
+        filed = tempfile.TemporaryFile()
+        filed.write(content)
+        wrappers = []
+        others = []
+
+        def wsgiApp(environ, start_response):
+            if environ['PATH_INFO'] == '/small':  # not regular file
+                start_response('200 OK', [('Content-type','text/plain'),
+                                          ('Content-length', '7')])
+                return environ['wsgi.file_wrapper'](io.BytesIO(b"abcdefg"), 3)
+            if environ['PATH_INFO'] in ('/long', '/shrink'):
+                other = tempfile.TemporaryFile()
+                other.write(content[-100:])
+                other.seek(10)
+                others.append(other)
+                wrapper = environ['wsgi.file_wrapper'](other)
+                wrappers.append(wrapper)
+                headers = [('Content-type','text/plain')]
+                if environ['PATH_INFO'] == '/long':  # more than file remainder
+                    headers.append(('Content-length', '1000000'))
+                start_response('200 OK', headers)
+                return wrapper
+            filed.seek(10)  # serve from current position
+            wrapper = environ['wsgi.file_wrapper'](filed)
+            wrappers.append(wrapper)
+            start_response('200 OK', [('Content-type','text/plain')])
+            return wrapper
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        beta = tcp.Client(ha=alpha.servant.eha, bufsize=131072)
+        self.assertIs(beta.reopen(), True)
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.05)
+
+        beta.tx(b"GET /big HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        while not beta.rxbs.endswith(content[-10:]):
+            beta.serviceTxes()
+            time.sleep(0.01)
+            alpha.serviceAll()
+            beta.serviceReceives()
+
+        responder = alpha.reps.values()[0]
+        self.assertIs(responder.filer, wrappers[0])
+        self.assertIs(responder.ended, True)
+        self.assertEqual(responder.size, len(content) - 10)
+        self.assertIs(filed.closed, True)  # closed when sent
+        head, sep, body = bytes(beta.rxbs).partition(b"\r\n\r\n")
+        self.assertTrue(head.startswith(b"HTTP/1.1 200 OK\r\n"))
+        self.assertIn(b"\r\nContent-Length: 499990", head)
+        self.assertNotIn(b"Transfer-Encoding", head)
+        self.assertEqual(body, content[10:])
+        beta.clearRxbs()
+
+        wrapper = serving.FileWrapper(io.BytesIO(b"abcdefg"), blksize=3)
+        self.assertIs(wrapper.fileno(), None)  # not regular file so iterated
+        self.assertEqual(list(wrapper), [b"abc", b"def", b"g"])
+
+        beta.tx(b"GET /small HTTP/1.1\r\nHost: localhost\r\n\r\n")  # persisted connection
+        while not beta.rxbs.endswith(b"abcdefg"):
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+            beta.serviceReceives()
+        self.assertIs(alpha.reps.values()[0].filer, None)
+        beta.clearRxbs()
+
+        # Content-Length beyond file remainder corrected before head sent
+        beta.tx(b"GET /long HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        while not beta.rxbs.endswith(content[-10:]):
+            beta.serviceTxes()
+            time.sleep(0.01)
+            alpha.serviceAll()
+            beta.serviceReceives()
+        head, sep, body = bytes(beta.rxbs).partition(b"\r\n\r\n")
+        self.assertIn(b"\r\nContent-Length: 90\r\n", head)
+        self.assertEqual(body, content[-90:])
+        self.assertEqual(alpha.reps.values()[0].length, 90)
+        self.assertIs(alpha.reps.values()[0].ended, True)
+        beta.clearRxbs()
+
+        # file shrinks after head sent so connection closed not spun
+        beta.tx(b"GET /shrink HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        while len(wrappers) < 3 or alpha.reps.values()[0].filer is not wrappers[2]:
+            beta.serviceTxes()
+            time.sleep(0.01)
+            alpha.serviceAll()
+        responder = alpha.reps.values()[0]
+        self.assertEqual(responder.size, 0)
+        others[-1].truncate(0)
+        for i in range(10):
+            alpha.serviceAll()
+            if beta.ca not in alpha.servant.ixes:
+                break
+            time.sleep(0.01)
+        self.assertIs(responder.closed, True)
+        self.assertIs(others[-1].closed, True)
+        self.assertNotIn(beta.ca, alpha.reps)
+        self.assertNotIn(beta.ca, alpha.servant.ixes)  # connection closed
+
+        alpha.servant.closeAll()
+        beta.close()
+
+    def testValetServiceBackpressure(self):
+        """
+        Test Valet WSGI responder stops advancing app iterator above highwater
+        """
+        console.terse("{0}\n".format(self.testValetServiceBackpressure.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        store = storing.Store(stamp=0.0)
+        block = b"data: " + b"x" * 16378 + b"\n\n"  # 16 KiB event
+        blocks = 400
+        yields = []
+
+        def wsgiApp(environ, start_response):
+            start_response('200 OK', [('Content-type','text/event-stream'),
+                                      ('Content-length', str(len(block) * blocks))])
+            for i in range(blocks):
+                yields.append(i)
+                yield block
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=8192,
+                              store=store,
+                              app=wsgiApp,
+                              highwater=65536)
+        self.assertEqual(alpha.highwater, 65536)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        beta = tcp.Client(ha=alpha.servant.eha, bufsize=8192)
+        self.assertIs(beta.reopen(), True)
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.05)
+
+        beta.tx(b"GET /stream HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        while not alpha.reps:
+            beta.serviceTxes()
+            time.sleep(0.05)
+            alpha.serviceAll()
+
+        ix = alpha.servant.ixes.values()[0]
+        responder = alpha.reps.values()[0]
+        self.assertEqual(responder.highwater, 65536)
+        self.assertEqual(responder.lowwater, 32768)
+        for i in range(blocks):  # client not receiving
+            alpha.serviceAll()
+            self.assertLess(ix.unsent, 65536 + len(block) + 512)  # head
+        self.assertIs(responder.throttled, True)
+        self.assertLess(len(yields), blocks)  # app iterator held back
+        stats = alpha.stats[beta.ca]
+        self.assertEqual(stats['unsent'], ix.unsent)
+        self.assertIs(stats['throttled'], True)
+        self.assertEqual(stats['throttles'], 1)
+        self.assertGreaterEqual(stats['peak'], 65536)
+
+        received = bytearray()
+        while True:  # client receiving so drains
+            alpha.serviceAll()
+            beta.serviceReceives()
+            received.extend(beta.rxbs)
+            beta.clearRxbs()
+            index = received.find(b"\r\n\r\n")
+            if index >= 0 and len(received) - index - 4 >= len(block) * blocks:
+                break
+        self.assertEqual(received[index + 4:], block * blocks)
+        self.assertEqual(len(yields), blocks)
+        self.assertIs(responder.ended, True)
+        self.assertLess(responder.peak, 65536 + len(block) + 512)
+
+        alpha.servant.closeAll()
+        beta.close()
+
     def testValetServiceBottleSecure(self):
         """
         Test Valet WSGI service secure TLS request response
@@ -1284,6 +1696,11 @@ def runSome():
              'testValetServiceBottleNonPersistent',
              'testValetServiceBottleStream',
              'testValetServiceBasicSecure',
+             'testValetServiceSelected',
+             'testInputStream',
+             'testValetServiceStreamable',
+             'testValetServiceFileWrapper',
+             'testValetServiceBackpressure',
              'testValetServiceBottleSecure',
              'testValetServiceBottleStreamSecure',
             ]
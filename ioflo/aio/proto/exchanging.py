@@ -4,6 +4,7 @@ Exchange Base Class Package
 """
 from __future__ import absolute_import, division, print_function
 
+import math
 import struct
 from binascii import hexlify
 from collections import deque
@@ -20,6 +21,278 @@ from .protoing import MixIn
 console = getConsole()
 
 
+class TimingWheel(object):
+    """
+    Hashed timing wheel of keys scheduled to expire at relative time stamps
+    of .stamper. Each key is held in the slot of the tick of its expiration
+    so .expire only visits the slots of ticks elapsed since it was last called
+    instead of every scheduled key.
+
+    Class Attributes:
+        .Tick is default tick duration seconds of each slot
+        .Size is default number of slots
+
+    Attributes:
+        .stamper is relative time stamper with .stamp
+        .tick is tick duration seconds of each slot
+        .size is number of slots
+        .slots is list of dicts of expiration stamps keyed by key
+        .ticks is dict of scheduled ticks keyed by key
+        .cursor is tick of oldest slot not yet fully expired
+    """
+    Tick = 0.05
+    Size = 256
+
+    def __init__(self, stamper, tick=None, size=None):
+        """
+        Initialization method for instance.
+
+        Parameters:
+            stamper is relative time stamper with .stamp
+            tick is tick duration seconds of each slot
+            size is number of slots
+        """
+        self.stamper = stamper
+        self.tick = float(tick) if tick is not None else self.Tick
+        self.size = int(size) if size is not None else self.Size
+        self.slots = [dict() for i in range(self.size)]
+        self.ticks = dict()
+        self.cursor = self.tickOf(self.stamper.stamp)
+
+    def __len__(self):
+        """
+        Returns number of scheduled keys
+        """
+        return len(self.ticks)
+
+    def __contains__(self, key):
+        """
+        Returns True if key is scheduled
+        """
+        return key in self.ticks
+
+    def tickOf(self, stamp):
+        """
+        Returns tick of time stamp
+        """
+        return int(stamp // self.tick)
+
+    def schedule(self, key, when):
+        """
+        Schedule key to expire at time stamp when replacing any prior schedule
+        """
+        self.cancel(key)
+        tick = max(self.tickOf(when), self.cursor)
+        self.slots[tick % self.size][key] = when
+        self.ticks[key] = tick
+
+    def cancel(self, key):
+        """
+        Unschedule key if scheduled. Returns True if was scheduled
+        """
+        tick = self.ticks.pop(key, None)
+        if tick is None:
+            return False
+        del self.slots[tick % self.size][key]
+        return True
+
+    def expire(self):
+        """
+        Returns list of keys whose expiration is at or before .stamper.stamp in
+        order of expiration and unschedules them
+        """
+        now = self.stamper.stamp
+        last = self.tickOf(now)
+        expired = []
+        if self.ticks:
+            first = self.cursor if (last - self.cursor) < self.size else last - self.size + 1
+            for tick in range(first, last + 1):
+                slot = self.slots[tick % self.size]
+                if slot:
+                    for key, when in list(slot.items()):
+                        if when <= now:
+                            expired.append((when, key))
+                            del slot[key]
+                            del self.ticks[key]
+            expired.sort(key=lambda x: x[0])
+        self.cursor = last  # slot of last tick may hold later expirations
+        return [key for when, key in expired]
+
+
+class ExchangeTable(object):
+    """
+    Indexed table of in flight exchanges keyed by (device uid, exchange uid)
+    The next timeout or redo deadline of each exchange is scheduled on a shared
+    TimingWheel so .service only processes exchanges whose deadline expired.
+    Per device uid tallies provide in flight count, timeout rate and round
+    trip time percentiles.
+
+    Class Attributes:
+        .RttSize is default number of recent round trip times kept per device
+
+    Attributes:
+        .stamper is relative time stamper with .stamp
+        .exchanges is odict of exchanges keyed by (device uid, exchange uid)
+        .wheel is TimingWheel of exchange deadlines
+        .rttSize is number of recent round trip times kept per device
+        .tallies is odict keyed by device uid of odict tallies
+    """
+    RttSize = 256
+
+    def __init__(self, stamper, tick=None, size=None, rttSize=None):
+        """
+        Initialization method for instance.
+
+        Parameters:
+            stamper is relative time stamper with .stamp
+            tick is tick duration seconds of .wheel slots
+            size is number of .wheel slots
+            rttSize is number of recent round trip times kept per device
+        """
+        self.stamper = stamper
+        self.exchanges = odict()
+        self.wheel = TimingWheel(stamper=stamper, tick=tick, size=size)
+        self.rttSize = rttSize if rttSize is not None else self.RttSize
+        self.tallies = odict()
+
+    def __len__(self):
+        """
+        Returns number of in flight exchanges
+        """
+        return len(self.exchanges)
+
+    def __contains__(self, key):
+        """
+        Returns True if exchange at key (device uid, exchange uid) in flight
+        """
+        return key in self.exchanges
+
+    def get(self, uid, xid, default=None):
+        """
+        Returns in flight exchange with device uid and exchange uid xid
+        or default if none
+        """
+        return self.exchanges.get((uid, xid), default)
+
+    def tallyOf(self, uid):
+        """
+        Returns odict of tallies for device uid creating if needed
+        """
+        tally = self.tallies.get(uid)
+        if tally is None:
+            tally = self.tallies[uid] = odict([('inflight', 0),
+                                               ('started', 0),
+                                               ('finished', 0),
+                                               ('failed', 0),
+                                               ('timeouts', 0),
+                                               ('rtts', deque(maxlen=self.rttSize))])
+        return tally
+
+    def add(self, exchange):
+        """
+        Add exchange to table and schedule its deadline
+        """
+        key = exchange.key
+        if key in self.exchanges:
+            emsg = "Cannot add exchange at '{0}', already exists.".format(key)
+            raise ValueError(emsg)
+        self.exchanges[key] = exchange
+        exchange.table = self
+        tally = self.tallyOf(key[0])
+        tally['inflight'] += 1
+        tally['started'] += 1
+        self.schedule(exchange)
+        return exchange
+
+    def schedule(self, exchange):
+        """
+        Reschedule exchange on .wheel at its next deadline if any
+        """
+        when = exchange.deadline
+        if when is None:
+            self.wheel.cancel(exchange.key)
+        else:
+            self.wheel.schedule(exchange.key, when)
+
+    def remove(self, exchange):
+        """
+        Remove exchange from table and tally its outcome.
+        Returns True if removed
+        """
+        key = exchange.key
+        if self.exchanges.get(key) is not exchange:
+            return False
+        del self.exchanges[key]
+        self.wheel.cancel(key)
+        exchange.table = None
+        tally = self.tallyOf(key[0])
+        tally['inflight'] -= 1
+        if exchange.done:
+            tally['finished'] += 1
+            if exchange.failed:
+                tally['failed'] += 1
+                if exchange.timedout:
+                    tally['timeouts'] += 1
+            else:
+                tally['rtts'].append(exchange.timer.elapsed)
+        return True
+
+    def service(self):
+        """
+        Process exchanges whose deadline expired and reschedule those still
+        in flight. Returns number processed
+        """
+        count = 0
+        for key in self.wheel.expire():
+            exchange = self.exchanges.get(key)
+            if exchange is None:
+                continue
+            exchange.process()
+            count += 1
+            if exchange.table is self:  # still in flight
+                self.schedule(exchange)
+        return count
+
+    @property
+    def stats(self):
+        """
+        Returns odict keyed by device uid of odicts of exchange statistics
+            inflight = number of exchanges in flight
+            started = number of exchanges added
+            finished = number of exchanges done
+            failed = number of finished exchanges that failed
+            timeouts = number of failed exchanges that timed out
+            timeoutRate = timeouts / finished
+            rtt50, rtt90, rtt99 = percentiles of recent successful exchange
+                round trip times or None if none
+        """
+        stats = odict()
+        for uid, tally in self.tallies.items():
+            rtts = sorted(tally['rtts'])
+            stat = odict([('inflight', tally['inflight']),
+                          ('started', tally['started']),
+                          ('finished', tally['finished']),
+                          ('failed', tally['failed']),
+                          ('timeouts', tally['timeouts']),
+                          ('timeoutRate', (tally['timeouts'] / tally['finished']
+                                           if tally['finished'] else 0.0))])
+            for name, fraction in (('rtt50', 0.5), ('rtt90', 0.9), ('rtt99', 0.99)):
+                stat[name] = percentile(rtts, fraction)
+            stats[uid] = stat
+        return stats
+
+
+def percentile(values, fraction):
+    """
+    Returns nearest rank percentile fraction in [0.0, 1.0] of sorted
+    sequence values or None if empty
+    """
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, int(math.ceil(fraction * len(values))) - 1))
+    return values[index]
+
+
 class Exchange(MixIn):
     """
     Exchange (pseudo transaction) base class for exchanges
@@ -33,7 +306,7 @@ class Exchange(MixIn):
                  name=None,
                  device=None,
                  timeout=None,
-                 redoTimout=None,
+                 redoTimeout=None,
                  tx=None,
                  rx=None):
         """
@@ -72,11 +345,15 @@ class Exchange(MixIn):
             .tx is latest/next transmitted msg/pkt/data
             .done is True If done  False otherwise
             .failed is True If failed False otherwise
+            .timedout is True If failed by timeout False otherwise
             .acked is True if ack has been sent
+            .table is ExchangeTable holding exchange while in flight if any
 
         Inherited Properties
 
         Properties
+            .key is duple (device uid, exchange uid) of exchange in .table
+            .deadline is stamp of next timeout or redo or None if neither
 
         """
         self.stack = stack
@@ -85,21 +362,53 @@ class Exchange(MixIn):
         self.device = device
         self.timeout = timeout if timeout is not None else self.Timeout
         self.timer = StoreTimer(stack.stamper, duration=self.timeout)
-        self.redoTimeout = redoTimeout if redoTimout is not None else self.RedoTimeout
+        self.redoTimeout = redoTimeout if redoTimeout is not None else self.RedoTimeout
         self.redoTimer = StoreTimer(stack.stamper, duration=self.redoTimeout)
         self.rx = rx  # latest received
         self.tx = tx  # initial to transmit
         self.done = False
         self.failed = False
+        self.timedout = False
         self.acked = False
+        self.table = None
+
+    @property
+    def key(self):
+        """
+        Returns duple (device uid, exchange uid) that indexes exchange
+        """
+        return (self.device.uid if self.device is not None else None, self.uid)
+
+    @property
+    def deadline(self):
+        """
+        Returns stamp of next timeout or redo or None if neither
+        """
+        stops = []
+        if self.timeout > 0.0:
+            stops.append(self.timer.stop)
+        if self.redoTimeout > 0.0:
+            stops.append(self.redoTimer.stop)
+        return min(stops) if stops else None
 
     def prepStart(self):
         """
-        Set flags for start
+        Set flags for start and register in .stack.exchanges table if any
         """
         self.done = False
         self.failed = False
+        self.timedout = False
         self.acked = False
+        table = getattr(self.stack, 'exchanges', None)
+        if table is not None and self.table is None:
+            table.add(self)
+
+    def schedule(self):
+        """
+        Reschedule deadline in .table if any
+        """
+        if self.table is not None:
+            self.table.schedule(self)
 
     def start(self):
         """
@@ -121,6 +430,7 @@ class Exchange(MixIn):
         if self.timeout > 0.0 and self.timer.expired:
             console.verbose("{0}. Timed out with {1} at {2}\n".format(
                     self.stack.name, self.device.name, round(self.stack.stamper.stamp, 3)))
+            self.timedout = True
             self.fail()
             return
 
@@ -203,9 +513,11 @@ class Exchange(MixIn):
 
     def prepFinish(self):
         """
-        Mark flags
+        Mark flags and remove from .table if any
         """
         self.done = True
+        if self.table is not None:
+            self.table.remove(self)
 
     def finish(self):
         """
@@ -289,6 +601,7 @@ class Exchanger(Exchange):
 
         self.timer.restart()
         self.redoTimer.restart()
+        self.schedule()
         console.verbose("{0}: Initiating {1} with {2} at {3}.\n".format(self.stack.name,
                                             self.name,
                                             self.device.name,
@@ -357,6 +670,7 @@ class Exchangent(Exchange):
 
         self.timer.restart()
         self.redoTimer.restart()
+        self.schedule()
         console.verbose("{0}: Corresponding {1} with {2} at {3}.\n".format(self.stack.name,
                                             self.name,
                                             self.device.name,
@@ -11,13 +11,25 @@ import enum
 
 from ...aid.sixing import *
 from ...aid.odicting import odict
-from ...aid.byting import bytify, unbytify, packify, packifyInto, unpackify
+from ...aid.byting import (bytify, unbytify, packify, packifyInto, unpackify,
+                           compilePackifier)
 from ...aid import getConsole
 from .protoing import MixIn
 
 console = getConsole()
 
 
+_packers = {}  # compiled struct packers keyed by format string
+
+def compilePacker(fmt):
+    """
+    Returns cached compiled struct.Struct for struct format string fmt
+    """
+    packer = _packers.get(fmt)
+    if packer is None:
+        packer = _packers[fmt] = struct.Struct(fmt)
+    return packer
+
 
 class Part(MixIn):
     """
@@ -94,7 +106,7 @@ class PackerPart(Part):
 
         Attributes:
             .fmt is struct format string
-            .packer is compiled struct packer
+            .packer is compiled struct packer shared by all parts with .fmt
 
         Class Attributes:
             .Format is struct packer format string for packed
@@ -104,7 +116,7 @@ class PackerPart(Part):
 
         """
         self.fmt = fmt if fmt is not None else self.Format
-        self.packer = struct.Struct(self.fmt) #precompile struct for packing unpacking
+        self.packer = compilePacker(self.fmt)  # cached precompiled struct
         kwa['size'] = self.packer.size  # override size to match .packer.size
         super(PackerPart, self).__init__(**kwa)
 
@@ -145,6 +157,46 @@ class PackerPart(Part):
                              "format={1}".format(self.size, self.packer.size))
         return self.packed
 
+    @classmethod
+    def packMany(cls, records, fmt=None):
+        """
+        Returns bytearray of each sequence of field values in records packed
+        contiguously with struct format fmt or .Format if None
+        """
+        packer = compilePacker(fmt if fmt is not None else cls.Format)
+        size = packer.size
+        b = bytearray(size * len(records))
+        offset = 0
+        for record in records:
+            packer.pack_into(b, offset, *record)
+            offset += size
+        return b
+
+    @classmethod
+    def parseMany(cls, raw, fmt=None, offset=0, count=None):
+        """
+        Returns list of tuples of field values unpacked from count contiguous
+        records in raw starting at offset with struct format fmt or .Format
+        if None. If count is None unpacks as many whole records as raw holds.
+        """
+        packer = compilePacker(fmt if fmt is not None else cls.Format)
+        size = packer.size
+        if not size:
+            return []
+        available = (len(raw) - offset) // size
+        if count is None:
+            count = available
+        elif count > available:
+            raise ValueError("Parse Packer: Not enough raw data for {0} records. "
+                             "Need {1} bytes, got {2} bytes.".format(count,
+                                                    size * count,
+                                                    len(raw) - offset))
+        view = memoryview(raw)
+        try:
+            return list(packer.iter_unpack(view[offset:offset + size * count]))
+        finally:
+            view.release()
+
 
 class PackifierPart(Part):
     """
@@ -193,7 +245,7 @@ class PackifierPart(Part):
 
         Attributes:
             .fmt is packify format string
-            .fmtSize is size given by format string
+            .packifier is compiled Packifier shared by all parts with .fmt
 
         Inherited Properties:
             .size is length of .packed
@@ -203,6 +255,7 @@ class PackifierPart(Part):
 
         """
         self.fmt = fmt if fmt is not None else self.Format
+        self.packifier = compilePackifier(self.fmt)  # cached precompiled bit fields
         kwa['size'] = self.fmtSize  # override size to match packify size of whole bytes
         super(PackifierPart, self).__init__(**kwa)
 
@@ -214,9 +267,7 @@ class PackifierPart(Part):
         """
         Property fmtSize
         """
-        tbfl = sum((int(x) for x in self.fmt.split()))
-        size = (tbfl // 8) + 1 if tbfl % 8 else tbfl // 8
-        return size
+        return compilePackifier(self.fmt).size
 
     def verifySize(self, raw=bytearray(b'')):
         """
@@ -234,7 +285,7 @@ class PackifierPart(Part):
                              "Need {0} bytes, got {1} bytes.".format(self.size,
                                                                      len(raw)))
 
-        result = unpackify(self.fmt, raw, boolean=True, size=self.fmtSize)  # empty result
+        result = self.packifier.unpack(raw, boolean=True)  # empty result
         self.packed[:] = raw[0:self.size]
 
         return self.size #return offset to start of unparsed portion of data
@@ -244,13 +295,32 @@ class PackifierPart(Part):
         Return .packed with data if any
         Base method to be overridden in sub class
         """
-        size = packifyInto(self.packed, fmt=self.fmt, fields=())
+        size = self.packifier.packInto(self.packed, fields=())
 
         if self.size != size :
             raise ValueError("Build Packifier: size packed={0} not match "
                              "format={1}".format(self.size, size))
         return self.packed
 
+    @classmethod
+    def packMany(cls, records, fmt=None):
+        """
+        Returns bytearray of each sequence of bit field values in records
+        packed contiguously with packify format fmt or .Format if None
+        """
+        return compilePackifier(fmt if fmt is not None else cls.Format).packMany(records)
+
+    @classmethod
+    def parseMany(cls, raw, fmt=None, offset=0, count=None):
+        """
+        Returns list of tuples of bit field values unpacked from count
+        contiguous records in raw starting at offset with packify format fmt
+        or .Format if None. If count is None unpacks as many whole records
+        as raw holds.
+        """
+        packifier = compilePackifier(fmt if fmt is not None else cls.Format)
+        return packifier.unpackMany(raw, offset=offset, count=count, boolean=True)
+
     def show(self):
         """
         Returns descriptive string for display purposes
@@ -15,14 +15,14 @@ import socket
 
 from ...aid.sixing import *
 from ...aid.odicting import odict
-from ...aid.byting import bytify, unbytify, packify, unpackify
+from ...aid.byting import bytify, unbytify, packify, unpackify, Bytebuffer
 from ...aid.eventing import eventify, tagify
 from ...aid.timing import tuuid, Stamper, StoreTimer
 from ...aid import getConsole
 from ..udp import udping
 from ..tcp import clienting, serving
 from .protoing import MixIn
-from . import devicing, packeting
+from . import devicing, packeting, exchanging
 
 
 console = getConsole()
@@ -34,6 +34,8 @@ class Stack(MixIn):
     Should be subclassed for specific transport type
     """
     Uid = 0  # base for next unique id
+    Compaction = 65536  # read cursor offset at which stream buffer is compacted
+    RawViews = True  # framize parserizes transient memoryviews else bytes copies
 
     def __init__(self,
                  stamper=None,
@@ -127,6 +129,7 @@ class Stack(MixIn):
         self.local.stack = self  # in case passed up from subclass
 
         self.rxbs = rxbs if rxbs is not None else bytearray()
+        self.rxCursor = 0  # read cursor offset into .rxbs of unparsed data
         self.rxPkts = rxPkts if rxPkts is not None else deque()
         self.rxMsgs = rxMsgs if rxMsgs is not None else deque()
         self.txbs = txbs if txbs is not None else bytearray()
@@ -285,8 +288,9 @@ class Stack(MixIn):
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
+                                    hexlify(self.txbs[:count]).decode('ascii')))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -394,28 +398,69 @@ class Stack(MixIn):
         Clear .rxbs
         """
         del self.rxbs[:]  # self.rxbs.clear() not supported before python 3.3
+        self.rxCursor = 0
 
     def parserize(self, raw):
         """
         Returns packet parsed from raw data
+        When .RawViews raw from .framize is a transient memoryview that is
+        released once parserize returns so copy out of raw, do not keep it.
         Override in subclass
         """
         packet = packeting.Packet(stack=self)
         try:
             packet.parse(raw=raw)
         except ValueError as ex:
-            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, raw, ex)
+            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name,
+                                                             bytes(raw), ex)
             console.terse(emsg)
             self.incStat("pkt_parse_error")
             return None
         return packet
 
+    def framize(self, rxbs, cursor=0):
+        """
+        Returns duple (packets, cursor) of list of packets parserized in order
+        from stream receive buffer rxbs starting at read cursor offset and
+        the advanced read cursor.
+        When .RawViews parserizes memoryview slices so received data is only
+        copied into each packet. Each slice is released once parserize returns
+        so overrides must not keep raw. Otherwise parserizes bytes copies that
+        overrides may keep or treat as bytes.
+        Parsed data is deleted from rxbs only once cursor reaches
+        .Compaction or all of rxbs is parsed.
+        rxbs is bytearray or Bytebuffer
+        """
+        packets = []
+        view = rxbs[:] if isinstance(rxbs, Bytebuffer) else memoryview(rxbs)
+        try:
+            size = len(view)
+            while cursor < size:
+                raw = view[cursor:]
+                try:
+                    packet = self.parserize(raw if self.RawViews else raw.tobytes())
+                finally:
+                    raw.release()  # so kept raw does not pin rxbs
+                if packet is None or not packet.size:  # not enough for packet
+                    break
+                cursor += packet.size
+                packets.append(packet)
+        finally:
+            view.release()  # so rxbs may be resized
+
+        if cursor and (cursor >= size or cursor >= self.Compaction or
+                       isinstance(rxbs, Bytebuffer)):
+            del rxbs[:cursor]
+            cursor = 0
+        return (packets, cursor)
+
     def _serviceOneReceived(self):
         """
-        Service one received raw packet data or chunk from .handler
+        Service received raw packet data or chunks from .handler
         assumes that there is a .handler
         Override in subclass
         """
+        received = False
         while True:  # keep receiving until empty
             try:
                 raw = self.handler.receive()
@@ -423,17 +468,17 @@ class Stack(MixIn):
                 raise
 
             if not raw:
-                return False  # no received data
+                break  # no received data
+            received = True
             self.rxbs.extend(raw)
 
-        packet = self.parserize(self.rxbs[:])
-
-        if packet is not None:  # queue packet
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                                        hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+        packets, self.rxCursor = self.framize(self.rxbs, self.rxCursor)
+        for packet in packets:  # queue packets
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n".format(self.name,
+                                            hexlify(packet.packed).decode('ascii')))
             self.rxPkts.append(packet)
-        return True  # received data
+        return received  # received data
 
     def serviceReceives(self):
         """
@@ -557,6 +602,7 @@ class RemoteStack(Stack):
                  remotes=None,
                  nameRemotes=None,
                  haRemotes=None,
+                 exchanges=None,
                  **kwa
                 ):
         """
@@ -584,6 +630,7 @@ class RemoteStack(Stack):
             remotes is odict to hold remotes keyed by uid if any
             nameRemotes is odict to hold remotes keyed by name if any
             haRemotes is odict to remotes keyed by ha if any
+            exchanges is ExchangeTable of in flight exchanges if any
 
         Inherited Attributes:
             .stamper is relative time stamper for this stack
@@ -606,6 +653,8 @@ class RemoteStack(Stack):
             .uidRemotes is alias for .remotes
             .nameRemotes = odict  of remotes indexed by name
             .haRemotes = odict of remotes indexed by ha
+            .exchanges is ExchangeTable of in flight exchanges indexed by
+                (remote uid, exchange uid) with timing wheel of deadlines
 
 
         Inherited Properties:
@@ -630,6 +679,9 @@ class RemoteStack(Stack):
 
         super(RemoteStack, self).__init__(**kwa)
 
+        self.exchanges = (exchanges if exchanges is not None else
+                          exchanging.ExchangeTable(stamper=self.stamper))
+
     def _serviceOneTxPkt(self):
         """
         Service one (packet, ha) duple on .txPkts deque
@@ -646,8 +698,9 @@ class RemoteStack(Stack):
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
+                                    hexlify(self.txbs[:count]).decode('ascii')))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -742,6 +795,27 @@ class RemoteStack(Stack):
         self.incStat("pkt_received")
         message, remote = self.messagize(pkt, ha)
         if remote:
+            self.correspond(pkt, message, remote)
+
+    def exchangize(self, pkt, remote):
+        """
+        Returns exchange uid of in flight exchange with remote that rx packet
+        pkt belongs to or None if pkt is not part of an exchange
+        Override in subclass
+        """
+        return None
+
+    def correspond(self, pkt, message, remote):
+        """
+        Route message of rx packet pkt from remote to its in flight exchange
+        looked up in .exchanges by (remote uid, exchange uid) if any
+        Otherwise to remote
+        """
+        xid = self.exchangize(pkt, remote)
+        exchange = self.exchanges.get(remote.uid, xid) if xid is not None else None
+        if exchange is not None:
+            exchange.receive(message)
+        else:
             remote.receive(message)
 
     def _serviceOneRxMsg(self):
@@ -757,9 +831,12 @@ class RemoteStack(Stack):
     def serviceTimers(self):
         """
         Allow timer based processing
-        Call .process on all remotes to allow timer based processing
-        of their exchanges
+        Process only the exchanges in .exchanges whose deadline expired.
+        Exchanges register in .exchanges when started so remotes do not
+        poll them. Call .process on all remotes only for device level timer
+        based processing such as keep alives.
         """
+        self.exchanges.service()
         for remote in self.remotes.values():
             remote.process()
 
@@ -890,14 +967,26 @@ class KeepStack(RemoteStack):
                  name='',
                  uid=None,
                  ha=None,
+                 budget=None,
                  **kwa
                  ):
         '''
         Setup Stack instance
+
+        Parameters:
+            budget is max number of dirty remotes dumped per .serviceKeeps
+                or None to dump remotes synchronously
+
+        Attributes:
+            .budget is max number of dirty remotes dumped per .serviceKeeps
+            .dirties is odict of remotes pending dump keyed by name
         '''
         if getattr(self, 'puid', None) is None:
             self.puid = puid if puid is not None else self.Uid
 
+        self.budget = budget
+        self.dirties = odict()
+
         self.keep = keep or keeping.LotKeep(dirpath=dirpath,
                                             basedirpath=basedirpath,
                                             stackname=name)
@@ -932,7 +1021,7 @@ class KeepStack(RemoteStack):
         '''
         super(KeepStack, self).addRemote(remote=remote)
         if dump:
-            self.dumpRemote(remote)
+            self.stageRemote(remote)
         return remote
 
     def moveRemote(self, remote, new, clear=False, dump=False):
@@ -947,7 +1036,7 @@ class KeepStack(RemoteStack):
         if clear:
             self.keep.clearRemoteData(remote.name)
         if dump:
-            self.dumpRemote(remote=remote)
+            self.stageRemote(remote=remote)
 
     def renameRemote(self, remote, new, clear=True, dump=False):
         '''
@@ -955,10 +1044,12 @@ class KeepStack(RemoteStack):
         '''
         old = remote.name
         super(KeepStack, self).renameRemote(remote=remote, new=new)
+        if self.dirties.pop(old, None) is not None and not dump:
+            self.markRemote(remote)  # still pending under new name
         if clear:
             self.keep.clearRemoteData(old)
         if dump:
-            self.dumpRemote(remote=remote)
+            self.stageRemote(remote=remote)
 
     def removeRemote(self, remote, clear=True):
         '''
@@ -966,6 +1057,7 @@ class KeepStack(RemoteStack):
         If clear then also remove from disk
         '''
         super(KeepStack, self).removeRemote(remote=remote)
+        self.dirties.pop(remote.name, None)
         if clear:
             self.clearRemote(remote)
 
@@ -1021,18 +1113,76 @@ class KeepStack(RemoteStack):
         '''
         Dump keeps of remote
         '''
+        self.dirties.pop(remote.name, None)
         self.keep.dumpRemote(remote)
 
+    def markRemote(self, remote):
+        '''
+        Mark remote dirty so its keep is dumped by .flushRemotes
+        '''
+        self.dirties[remote.name] = remote
+
+    def stageRemote(self, remote):
+        '''
+        Dump keeps of remote now or mark dirty if dumps are batched by .budget
+        '''
+        if self.budget is None:
+            self.dumpRemote(remote)
+        else:
+            self.markRemote(remote)
+
     def dumpRemotes(self, clear=True):
         '''
         Dump all remotes data to keep files
-        If clear then clear all files first
+        If clear then clear all files first including stale keeps of remotes
+        removed or renamed without clear
+        If dumps are batched by .budget then mark all remotes dirty instead.
         '''
+        if clear:
+            self.clearStaleRemotes()
+        if self.budget is not None:
+            for remote in self.remotes.values():
+                self.markRemote(remote)
+            return
+
         if clear:
             self.clearRemotes()
         for remote in self.remotes.values():
             self.dumpRemote(remote)
 
+    def flushRemotes(self, budget=None):
+        '''
+        Dump keeps of up to budget dirty remotes in order marked
+        or all if budget is None. Returns number dumped
+        '''
+        names = list(self.dirties.keys())
+        if budget is not None:
+            names = names[:budget]
+        for name in names:
+            self.dumpRemote(self.dirties[name])
+        return len(names)
+
+    def serviceKeeps(self):
+        '''
+        Dump a slice of at most .budget dirty remotes
+        '''
+        if self.dirties:
+            self.flushRemotes(budget=self.budget)
+
+    def serviceTimers(self):
+        '''
+        Allow timer based processing and batched keep dumps
+        '''
+        super(KeepStack, self).serviceTimers()
+        self.serviceKeeps()
+
+    def close(self):
+        '''
+        Dump all dirty remotes then close handler if any
+        '''
+        self.flushRemotes()
+        super(KeepStack, self).close()
+
     def restoreRemote(self, name):
         '''
         Load, add, and return remote with name if any
@@ -1082,6 +1232,16 @@ class KeepStack(RemoteStack):
         for remote in self.remotes.values():
             self.clearRemote(remote)
 
+    def clearStaleRemotes(self):
+        '''
+        Clear remote keeps whose names are not in .nameRemotes
+        '''
+        keeps = self.keep.loadAllRemoteData()
+        if keeps:
+            for name in list(keeps.keys()):
+                if name not in self.nameRemotes:
+                    self.keep.clearRemoteData(name)
+
     def clearRemoteKeeps(self):
         '''
         Clear all remote keeps
@@ -1247,6 +1407,7 @@ class TcpServerStack(RemoteStack, IpStack):
         Attributes:
             .eha is external host address used by server acceptor TLS if any
             .bufsize is tcp socket buffer size
+            .rxCursors is dict of read cursors into incomer .rxbs keyed by ca
 
         Inherited Properties:
             .uid is local device unique id as stack uid
@@ -1260,6 +1421,7 @@ class TcpServerStack(RemoteStack, IpStack):
         """
         self.eha = eha
         self.bufsize = bufsize  # create server needs to setup before super call
+        self.rxCursors = dict()  # read cursors into incomer .rxbs keyed by ca
         super(TcpServerStack, self).__init__(host=host, **kwa)
 
     def createHandler(self, ha):
@@ -1282,14 +1444,16 @@ class TcpServerStack(RemoteStack, IpStack):
         try:
             self.handler.transmitIx(self, pkt.packed, ca)
         except ValueError as ex:
-            console.profuse("{0}: Error sending to {1}\n{2}\n".format(self.name,
-                                                                      ca,
-                                                                      ex))
+            console.profuse("{0}: Error sending to {1}\n{2}\n",
+                            self.name,
+                            ca,
+                            ex)
             raise
 
-        console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
-                                                               ca,
-                                hexlify(pkt.packed).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
+                                                                   ca,
+                                    hexlify(pkt.packed).decode('ascii')))
         return True  # never blocks
 
     def _serviceOneReceived(self, ix, ca):
@@ -1300,16 +1464,14 @@ class TcpServerStack(RemoteStack, IpStack):
         if not ix.rxbs:
             return False  # no data
 
-        packet = self.parserize(ix.rxbs[:])
-        if packet is None:  # not enough for packet
-            return False
-
-        console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                            hexlify(ix.rxbs[:packet.size]).decode('ascii')))
-
-        del ix.rxbs[:packet.size]
-        self.rxPkts.append((packet, ca))  # queue packet
-        return True  # received data
+        packets, cursor = self.framize(ix.rxbs, self.rxCursors.get(ca, 0))
+        self.rxCursors[ca] = cursor
+        for packet in packets:  # queue packets
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n".format(self.name,
+                                    hexlify(packet.packed).decode('ascii')))
+            self.rxPkts.append((packet, ca))
+        return False  # all received data parsed
 
     def serviceReceives(self):
         """
@@ -1334,6 +1496,7 @@ class TcpServerStack(RemoteStack, IpStack):
         Close and remove connection given by ca
         """
         self.handler.removeIx(ca)
+        self.rxCursors.pop(ca, None)
         if ca in self.haRemotes:
             self.removeRemote(self.haRemotes[ca])
 
@@ -1444,8 +1607,9 @@ class ClientStreamStack(Stack):
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                    hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
+                                        hexlify(self.txbs[:count]).decode('ascii')))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -1457,13 +1621,16 @@ class ClientStreamStack(Stack):
     def parserize(self, raw):
         """
         Returns packet parsed from raw data
+        When .RawViews raw from .framize is a transient memoryview that is
+        released once parserize returns so copy out of raw, do not keep it.
         Override in subclass
         """
         packet = packeting.Packet(stack=self)
         try:
             packet.parse(raw=raw)
         except ValueError as ex:
-            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, raw, ex)
+            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name,
+                                                             bytes(raw), ex)
             console.terse(emsg)
             self.incState("pkt_parse_error")
             return None
@@ -1490,12 +1657,11 @@ class ClientStreamStack(Stack):
         if not received:  # nothing changed
             return False
 
-        packet = self.parserize(self.rxbs[:])
-
-        if packet is not None:  # queue packet
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                            hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+        packets, self.rxCursor = self.framize(self.rxbs, self.rxCursor)
+        for packet in packets:  # queue packets
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n".format(self.name,
+                                hexlify(packet.packed).decode('ascii')))
             self.rxPkts.append(packet)
         return True  # received data
 
@@ -1660,8 +1826,9 @@ class TcpClientStack(ClientStreamStack, IpStack):
         except socket.error as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                    hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
+                                        hexlify(self.txbs[:count]).decode('ascii')))
 
         if count < len(self.txbs):  # partially blocked try again later
             del self.txbs[:count]  # delete sent portion
@@ -1707,13 +1874,12 @@ class TcpClientStack(ClientStreamStack, IpStack):
         if not received:  # nothing changed
             return False
 
-        packet = self.parserize(self.rxbs[:])
-
-        if packet is not None:  # queue packet
-            console.profuse("{0}: received from {1}\n    0x{2}\n".format(self.name,
-                                                                     self.remote.ha,
-                            hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+        packets, self.rxCursor = self.framize(self.rxbs, self.rxCursor)
+        for packet in packets:  # queue packets
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received from {1}\n    0x{2}\n".format(self.name,
+                                                                         self.remote.ha,
+                                hexlify(packet.packed).decode('ascii')))
             self.rxPkts.append(packet)
         return True  # received data
 
@@ -1771,8 +1937,11 @@ class GramStack(Stack):
     Datagram based stack object.
     Should be subclassed for specific transport type
     """
+    Budget = 64  # default max datagrams per batch when batched
 
     def __init__(self,
+                 batched=False,
+                 budget=None,
                  **kwa):
         """
         Setup Stack instance
@@ -1795,6 +1964,9 @@ class GramStack(Stack):
             stats is odict of stack statistics if any
 
         Parameters:
+            batched is Boolean True means handler receives and sends batches
+                of datagrams per call
+            budget is max datagrams per batch when batched
 
         Inherited Attributes:
             .stamper is relative time stamper for this stack
@@ -1812,6 +1984,8 @@ class GramStack(Stack):
             .aha is normalized accepting (listening) host address for .handler if applicable
 
         Attributes:
+            .batched is Boolean True means batched handler receives and sends
+            .budget is max datagrams per batch when batched
 
         Inherited Properties:
             .uid is local device unique id as stack uid
@@ -1823,6 +1997,8 @@ class GramStack(Stack):
 
 
         """
+        self.batched = True if batched else False
+        self.budget = budget if budget is not None else self.Budget
         super(GramStack, self).__init__(**kwa)
 
     def _serviceOneTxPkt(self, laters, blockeds):
@@ -1859,19 +2035,78 @@ class GramStack(Stack):
             else:
                 raise
 
-        console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
-                                                          ha,
-                                                          hexlify(pkt.packed).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
+                                                              ha,
+                                                              hexlify(pkt.packed).decode('ascii')))
         return True  # not blocked
 
+    def _serviceBatchTxPkts(self, laters, blockeds):
+        """
+        Service one batch of up to .budget (packet, ha) duples on .txPkts deque
+        sent with one handler call
+        Packets are assumed to be packed already in .packed
+        laters is deque of packed packets to try again later
+        blockeds is list of ha destinations that have already blocked on this pass
+        Returns False if nothing left to send this pass
+        """
+        pkts = []
+        while self.txPkts and len(pkts) < self.budget:
+            pkt, ha = self.txPkts.popleft()
+            if ha in blockeds: # already blocked on this iteration
+                laters.append((pkt, ha)) # keep sequential
+            else:
+                pkts.append((pkt, ha))
+        if not pkts:
+            return False
+
+        try:
+            count = self.handler.sendBatch([(pkt.packed, ha) for pkt, ha in pkts])
+        except socket.error as ex:
+            # ex.args[0] is always ex.errno for better compat
+            if (ex.args[0] in (errno.ECONNREFUSED,
+                               errno.ECONNRESET,
+                               errno.ENETRESET,
+                               errno.ENETUNREACH,
+                               errno.EHOSTUNREACH,
+                               errno.ENETDOWN,
+                               errno.EHOSTDOWN,
+                               errno.ETIMEDOUT,
+                               errno.ETIME)):
+                # problem sending such as busy with last message. save it for later
+                laters.append(pkts[0])
+                blockeds.append(pkts[0][1])
+                count = 1
+            else:
+                raise
+        else:
+            self.incStat("batch_sent")
+            self.incStat("gram_sent", count)
+            if count > self.stats.get("batch_sent_max", 0):
+                self.updateStat("batch_sent_max", count)
+
+            if console._verbosity >= console.Wordage.profuse:
+                for pkt, ha in pkts[:count]:
+                    console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
+                                                                      ha,
+                                                                      hexlify(pkt.packed).decode('ascii')))
+
+        if count < len(pkts):  # stopped at error so retry rest first
+            self.txPkts.extendleft(reversed(pkts[count:]))
+        return True
+
     def serviceTxPkts(self):
         """
         Service the .txPcks deque to send packets through server
+        When .batched send batches of up to .budget packets per handler call
         Override in subclass
         """
         if self.handler.opened:
             laters = deque()
             blockeds = []
+            if self.batched:
+                while self._serviceBatchTxPkts(laters, blockeds):
+                    pass
             while self.txPkts:
                 again = self._serviceOneTxPkt(laters, blockeds)
                 if not again:
@@ -1962,11 +2197,65 @@ class GramStack(Stack):
 
         packet = self.parserize(raw, ha)
         if packet is not None:
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                                        hexlify(raw).decode('ascii')))
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n".format(self.name,
+                                            hexlify(raw).decode('ascii')))
             self.rxPkts.append((packet, ha))     # duple = ( packed, source address)
         return True  # received data
 
+    def _serviceBatchReceived(self):
+        """
+        Service one batch of up to .budget received duples (raw, ha) from
+        server received with one handler call
+        Returns True if full batch so may be more to receive
+        """
+        try:
+            grams = self.handler.receiveBatch(self.budget)
+        except socket.error as ex:
+            # ex.args[0] always ex.errno for compat
+            if (ex.args[0] in (errno.ECONNREFUSED,
+                               errno.ECONNRESET,
+                               errno.ENETRESET,
+                               errno.ENETUNREACH,
+                               errno.EHOSTUNREACH,
+                               errno.ENETDOWN,
+                               errno.EHOSTDOWN,
+                               errno.ETIMEDOUT,
+                               errno.ETIME)):
+                return False  # no received data
+            else:
+                raise
+
+        if not grams:  # no received data
+            return False
+
+        self.incStat("batch_received")
+        self.incStat("gram_received", len(grams))
+        if len(grams) > self.stats.get("batch_received_max", 0):
+            self.updateStat("batch_received_max", len(grams))
+
+        profuse = console._verbosity >= console.Wordage.profuse
+        for raw, ha in grams:
+            packet = self.parserize(raw, ha)
+            if packet is not None:
+                if profuse:
+                    console.profuse("{0}: received\n    0x{1}\n".format(self.name,
+                                                hexlify(raw).decode('ascii')))
+                self.rxPkts.append((packet, ha))     # duple = ( packed, source address)
+        return len(grams) >= self.budget
+
+    def serviceReceives(self):
+        """
+        Retrieve from server all received and queue up
+        When .batched receive batches of up to .budget datagrams per handler call
+        """
+        if not self.batched:
+            return super(GramStack, self).serviceReceives()
+
+        while self.handler.opened:
+            if not self._serviceBatchReceived():
+                break
+
     def messagize(self, pkt, ha):
         """
         Returns duple of (message, remote) converted from rx source packet pkt and rha
@@ -2021,6 +2310,8 @@ class UdpStack(GramStack, RemoteStack, IpStack):
             stats is odict of stack statistics if any
             host is local udp host if ha not provided
             port is local udp port if ha not provided
+            batched is Boolean True means handler receives and sends batches
+            budget is max datagrams per batch when batched
 
         Parameters:
             bufcnt is number of udp buffers equivalent for udp buffer to allocate
@@ -2121,7 +2412,7 @@ class UdpStack(GramStack, RemoteStack, IpStack):
         self.incStat("pkt_received")
         message, remote = self.messagize(pkt, ha)
         if remote:
-            remote.receive(message)
+            self.correspond(pkt, message, remote)
 
     def _serviceOneRxMsg(self):
         """
@@ -16,10 +16,11 @@ from binascii import hexlify
 from ioflo.aid.sixing import *
 from ioflo.aid.byting import hexify, bytify, unbytify, packify, unpackify
 from ioflo.aid import getConsole
+from ioflo.aid import timing
 
 console = getConsole()
 
-from ioflo.aio.proto import exchanging, devicing, stacking
+from ioflo.aio.proto import exchanging, devicing, stacking, packeting
 
 def setUpModule():
     console.reinit(verbosity=console.Wordage.concise)
@@ -70,6 +71,176 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(exchangent.name, 'Exchangent')
         self.assertIs(exchangent.device, None)
 
+    def testTimingWheel(self):
+        """
+        Test TimingWheel class
+        """
+        console.terse("{0}\n".format(self.testTimingWheel.__doc__))
+
+        stamper = timing.Stamper(stamp=0.0)
+        wheel = exchanging.TimingWheel(stamper=stamper, tick=0.1, size=8)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.expire(), [])
+
+        wheel.schedule("a", 0.25)
+        wheel.schedule("b", 0.15)
+        wheel.schedule("c", 2.05)  # wraps around wheel
+        wheel.schedule("d", 0.5)
+        self.assertEqual(len(wheel), 4)
+        self.assertIn("a", wheel)
+        self.assertTrue(wheel.cancel("d"))
+        self.assertFalse(wheel.cancel("d"))
+        self.assertEqual(len(wheel), 3)
+
+        stamper.advance(0.2)
+        self.assertEqual(wheel.expire(), ["b"])
+        stamper.advance(0.04)
+        self.assertEqual(wheel.expire(), [])  # same tick not yet due
+        stamper.advance(0.01)
+        self.assertEqual(wheel.expire(), ["a"])
+        self.assertEqual(len(wheel), 1)
+
+        stamper.advance(1.0)  # c is in slot of tick 4 but later round
+        self.assertEqual(wheel.expire(), [])
+        self.assertIn("c", wheel)
+
+        wheel.schedule("e", 1.0)  # already past so due at next expire
+        wheel.schedule("c", 1.5)  # reschedule
+        self.assertEqual(len(wheel), 2)
+        stamper.advance(5.0)  # more than whole wheel
+        self.assertEqual(wheel.expire(), ["e", "c"])
+        self.assertEqual(len(wheel), 0)
+
+    def testExchangeTable(self):
+        """
+        Test ExchangeTable with RemoteStack timers
+        """
+        console.terse("{0}\n".format(self.testExchangeTable.__doc__))
+
+        stack = stacking.RemoteStack()
+        self.assertIsInstance(stack.exchanges, exchanging.ExchangeTable)
+        remote = stack.addRemote(devicing.RemoteDevice(stack=stack, name="beta",
+                                                       ha="beta"))
+        other = stack.addRemote(devicing.RemoteDevice(stack=stack, name="gamma",
+                                                      ha="gamma"))
+        table = stack.exchanges
+
+        exchangers = []
+        for i in range(100):
+            device = remote if i % 2 else other
+            exchanger = exchanging.Exchanger(stack=stack, device=device,
+                                             uid=i, timeout=1.0, redoTimeout=0.0)
+            exchanger.start(tx=packeting.Packet(stack=stack, packed=b"ping"))
+            exchangers.append(exchanger)
+        self.assertEqual(len(table), 100)
+        self.assertEqual(len(table.wheel), 100)
+        self.assertEqual(len(stack.txPkts), 100)
+        self.assertIs(table.get(remote.uid, 1), exchangers[1])
+        self.assertIs(table.get(other.uid, 1), None)
+        self.assertIn((other.uid, 0), table)
+        with self.assertRaises(ValueError):
+            table.add(exchangers[0])
+
+        stack.stamper.advance(0.2)
+        for exchanger in exchangers[:50]:  # complete half
+            exchanger.receive(b"pong")
+            exchanger.finish()
+        self.assertEqual(len(table), 50)
+        self.assertEqual(len(table.wheel), 50)
+        self.assertIs(exchangers[0].table, None)
+
+        stack.stamper.advance(0.5)
+        stack.serviceTimers()
+        self.assertEqual(len(table), 50)  # not yet timed out
+        self.assertFalse(exchangers[50].done)
+
+        stack.stamper.advance(0.5)
+        stack.serviceTimers()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(len(table.wheel), 0)
+        self.assertTrue(exchangers[50].done)
+        self.assertTrue(exchangers[50].failed)
+        self.assertTrue(exchangers[50].timedout)
+
+        stats = table.stats
+        self.assertEqual(list(stats.keys()), [other.uid, remote.uid])
+        stat = stats[remote.uid]
+        self.assertEqual(stat["inflight"], 0)
+        self.assertEqual(stat["started"], 50)
+        self.assertEqual(stat["finished"], 50)
+        self.assertEqual(stat["failed"], 25)
+        self.assertEqual(stat["timeouts"], 25)
+        self.assertEqual(stat["timeoutRate"], 0.5)
+        self.assertAlmostEqual(stat["rtt50"], 0.2)
+        self.assertAlmostEqual(stat["rtt99"], 0.2)
+
+        exchanger = exchanging.Exchanger(stack=stack, device=remote, uid="redo",
+                                         timeout=1.0, redoTimeout=0.25)
+        exchanger.start(tx=packeting.Packet(stack=stack, packed=b"ping"))
+        stack.txPkts.clear()
+        self.assertEqual(exchanger.deadline, stack.stamper.stamp + 0.25)
+        stack.stamper.advance(0.3)
+        self.assertEqual(table.service(), 1)
+        self.assertEqual(len(stack.txPkts), 1)  # redone
+        self.assertFalse(exchanger.done)
+        self.assertEqual(exchanger.deadline, stack.stamper.stamp + 0.25)
+        self.assertEqual(table.stats[remote.uid]["inflight"], 1)
+        self.assertEqual(exchanging.percentile([], 0.5), None)
+        self.assertEqual(exchanging.percentile([1, 2, 3, 4], 0.5), 2)
+        self.assertEqual(exchanging.percentile([1, 2, 3, 4], 0.99), 4)
+
+    def testExchangeLifecycle(self):
+        """
+        Test exchanges register when started and receive through indexed lookup
+        """
+        console.terse("{0}\n".format(self.testExchangeLifecycle.__doc__))
+
+        class PingStack(stacking.RemoteStack):
+            def exchangize(self, pkt, remote):
+                xid, sep, rest = bytes(pkt.packed).partition(b":")
+                return int(xid) if sep else None
+
+        class Pinger(exchanging.Exchanger):
+            def receive(self, rx):
+                self.prepReceive(rx)
+                self.finish()
+
+        stack = PingStack()
+        remote = stack.addRemote(devicing.RemoteDevice(stack=stack, name="beta",
+                                                       ha="beta"))
+        table = stack.exchanges
+        pingers = [Pinger(stack=stack, device=remote, uid=i, timeout=1.0,
+                          redoTimeout=0.0) for i in range(3)]
+        for pinger in pingers:
+            pinger.start(tx=packeting.Packet(stack=stack, packed=b"ping"))
+            self.assertIs(pinger.table, table)  # registered by start
+        self.assertEqual(len(table), 3)
+        self.assertEqual(len(table.wheel), 3)
+
+        stack.stamper.advance(0.25)
+        stack.rxPkts.append((packeting.Packet(stack=stack, packed=b"1:pong"), "beta"))
+        stack.rxPkts.append((packeting.Packet(stack=stack, packed=b"hello"), "beta"))
+        stack.serviceRxPkts()
+        self.assertIs(pingers[1].done, True)  # routed by (remote uid, xid)
+        self.assertIs(pingers[1].failed, False)
+        self.assertEqual(pingers[1].rx, "1:pong")
+        self.assertIs(pingers[1].table, None)
+        self.assertEqual(list(stack.rxMsgs), ["hello"])  # not exchange so remote
+        self.assertEqual(len(table), 2)
+
+        stack.stamper.advance(1.0)
+        stack.serviceTimers()
+        self.assertIs(pingers[0].timedout, True)
+        self.assertIs(pingers[2].timedout, True)
+        self.assertEqual(len(table), 0)
+        stat = table.stats[remote.uid]
+        self.assertEqual((stat["started"], stat["finished"], stat["timeouts"]),
+                         (3, 3, 2))
+        self.assertAlmostEqual(stat["rtt50"], 0.25)
+
+        pingers[1].start(tx=packeting.Packet(stack=stack, packed=b"ping"))  # restart
+        self.assertIs(table.get(remote.uid, 1), pingers[1])
+
 
 def runOne(test):
     '''
@@ -84,6 +255,9 @@ def runSome():
     tests =  []
     names = [
              'testExchange',
+             'testTimingWheel',
+             'testExchangeTable',
+             'testExchangeLifecycle',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
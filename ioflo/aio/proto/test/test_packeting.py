@@ -153,6 +153,47 @@ class BasicTestCase(unittest.TestCase):
         show = part.show()
         self.assertEqual(show, '    PackifierPart: packed=0x000000\n')
 
+    def testPartMany(self):
+        """
+        Test compiled codecs and bulk pack and parse of PackerPart and PackifierPart
+        """
+        console.terse("{0}\n".format(self.testPartMany.__doc__))
+
+        part = packeting.PackerPart(fmt="!BH")
+        other = packeting.PackerPart(fmt="!BH")
+        self.assertIs(part.packer, other.packer)
+        self.assertIs(part.packer, packeting.compilePacker("!BH"))
+
+        records = [(i % 256, i) for i in range(1000)]
+        raw = packeting.PackerPart.packMany(records, fmt="!BH")
+        self.assertEqual(len(raw), 3 * len(records))
+        self.assertEqual(raw[3:6], bytearray([1, 0, 1]))
+        self.assertEqual(packeting.PackerPart.parseMany(raw, fmt="!BH"), records)
+        self.assertEqual(packeting.PackerPart.parseMany(raw, fmt="!BH",
+                                                        offset=3, count=2),
+                         records[1:3])
+        self.assertEqual(packeting.PackerPart.parseMany(raw + bytearray([7]),
+                                                        fmt="!BH"),
+                         records)
+        with self.assertRaises(ValueError):
+            packeting.PackerPart.parseMany(raw, fmt="!BH", offset=1, count=1000)
+        self.assertEqual(packeting.PackerPart.parseMany(raw), [])  # empty Format
+
+        part = packeting.PackifierPart(fmt="1 3 4")
+        other = packeting.PackifierPart(fmt="1 3 4")
+        self.assertIs(part.packifier, other.packifier)
+        self.assertEqual(part.fmtSize, 1)
+
+        records = [(bool(i % 2), i % 8, i % 16) for i in range(100)]
+        raw = packeting.PackifierPart.packMany(records, fmt="1 3 4")
+        self.assertEqual(len(raw), len(records))
+        self.assertEqual(raw, bytearray(b"".join(packify(fmt="1 3 4", fields=record)
+                                                 for record in records)))
+        self.assertEqual(packeting.PackifierPart.parseMany(raw, fmt="1 3 4"), records)
+        self.assertEqual(packeting.PackifierPart.parseMany(raw, fmt="1 3 4",
+                                                           offset=5, count=1),
+                         records[5:6])
+
     def testPacketPart(self):
         """
         Test PacketPart class
@@ -211,6 +252,7 @@ def runSome():
              'testPart',
              'testPackerPart',
              'testPackifierPart',
+             'testPartMany',
              'testPacketPart',
              'testPacket',
             ]
@@ -17,7 +17,7 @@ import time
 from ioflo.aid.sixing import *
 from ioflo.aid.byting import hexify, bytify, unbytify, packify, unpackify
 from ioflo.aid.timing import Timer, StoreTimer, Stamper
-from ioflo.aid import getConsole
+from ioflo.aid import getConsole, byting, odict
 
 console = getConsole()
 
@@ -66,6 +66,91 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(stack.handler, None)
 
 
+    def testStackFramize(self):
+        """
+        Test Stack framize of packets from stream receive buffer with cursor
+        """
+        console.terse("{0}\n".format(self.testStackFramize.__doc__))
+
+        class FramedStack(stacking.Stack):
+            Compaction = 16
+
+            def parserize(self, raw):  # one byte length prefixed frames
+                if not raw or len(raw) < 1 + raw[0]:
+                    return None
+                packet = packeting.Packet(stack=self)
+                packet.parse(raw=raw[:1 + raw[0]])
+                return packet
+
+        stack = FramedStack()
+        self.assertEqual(stack.rxCursor, 0)
+        frames = [b"\x03abc", b"\x01d", b"\x02ef"]
+        rxbs = bytearray(b"".join(frames) + b"\x05gh")  # partial last frame
+        packets, cursor = stack.framize(rxbs)
+        self.assertEqual([bytes(packet.packed) for packet in packets], frames)
+        self.assertIsInstance(packets[0].packed, bytearray)  # owns its bytes
+        self.assertEqual(cursor, 9)  # below compaction so not deleted
+        self.assertEqual(rxbs, b"".join(frames) + b"\x05gh")
+
+        rxbs.extend(b"ijk\x0bklmnopqrstu\x01")  # resizable since view released
+        packets, cursor = stack.framize(rxbs, cursor)
+        self.assertEqual([bytes(packet.packed) for packet in packets],
+                         [b"\x05ghijk", b"\x0bklmnopqrstu"])
+        self.assertEqual(cursor, 0)  # compacted since passed Compaction
+        self.assertEqual(rxbs, b"\x01")
+
+        rxbs.extend(b"v")
+        packets, cursor = stack.framize(rxbs, cursor)
+        self.assertEqual([bytes(packet.packed) for packet in packets], [b"\x01v"])
+        self.assertEqual((cursor, rxbs), (0, b""))  # all parsed so cleared
+
+        rxbs = byting.Bytebuffer()
+        rxbs.extend(b"".join(frames) + b"\x05gh")
+        packets, cursor = stack.framize(rxbs)
+        self.assertEqual([bytes(packet.packed) for packet in packets], frames)
+        self.assertEqual(cursor, 0)  # consumed
+        self.assertEqual(bytes(rxbs), b"\x05gh")
+
+        class KeepingStack(FramedStack):
+            def parserize(self, raw):  # keeps raw which framize releases
+                self.raws.append(raw)
+                return super(KeepingStack, self).parserize(raw)
+
+        stack = KeepingStack()
+        stack.raws = []
+        rxbs = bytearray(b"".join(frames) + b"\x05gh")
+        packets, cursor = stack.framize(rxbs)
+        self.assertEqual([bytes(packet.packed) for packet in packets], frames)
+        self.assertEqual(len(stack.raws), 4)
+        self.assertRaises(ValueError, bytes, stack.raws[0])  # released
+        rxbs.extend(b"ijk")  # kept raw does not pin rxbs
+        packets, cursor = stack.framize(rxbs, cursor)
+        self.assertEqual([bytes(packet.packed) for packet in packets],
+                         [b"\x05ghijk"])
+
+        class BytesStack(KeepingStack):
+            RawViews = False  # overrides get bytes copies
+
+            def parserize(self, raw):
+                self.finds.append(raw.find(b"\x05"))  # bytes methods
+                return super(BytesStack, self).parserize(raw)
+
+        stack = BytesStack()
+        stack.raws = []
+        stack.finds = []
+        rxbs = bytearray(b"".join(frames) + b"\x05gh")
+        packets, cursor = stack.framize(rxbs)
+        self.assertEqual([bytes(packet.packed) for packet in packets], frames)
+        self.assertEqual(stack.raws, [b"\x03abc\x01d\x02ef\x05gh",
+                                      b"\x01d\x02ef\x05gh",
+                                      b"\x02ef\x05gh",
+                                      b"\x05gh"])  # kept copies still valid
+        rxbs.extend(b"ijk")
+        packets, cursor = stack.framize(rxbs, cursor)
+        self.assertEqual([bytes(packet.packed) for packet in packets],
+                         [b"\x05ghijk"])
+        self.assertEqual(stack.finds, [9, 5, 3, 0, 0])
+
     def testRemoteStack(self):
         """
         Test RemoteStack class
@@ -125,6 +210,115 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(len(stack.nameRemotes), 0)
         self.assertEqual(len(stack.haRemotes), 0)
 
+    def testKeepStackBatched(self):
+        """
+        Test KeepStack batched remote dumps with in memory keep
+        """
+        console.terse("{0}\n".format(self.testKeepStackBatched.__doc__))
+
+        class MemKeep(object):
+            """ In memory keep that records dumps """
+            def __init__(self):
+                self.dirpath = ''
+                self.remotes = odict()
+                self.dumps = []
+
+            def loadLocalData(self):
+                return None
+
+            def clearLocalData(self):
+                pass
+
+            def dumpLocal(self, local):
+                pass
+
+            def dumpRemote(self, remote):
+                self.remotes[remote.name] = remote.uid
+                self.dumps.append(remote.name)
+
+            def clearRemoteData(self, name):
+                self.remotes.pop(name, None)
+
+            def loadAllRemoteData(self):
+                return odict((name, dict(uid=uid, name=name))
+                             for name, uid in self.remotes.items())
+
+            def clearAllRemoteData(self):
+                self.remotes.clear()
+
+        keep = MemKeep()
+        local = devicing.LocalDevice(stack=None, uid=1, name='alpha')
+        stack = stacking.KeepStack(keep=keep, local=local, budget=2)
+        self.assertIs(stack.local, local)
+        self.assertIs(local.stack, stack)
+        self.assertEqual(stack.budget, 2)
+        self.assertEqual(len(stack.dirties), 0)
+
+        remotes = []
+        for i in range(5):
+            remote = devicing.RemoteDevice(stack=stack,
+                                           name='beta{0}'.format(i),
+                                           ha='beta{0}'.format(i))
+            stack.addRemote(remote, dump=True)
+            remotes.append(remote)
+        self.assertEqual(list(stack.dirties.keys()),
+                         ['beta0', 'beta1', 'beta2', 'beta3', 'beta4'])
+        self.assertEqual(keep.dumps, [])  # nothing dumped yet
+
+        stack.serviceKeeps()  # at most budget per service
+        self.assertEqual(keep.dumps, ['beta0', 'beta1'])
+        self.assertEqual(list(stack.dirties.keys()), ['beta2', 'beta3', 'beta4'])
+
+        # rename of pending remote keeps it pending under new name
+        stack.renameRemote(remotes[2], 'gamma2')
+        self.assertEqual(list(stack.dirties.keys()), ['beta3', 'beta4', 'gamma2'])
+        # rename of dumped remote clears old keep
+        stack.renameRemote(remotes[0], 'gamma0', dump=True)
+        self.assertNotIn('beta0', keep.remotes)
+        self.assertIn('gamma0', stack.dirties)
+
+        # remove drops pending dump and clears keep
+        stack.removeRemote(remotes[3])
+        self.assertNotIn('beta3', stack.dirties)
+        stack.removeRemote(remotes[1])
+        self.assertNotIn('beta1', keep.remotes)
+
+        self.assertEqual(stack.flushRemotes(budget=1), 1)
+        self.assertEqual(keep.dumps[-1], 'beta4')
+        self.assertEqual(list(stack.dirties.keys()), ['gamma2', 'gamma0'])
+
+        stack.serviceTimers()  # services keeps
+        self.assertEqual(len(stack.dirties), 0)
+        self.assertEqual(keep.dumps[-2:], ['gamma2', 'gamma0'])
+        self.assertEqual(stack.flushRemotes(), 0)
+
+        stack.removeRemote(remotes[4], clear=False)  # leaves stale keep
+        self.assertIn('beta4', keep.remotes)
+        stack.dumpRemotes(clear=False)
+        self.assertIn('beta4', keep.remotes)
+        stack.dumpRemotes()  # clears stale keeps and marks all dirty when batched
+        self.assertNotIn('beta4', keep.remotes)
+        self.assertEqual(list(stack.dirties.keys()), ['gamma0', 'gamma2'])
+        count = len(keep.dumps)
+        stack.close()  # flushes all dirty
+        self.assertEqual(len(stack.dirties), 0)
+        self.assertEqual(len(keep.dumps), count + 2)
+        self.assertEqual(set(keep.remotes.keys()), set(['gamma2', 'gamma0']))
+
+        # unbatched dumps synchronously
+        keep = MemKeep()
+        local = devicing.LocalDevice(stack=None, uid=1, name='alpha')
+        stack = stacking.KeepStack(keep=keep, local=local)
+        self.assertIs(stack.budget, None)
+        remote = devicing.RemoteDevice(stack=stack, name='beta', ha='beta')
+        stack.addRemote(remote, dump=True)
+        self.assertEqual(keep.dumps, ['beta'])
+        self.assertEqual(len(stack.dirties), 0)
+        stack.renameRemote(remote, 'gamma', clear=False)  # leaves stale keep
+        stack.dumpRemotes()  # clears stale keeps
+        self.assertEqual(list(keep.remotes.keys()), ['gamma'])
+        stack.close()
+
     def testUdpStack(self):
         """
         Test UdpStack class
@@ -243,6 +437,59 @@ class BasicTestCase(unittest.TestCase):
         alpha.close()
         beta.close()
 
+    def testUdpStacksBatched(self):
+        """
+        Test two batched stacks sending many packets
+        """
+        console.terse("{0}\n".format(self.testUdpStacksBatched.__doc__))
+
+        alpha = stacking.UdpStack(name='alpha',
+                                  port=8000,
+                                  batched=True,
+                                  budget=16,
+                                  bufcnt=64)
+        self.assertIs(alpha.batched, True)
+        self.assertEqual(alpha.budget, 16)
+        alpha.addRemote(devicing.IpRemoteDevice(stack=alpha,
+                                                name='BetaRemote',
+                                                ha=('localhost', 8002)))
+
+        beta = stacking.UdpStack(name='beta',
+                                 port=8002,
+                                 batched=True,
+                                 budget=16,
+                                 bufcnt=64)
+        beta.addRemote(devicing.IpRemoteDevice(stack=beta,
+                                               name='AlphaRemote',
+                                               ha=('localhost', 8000)))
+
+        for i in range(40):
+            alpha.message("Hello beta {0}.".format(i))
+
+        alpha.serviceAllTx()
+        self.assertEqual(len(alpha.txPkts), 0)
+        self.assertEqual(alpha.stats['batch_sent'], 3)
+        self.assertEqual(alpha.stats['gram_sent'], 40)
+        self.assertEqual(alpha.stats['batch_sent_max'], 16)
+
+        time.sleep(0.1)
+        beta.serviceAllRx()
+        self.assertEqual(beta.stats['batch_received'], 3)
+        self.assertEqual(beta.stats['gram_received'], 40)
+        self.assertEqual(beta.stats['batch_received_max'], 16)
+        self.assertEqual(beta.stats['msg_received'], 40)
+
+        beta.message("Hi alpha from beta.")  # unbatched receiver
+        beta.serviceAllTx()
+        alpha.batched = False
+        time.sleep(0.1)
+        alpha.serviceAllRx()
+        self.assertEqual(alpha.stats['msg_received'], 1)
+        self.assertNotIn('batch_received', alpha.stats)
+
+        alpha.close()
+        beta.close()
+
     def testTcpServerStack(self):
         """
         Test TcpServerStack class
@@ -318,9 +565,12 @@ def runSome():
     tests =  []
     names = [
              'testStack',
+             'testStackFramize',
              'testRemoteStack',
+             'testKeepStackBatched',
              'testUdpStack',
              'testUdpStacks',
+             'testUdpStacksBatched',
              'testTcpServerStack',
              'testTcpClientStack',
             ]
@@ -9,6 +9,7 @@ import os
 import socket
 import errno
 import platform
+import selectors
 from collections import deque
 from binascii import hexlify
 
@@ -20,6 +21,7 @@ except ImportError:
 # Import ioflo libs
 from ...aid.sixing import *
 from ...aid.odicting import odict
+from ...aid.byting import Bytebuffer
 from ...aid.timing import StoreTimer
 from ...aid.consoling import getConsole
 from .. import aioing
@@ -31,9 +33,16 @@ console = getConsole()
 class Client(object):
     """
     Nonblocking TCP Socket Client Class.
+
+    When .selected the connected socket is registered with .selector and
+    receives are attempted only when it is selected ready to receive. Write
+    readiness is registered only while .txes are blocked and then sends are
+    attempted only when it is selected ready to transmit.
     """
     Timeout = 1.0  # timeout in seconds
     Reconnectable = False  # auto reconnect flag
+    TxBudget = 65536  # max bytes gathered by vectored send
+    TxGather = 64  # max buffers gathered by vectored send
 
     def __init__(self,
                  name=u'',
@@ -47,7 +56,10 @@ class Client(object):
                  timeout=None,
                  reconnectable=None,
                  txes=None,
-                 rxbs=None):
+                 rxbs=None,
+                 selected=False,
+                 viewable=False,
+                 vectored=False):
         """
         Initialization method for instance.
         name = user friendly name for connection
@@ -61,7 +73,12 @@ class Client(object):
         timeout = auto reconnect timeout
         reconnectable = Boolean auto reconnect if timed out
         txes = deque of data to send
-        rxbs = bytearray of data received
+        rxbs = bytearray of data received or Bytebuffer when viewable
+        selected = True if service .cs only when selected ready by .selector
+        viewable = True if receive with recv_into into Bytebuffer .rxbs
+                   so rx data is returned as memoryview instead of copies
+        vectored = True if gather .txes into vectored sends instead of
+                   one send per tx
         """
         self.name = name
         self.uid = uid
@@ -79,12 +96,22 @@ class Client(object):
         self._accepted = False  # attribute to support accepted property
         self.cutoff = False  # True when detect connection closed on far side
         self.txes = txes if txes is not None else deque()  # deque of data to send
-        self.rxbs = rxbs if rxbs is not None else bytearray()  # byte array of data recieved
+        self._unsent = sum(len(data) for data in self.txes)  # running count unsent
+        self.vectored = True if vectored else False
+        self.viewable = True if viewable else False
+        if rxbs is None:  # byte array or Bytebuffer when .viewable of data recieved
+            rxbs = Bytebuffer(self.bs) if self.viewable else bytearray()
+        elif self.viewable and not isinstance(rxbs, Bytebuffer):
+            raise ValueError("Viewable requires Bytebuffer rxbs not {0}".format(type(rxbs)))
+        self.rxbs = rxbs
         self.store = store or storing.Store(stamp=0.0)
         self.timeout = timeout if timeout is not None else self.Timeout
         self.timer = StoreTimer(self.store, duration=self.timeout)
         self.reconnectable = reconnectable if reconnectable is not None else self.Reconnectable
         self.opened = False
+        self.selected = True if selected else False
+        self.selector = None  # readiness selector of .cs when .selected
+        self.blocked = False  # True when .txes blocked so select write readiness
 
 
     @property
@@ -243,6 +270,7 @@ class Client(object):
         """
         Shutdown and close connected socket .cs
         """
+        self.unselect()
         if self.cs:
             self.shutdown()
             self.cs.close()  #close socket
@@ -253,6 +281,37 @@ class Client(object):
 
     close = shutclose  # alias
 
+    def select(self):
+        """
+        Returns readiness events bit mask of .cs selected without blocking
+        Registers .cs with .selector first when not registered or replaced
+        such as by reopen or TLS wrap. Write readiness only when .blocked.
+        """
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+        events = selectors.EVENT_READ
+        if self.blocked:
+            events |= selectors.EVENT_WRITE
+        key = self.selector.get_map().get(self.cs.fileno())
+        if key is None:
+            self.selector.register(self.cs, events)
+        elif key.fileobj is not self.cs:  # replaced
+            self.selector.unregister(key.fileobj)
+            self.selector.register(self.cs, events)
+        elif key.events != events:
+            self.selector.modify(self.cs, events)
+        ready = self.selector.select(timeout=0)
+        return ready[0][1] if ready else 0
+
+    def unselect(self):
+        """
+        Close .selector if any
+        """
+        self.blocked = False
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+
     def refresh(self):
         """
         Restart timer
@@ -323,7 +382,11 @@ class Client(object):
         data is string in python2 and bytes in python3
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.viewable:  # receive into reserved space of .rxbs
+                view = self.rxbs.reserve(self.bs)
+                data = view[:self.cs.recv_into(view, self.bs)]
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if  ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -350,7 +413,7 @@ class Client(object):
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(data).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, received from {1}:\n------------\n"
@@ -367,12 +430,19 @@ class Client(object):
     def serviceReceives(self):
         """
         Service receives until no more
+        When .selected only if .cs selected ready to receive
         """
+        if (self.selected and self.connected and not self.cutoff and
+                not self.select() & selectors.EVENT_READ):
+            return
         while self.connected and not self.cutoff:
             data = self.receive()
             if not data:
                 break
-            self.rxbs.extend(data)
+            if self.viewable:
+                self.rxbs.advance(len(data))
+            else:
+                self.rxbs.extend(data)
 
     def serviceReceiveOnce(self):
         '''
@@ -381,7 +451,10 @@ class Client(object):
         if self.connected and not self.cutoff:
             data = self.receive()
             if data:
-                self.rxbs.extend(data)
+                if self.viewable:
+                    self.rxbs.advance(len(data))
+                else:
+                    self.rxbs.extend(data)
 
     def clearRxbs(self):
         """
@@ -392,6 +465,7 @@ class Client(object):
     def catRxbs(self):
         """
         Return copy and clear .rxbs
+        When .viewable returns memoryview valid until next receive instead
         """
         rx = self.rxbs[:]
         self.clearRxbs()
@@ -402,7 +476,10 @@ class Client(object):
         Returns duple of (bytes(self.rxbs[index:]), len(self.rxbs))
         slices the tail from index to end and converts to bytes
         also the length of .rxbs to be used to update index
+        When .viewable the tail is memoryview valid until next receive
         """
+        if self.viewable:  # memoryview not copy
+            return self.rxbs.tail(index)
         return (bytes(self.rxbs[index:]), len(self.rxbs))
 
     def send(self, data):
@@ -410,9 +487,13 @@ class Client(object):
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
         data is string in python2 and bytes in python3
+        or list of bytes like buffers to gather into one send when vectored
         """
         try:
-            result = self.cs.send(data) #result is number of bytes sent
+            if isinstance(data, list):  # gather buffers in one syscall
+                result = self.cs.sendmsg(data)
+            else:
+                result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -437,6 +518,10 @@ class Client(object):
                 raise
 
         if result:
+            if isinstance(data, list) and (self.wlog or
+                    console._verbosity >= console.Wordage.profuse):
+                data = b"".join(data)  # copy only to log
+
             if console._verbosity >= console.Wordage.profuse:
                 try:
                     load = data[:result].decode("UTF-8")
@@ -456,6 +541,7 @@ class Client(object):
         Queue data onto .txes
         '''
         self.txes.append(data)
+        self._unsent += len(data)
 
     def serviceTxes(self):
         """
@@ -463,14 +549,62 @@ class Client(object):
         For each tx if all bytes sent then keep sending until partial send
         or no more to send
         If partial send reattach and return
-        """
+        When .selected and blocked only if .cs selected ready to transmit
+        When .vectored gather txes into each send
+        """
+        if self.selected:
+            if (self.blocked and self.txes and self.connected and
+                    not self.cutoff and not self.select() & selectors.EVENT_WRITE):
+                return
+            self.blocked = False
         while self.txes and self.connected and not self.cutoff:
+            if self.vectored:
+                if not self.gatherTxes():
+                    if self.selected:
+                        self.blocked = True
+                    break  # try again later
+                continue
             data = self.txes.popleft()
+            self._unsent -= len(data)
             count = self.send(data)
             if count < len(data):  # put back unsent portion
                 self.txes.appendleft(data[count:])
+                self._unsent += len(data) - count
+                if self.selected:
+                    self.blocked = True
                 break  # try again later
 
+    @property
+    def unsent(self):
+        """
+        Returns number of bytes queued in .txes not yet sent
+        """
+        return self._unsent
+
+    def gatherTxes(self):
+        """
+        Service one vectored send of leading .txes gathered up to .TxBudget
+        bytes or .TxGather buffers. Fully sent buffers are removed and a
+        partially sent buffer is replaced by a memoryview of its unsent portion.
+        Returns True if all gathered sent False if blocked
+        """
+        buffers = []
+        size = 0
+        for data in self.txes:
+            buffers.append(data)
+            size += len(data)
+            if size >= self.TxBudget or len(buffers) >= self.TxGather:
+                break
+        count = self.send(buffers)
+        self._unsent -= count
+        for data in buffers:
+            if count < len(data):  # replace with unsent portion
+                self.txes[0] = memoryview(data)[count:]
+                return False
+            count -= len(data)
+            self.txes.popleft()
+        return True
+
 Outgoer = Client  # aliases
 
 
@@ -573,6 +707,7 @@ class ClientTls(Client):
         """
         Shutdown and close connected socket .cs
         """
+        self.unselect()
         if self.cs:
             self.shutdown()
             self.cs.close()  #close socket
@@ -651,7 +786,11 @@ class ClientTls(Client):
         data is string in python2 and bytes in python3
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.viewable:  # receive into reserved space of .rxbs
+                view = self.rxbs.reserve(self.bs)
+                data = view[:self.cs.recv_into(view, self.bs)]
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (ssl.SSL_ERROR_WANT_READ, ssl.SSL_ERROR_WANT_WRITE):
@@ -679,7 +818,7 @@ class ClientTls(Client):
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(data).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, received from {1}:\n------------\n"
@@ -698,8 +837,11 @@ class ClientTls(Client):
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
         data is string in python2 and bytes in python3
+        or list of bytes like buffers to gather into one send when vectored
         """
         try:
+            if isinstance(data, list):  # no sendmsg for tls so coalesce
+                data = b"".join(data)
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
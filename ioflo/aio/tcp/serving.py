@@ -9,6 +9,7 @@ import os
 import socket
 import errno
 import platform
+import selectors
 from collections import deque
 from binascii import hexlify
 
@@ -20,6 +21,7 @@ except ImportError:
 # Import ioflo libs
 from ...aid.sixing import *
 from ...aid.odicting import odict
+from ...aid.byting import Bytebuffer
 from ...aid.timing import StoreTimer
 from ...aid.consoling import getConsole
 from .. import aioing
@@ -94,6 +96,8 @@ class Incomer(object):
     Manager class for incoming nonblocking TCP connections.
     """
     Timeout = 0.0  # timeout in seconds
+    TxBudget = 65536  # max bytes gathered by vectored send
+    TxGather = 64  # max buffers gathered by vectored send
 
     def __init__(self,
                  name=u'',
@@ -105,7 +109,9 @@ class Incomer(object):
                  wlog=None,
                  store=None,
                  timeout=None,
-                 refreshable=True):
+                 refreshable=True,
+                 viewable=False,
+                 vectored=False):
 
         """
         Initialization method for instance.
@@ -118,6 +124,10 @@ class Incomer(object):
         store = data store reference
         timeout = timeout for .timer
         refreshable = True if tx/rx activity refreshes timer False otherwise
+        viewable = True if receive with recv_into into Bytebuffer .rxbs
+                   so rx data is returned as memoryview instead of copies
+        vectored = True if gather .txes into vectored sends instead of
+                   one send per tx
         """
         self.name = name
         self.uid = uid
@@ -128,7 +138,11 @@ class Incomer(object):
         self.wlog = wlog
         self.cutoff = False # True when detect connection closed on far side
         self.txes = deque()  # deque of data to send
-        self.rxbs = bytearray()  # bytearray of data received
+        self._unsent = 0  # running count of bytes in .txes not yet sent
+        self.vectored = True if vectored else False
+        self.viewable = True if viewable else False
+        # bytearray or Bytebuffer when .viewable of data received
+        self.rxbs = Bytebuffer(self.bs or 8096) if self.viewable else bytearray()
         if self.cs:
             self.cs.setblocking(0)  # linux does not preserve blocking from accept
         self.store = store or storing.Store(stamp=0.0)
@@ -194,7 +208,11 @@ class Incomer(object):
         data is string in python2 and bytes in python3
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.viewable:  # receive into reserved space of .rxbs
+                view = self.rxbs.reserve(self.bs)
+                data = view[:self.cs.recv_into(view, self.bs)]
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -221,7 +239,7 @@ class Incomer(object):
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(data).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data).decode("ASCII"))
                 cmsg = ("Incomer at {0}, received from {1}:\n------------\n"
@@ -247,7 +265,10 @@ class Incomer(object):
             data = self.receive()
             if not data:
                 break
-            self.rxbs.extend(data)
+            if self.viewable:
+                self.rxbs.advance(len(data))
+            else:
+                self.rxbs.extend(data)
 
     def serviceReceiveOnce(self):
         '''
@@ -256,7 +277,10 @@ class Incomer(object):
         if not self.cutoff:
             data = self.receive()
             if data:
-                self.rxbs.extend(data)
+                if self.viewable:
+                    self.rxbs.advance(len(data))
+                else:
+                    self.rxbs.extend(data)
 
     def clearRxbs(self):
         """
@@ -267,6 +291,7 @@ class Incomer(object):
     def catRxbs(self):
         """
         Return copy and clear .rxbs
+        When .viewable returns memoryview valid until next receive instead
         """
         rx = self.rxbs[:]
         self.clearRxbs()
@@ -277,7 +302,10 @@ class Incomer(object):
         Returns duple of (bytes(self.rxbs[index:]), len(self.rxbs))
         slices the tail from index to end and converts to bytes
         also the length of .rxbs to be used to update index
+        When .viewable the tail is memoryview valid until next receive
         """
+        if self.viewable:  # memoryview not copy
+            return self.rxbs.tail(index)
         return (bytes(self.rxbs[index:]), len(self.rxbs))
 
     def send(self, data):
@@ -286,9 +314,13 @@ class Incomer(object):
         Return number of bytes sent
 
         data is string in python2 and bytes in python3
+        or list of bytes like buffers to gather into one send when vectored
         """
         try:
-            result = self.cs.send(data) #result is number of bytes sent
+            if isinstance(data, list):  # gather buffers in one syscall
+                result = self.cs.sendmsg(data)
+            else:
+                result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -313,6 +345,10 @@ class Incomer(object):
                 raise
 
         if result:
+            if isinstance(data, list) and (self.wlog or
+                    console._verbosity >= console.Wordage.profuse):
+                data = b"".join(data)  # copy only to log
+
             if console._verbosity >=  console.Wordage.profuse:
                 try:
                     load = data[:result].decode("UTF-8")
@@ -330,11 +366,70 @@ class Incomer(object):
 
         return result
 
+    def sendfile(self, fd, offset, count):
+        """
+        Perform non blocking send on connected socket .cs of up to count bytes
+        at offset of regular file with descriptor fd using os.sendfile so file
+        data is not copied through python.
+        Return number of bytes sent
+        Raises EOFError if count is not zero and offset is at end of file
+
+        When wire logged or profuse reads and sends through .send instead
+        """
+        if self.wlog or console._verbosity >= console.Wordage.profuse:
+            return self.send(self.preadfile(fd, offset, count))
+
+        try:
+            result = os.sendfile(self.cs.fileno(), fd, offset, count)
+            if not result and count:
+                raise EOFError("End of file at offset {0} while sendfile to "
+                               "{1}".format(offset, self.ca))
+        except socket.error as ex:
+            # ex.args[0] is always ex.errno for better compat
+            if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                result = 0  # blocked try again
+            elif ex.args[0] in (errno.ECONNRESET,
+                                errno.ENETRESET,
+                                errno.ENETUNREACH,
+                                errno.EHOSTUNREACH,
+                                errno.ENETDOWN,
+                                errno.EHOSTDOWN,
+                                errno.ETIMEDOUT,
+                                errno.ECONNREFUSED,
+                                errno.EPIPE):
+                emsg = ("socket.error = {0}: Incomer at {1} while sendfile "
+                        "to {2} \n".format(ex, self.ha, self.ca))
+                console.profuse(emsg)
+                self.cutoff = True  # this signals need to close/reopen connection
+                result = 0
+            else:
+                emsg = ("socket.error = {0}: Incomer at {1} while "
+                        "sendfile to {2}\n".format(ex, self.ha, self.ca))
+                console.profuse(emsg)
+                raise
+
+        if result and self.refreshable:
+            self.refresh()
+
+        return result
+
+    def preadfile(self, fd, offset, count):
+        """
+        Returns up to min(count, .bs) bytes read at offset of file descriptor fd
+        Raises EOFError if count is not zero and offset is at end of file
+        """
+        data = os.pread(fd, min(count, self.bs), offset)
+        if not data and count:
+            raise EOFError("End of file at offset {0} while sendfile to "
+                           "{1}".format(offset, self.ca))
+        return data
+
     def tx(self, data):
         '''
         Queue data onto .txes
         '''
         self.txes.append(data)
+        self._unsent += len(data)
 
     def serviceTxes(self):
         """
@@ -342,14 +437,52 @@ class Incomer(object):
         For each tx if all bytes sent then keep sending until partial send
         or no more to send
         If partial send reattach and return
+        When .vectored gather txes into each send
         """
         while self.txes and not self.cutoff:
+            if self.vectored:
+                if not self.gatherTxes():
+                    break  # try again later
+                continue
             data = self.txes.popleft()
+            self._unsent -= len(data)
             count = self.send(data)
             if count < len(data):  # put back unsent portion
                 self.txes.appendleft(data[count:])
+                self._unsent += len(data) - count
                 break  # try again later
 
+    @property
+    def unsent(self):
+        """
+        Returns number of bytes queued in .txes not yet sent
+        """
+        return self._unsent
+
+    def gatherTxes(self):
+        """
+        Service one vectored send of leading .txes gathered up to .TxBudget
+        bytes or .TxGather buffers. Fully sent buffers are removed and a
+        partially sent buffer is replaced by a memoryview of its unsent portion.
+        Returns True if all gathered sent False if blocked
+        """
+        buffers = []
+        size = 0
+        for data in self.txes:
+            buffers.append(data)
+            size += len(data)
+            if size >= self.TxBudget or len(buffers) >= self.TxGather:
+                break
+        count = self.send(buffers)
+        self._unsent -= count
+        for data in buffers:
+            if count < len(data):  # replace with unsent portion
+                self.txes[0] = memoryview(data)[count:]
+                return False
+            count -= len(data)
+            self.txes.popleft()
+        return True
+
 
 class IncomerTls(Incomer):
     """
@@ -465,7 +598,11 @@ class IncomerTls(Incomer):
         data is string in python2 and bytes in python3
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.viewable:  # receive into reserved space of .rxbs
+                view = self.rxbs.reserve(self.bs)
+                data = view[:self.cs.recv_into(view, self.bs)]
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
             if  ex.args[0] in (ssl.SSL_ERROR_WANT_READ, ssl.SSL_ERROR_WANT_WRITE):
@@ -493,7 +630,7 @@ class IncomerTls(Incomer):
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(data).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data).decode("ASCII"))
                 cmsg = ("Incomer at {0}, received from {1}:\n------------\n"
@@ -514,8 +651,11 @@ class IncomerTls(Incomer):
         Return number of bytes sent
 
         data is string in python2 and bytes in python3
+        or list of bytes like buffers to gather into one send when vectored
         """
         try:
+            if isinstance(data, list):  # no sendmsg for tls so coalesce
+                data = b"".join(data)
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
@@ -556,6 +696,17 @@ class IncomerTls(Incomer):
 
         return result
 
+    def sendfile(self, fd, offset, count):
+        """
+        Perform non blocking send on connected socket .cs of up to count bytes
+        at offset of regular file with descriptor fd.
+        Return number of bytes sent
+        Raises EOFError if count is not zero and offset is at end of file
+
+        TLS must encrypt in user space so reads and sends through .send
+        """
+        return self.send(self.preadfile(fd, offset, count))
+
 
 class Acceptor(object):
     """
@@ -707,18 +858,32 @@ class Server(Acceptor):
     Nonblocking TCP Socket Server Class.
     Listen socket for incoming TCP connections
     Incomer sockets for accepted connections
+
+    When .selected the sockets are registered with .selector (epoll on linux)
+    and each service pass selects once without blocking so that only ready
+    sockets are accepted from, received from or sent to instead of attempting
+    every socket. An incomer is registered for write readiness only while its
+    .txes are blocked. Each select result is consumed once by each of
+    serviceAccepts, serviceReceivesAllIx and serviceTxesAllIx and a consumer
+    selects again when its result was already consumed.
     """
     Timeout = 1.0  # timeout in seconds
 
     def __init__(self,
                  store=None,
                  timeout=None,
+                 selected=False,
+                 viewable=False,
+                 vectored=False,
                  **kwa):
         """
         Initialization method for instance.
 
         store = data store reference if any
         timeout = default timeout for incoming connections
+        selected = True if service only sockets selected ready by .selector
+        viewable = True if incomers receive with recv_into into Bytebuffer
+        vectored = True if incomers gather txes into vectored sends
         """
         super(Server, self).__init__(**kwa)
         self.store = store or storing.Store(stamp=0.0)
@@ -726,6 +891,107 @@ class Server(Acceptor):
 
         self.ixes = odict()  # ready to rx tx incoming connections, Incomer instances
 
+        self.viewable = True if viewable else False
+        self.vectored = True if vectored else False
+        self.selected = True if selected else False
+        self.selector = None  # readiness selector when .selected and opened
+        self.acceptable = None  # True if listen socket ready in latest select
+        self.readables = None  # list of incomers ready to rx in latest select
+        self.writables = None  # set of incomers ready to tx in latest select
+        self.blockeds = set()  # incomers registered for write readiness
+
+    def open(self):
+        """
+        Opens binds listen socket in non blocking mode.
+        When .selected also registers listen socket and .ixes with .selector
+        """
+        if not super(Server, self).open():
+            return False
+
+        if self.selected:
+            if self.selector is None:
+                self.selector = selectors.DefaultSelector()
+            self.selector.register(self.ss, selectors.EVENT_READ)
+            for ix in self.ixes.values():
+                if ix.cs:
+                    self.selectIx(ix)
+        return True
+
+    def close(self):
+        """
+        Closes listen socket.
+        """
+        if self.selector is not None and self.ss:
+            try:
+                self.selector.unregister(self.ss)
+            except (KeyError, ValueError):  # not registered
+                pass
+        super(Server, self).close()
+
+    def selectIx(self, ix, events=selectors.EVENT_READ):
+        """
+        Register socket of incomer ix with .selector for readiness events or
+        modify its registered events.
+        Replaces a stale registration of a closed socket with same descriptor
+        """
+        key = self.selector.get_map().get(ix.cs.fileno())
+        if key is None:
+            self.selector.register(ix.cs, events, ix)
+        elif key.fileobj is not ix.cs or key.data is not ix:  # stale
+            self.selector.unregister(key.fileobj)
+            self.selector.register(ix.cs, events, ix)
+        elif key.events != events:
+            self.selector.modify(ix.cs, events, ix)
+
+    def unselectIx(self, ix):
+        """
+        Unregister socket of incomer ix from .selector if registered
+        """
+        self.blockeds.discard(ix)
+        if self.selector is not None and ix.cs:
+            try:
+                self.selector.unregister(ix.cs)
+            except (KeyError, ValueError):  # not registered
+                pass
+
+    def serviceSelects(self):
+        """
+        Select ready sockets from .selector without blocking into
+        .acceptable, .readables and .writables
+        Drops registrations of incomers closed or removed from .ixes
+        """
+        self.acceptable = False
+        readables = []
+        writables = set()
+        for key, events in self.selector.select(timeout=0):
+            ix = key.data
+            if ix is None:  # listen socket
+                self.acceptable = True
+                continue
+            if ix.cs is not key.fileobj or self.ixes.get(ix.ca) is not ix:  # stale
+                self.selector.unregister(key.fileobj)
+                self.blockeds.discard(ix)
+                continue
+            if events & selectors.EVENT_READ:
+                readables.append(ix)
+            if events & selectors.EVENT_WRITE:
+                writables.add(ix)
+        self.readables = readables
+        self.writables = writables
+
+    def serviceAccepts(self):
+        """
+        Service any accept requests
+        When .selected only if listen socket selected ready
+        """
+        if self.selected:
+            if self.acceptable is None:  # consumed so select again
+                self.serviceSelects()
+            acceptable, self.acceptable = self.acceptable, None
+            if not acceptable:
+                return
+        super(Server, self).serviceAccepts()
+
     def serviceAxes(self):
         """
         Service axes
@@ -746,10 +1012,14 @@ class Server(Acceptor):
                               cs=cs,
                               wlog=self.wlog,
                               store=self.store,
-                              timeout=self.timeout)
+                              timeout=self.timeout,
+                              viewable=self.viewable,
+                              vectored=self.vectored)
             if ca in self.ixes and self.ixes[ca] is not incomer:
                 self.shutdownIx[ca]
             self.ixes[ca] = incomer
+            if self.selector is not None:
+                self.selectIx(incomer)
 
     def serviceConnects(self):
         """
@@ -791,6 +1061,7 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unselectIx(self.ixes[ca])
         self.ixes[ca].close()
 
     def closeAllIx(self):
@@ -798,6 +1069,7 @@ class Server(Acceptor):
         Shutdown and close all incomer connections
         """
         for ix in self.ixes.values():
+            self.unselectIx(ix)
             ix.close()
 
     def closeAll(self):
@@ -806,6 +1078,9 @@ class Server(Acceptor):
         """
         self.close()
         self.closeAllIx()
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
 
     def removeIx(self, ca, shutclose=True):
         """
@@ -814,6 +1089,7 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unselectIx(self.ixes[ca])
         if shutclose:
             self.ixes[ca].shutclose()  #  alias of .close()
         del self.ixes[ca]
@@ -839,7 +1115,17 @@ class Server(Acceptor):
     def serviceReceivesAllIx(self):
         """
         Service receives for all incomers in .ixes
+        When .selected only for incomers selected ready to receive
         """
+        if self.selected and self.selector is not None:
+            if self.readables is None:  # consumed so select again
+                self.serviceSelects()
+            readables, self.readables = self.readables, None
+            for ix in readables:
+                if ix.cs and self.ixes.get(ix.ca) is ix:  # not since removed
+                    ix.serviceReceives()
+            return
+
         for ix in self.ixes.values():
             ix.serviceReceives()
 
@@ -855,7 +1141,31 @@ class Server(Acceptor):
     def serviceTxesAllIx(self):
         """
         Service transmits for all incomers in .ixes
-        """
+        When .selected only for incomers with .txes that are either not
+        blocked or selected ready to transmit. Incomers whose .txes remain
+        blocked are registered for write readiness until drained.
+        """
+        if self.selected and self.selector is not None:
+            if self.writables is None:  # consumed so select again
+                self.serviceSelects()
+            writables, self.writables = self.writables, None
+            blockeds = self.blockeds
+            for ix in self.ixes.values():
+                if ix.txes:
+                    if ix in blockeds and ix not in writables:  # still blocked
+                        continue
+                    ix.serviceTxes()
+                    if ix.txes and ix.cs and not ix.cutoff:  # now blocked
+                        if ix not in blockeds:
+                            self.selectIx(ix, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                            blockeds.add(ix)
+                        continue
+                if ix in blockeds:  # drained
+                    blockeds.discard(ix)
+                    if ix.cs:
+                        self.selectIx(ix)
+            return
+
         for ix in self.ixes.values():
             ix.serviceTxes()
 
@@ -926,6 +1236,8 @@ class ServerTls(Server):
                                  wlog=self.wlog,
                                  store=self.store,
                                  timeout=self.timeout,
+                                 viewable=self.viewable,
+                                 vectored=self.vectored,
                                  context=self.context,
                                  version=self.version,
                                  certify=self.certify,
@@ -945,6 +1257,8 @@ class ServerTls(Server):
             if cx.serviceHandshake():
                 self.ixes[ca] = cx
                 del self.cxes[ca]
+                if self.selector is not None:
+                    self.selectIx(cx)
 
     def serviceConnects(self):
         """
@@ -14,6 +14,7 @@ import errno
 
 from ioflo.aid.sixing import *
 from ioflo.aid.consoling import getConsole
+from ioflo.aid import byting
 from ioflo.aio import wiring
 from ioflo.aio.tcp import serving, clienting
 from ioflo.base import storing
@@ -739,6 +740,278 @@ class BasicTestCase(unittest.TestCase):
         shutil.rmtree(tempDirpath)
         console.reinit(verbosity=console.Wordage.concise)
 
+    def testTcpClientServerSelected(self):
+        """
+        Test Classes Server and Client selected readiness servicing
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerSelected.__doc__))
+
+        alpha = serving.Server(port = 6101, bufsize=131072, selected=True)
+        self.assertIs(alpha.reopen(), True)
+        self.assertIs(alpha.selected, True)
+        self.assertIsNotNone(alpha.selector)
+        self.assertEqual(len(alpha.selector.get_map()), 1)  # listen socket
+
+        beta = clienting.Client(ha=alpha.eha, bufsize=131072, selected=True)
+        self.assertIs(beta.reopen(), True)
+        idlers = [clienting.Client(ha=alpha.eha, bufsize=131072) for i in range(8)]
+        for idler in idlers:
+            self.assertIs(idler.reopen(), True)
+
+        console.terse("Connecting beta and idlers to alpha\n")
+        while True:
+            beta.serviceConnect()
+            for idler in idlers:
+                idler.serviceConnect()
+            alpha.serviceConnects()
+            if (beta.connected and beta.ca in alpha.ixes and
+                    all(idler.connected and idler.ca in alpha.ixes for idler in idlers)):
+                break
+            time.sleep(0.05)
+
+        self.assertEqual(len(alpha.ixes), 9)
+        self.assertEqual(len(alpha.selector.get_map()), 10)
+        ixBeta = alpha.ixes[beta.ca]
+
+        msgOut = b"Beta sends to Alpha"
+        beta.tx(msgOut)
+        beta.serviceTxes()
+        self.assertIs(beta.blocked, False)
+        time.sleep(0.05)
+        alpha.serviceSelects()
+        self.assertEqual(alpha.readables, [ixBeta])  # idlers not ready
+        alpha.serviceReceivesAllIx()
+        self.assertIsNone(alpha.readables)  # consumed
+        self.assertEqual(bytes(ixBeta.rxbs), msgOut)
+        ixBeta.clearRxbs()
+
+        # big enough to block alpha until beta receives
+        msgOutBig = b"0123456789abcdef" * (1 << 20)
+        ixBeta.tx(msgOutBig)
+        alpha.serviceTxesAllIx()
+        self.assertTrue(ixBeta.txes)
+        self.assertIn(ixBeta, alpha.blockeds)
+        key = alpha.selector.get_key(ixBeta.cs)
+        self.assertEqual(key.events, serving.selectors.EVENT_READ |
+                                     serving.selectors.EVENT_WRITE)
+        while len(beta.rxbs) < len(msgOutBig):
+            alpha.serviceTxesAllIx()
+            beta.serviceReceives()
+        self.assertEqual(bytes(beta.rxbs), msgOutBig)
+        beta.clearRxbs()
+        alpha.serviceTxesAllIx()
+        self.assertNotIn(ixBeta, alpha.blockeds)
+        key = alpha.selector.get_key(ixBeta.cs)
+        self.assertEqual(key.events, serving.selectors.EVENT_READ)
+
+        # big from beta blocks beta until alpha receives
+        beta.tx(msgOutBig)
+        beta.serviceTxes()
+        self.assertIs(beta.blocked, True)
+        while len(ixBeta.rxbs) < len(msgOutBig):
+            beta.serviceTxes()
+            alpha.serviceReceivesAllIx()
+        self.assertEqual(bytes(ixBeta.rxbs), msgOutBig)
+        ixBeta.clearRxbs()
+        beta.serviceTxes()
+        self.assertIs(beta.blocked, False)
+
+        # incomer closed without server is replaced when descriptor reused
+        gamma = clienting.Client(ha=alpha.eha, bufsize=131072)
+        self.assertIs(gamma.reopen(), True)
+        idler = idlers[0]
+        ixIdler = alpha.ixes[idler.ca]
+        fd = ixIdler.cs.fileno()
+        ixIdler.close()
+        del alpha.ixes[idler.ca]
+        while not (gamma.connected and gamma.ca in alpha.ixes):
+            gamma.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.05)
+        ixGamma = alpha.ixes[gamma.ca]
+        self.assertEqual(ixGamma.cs.fileno(), fd)
+        self.assertIs(alpha.selector.get_key(fd).data, ixGamma)
+        gamma.tx(b"Gamma")
+        gamma.serviceTxes()
+        while not ixGamma.rxbs:
+            alpha.serviceAll()
+            time.sleep(0.05)
+        self.assertEqual(bytes(ixGamma.rxbs), b"Gamma")
+        gamma.close()
+
+        # cutoff by far side is selected ready
+        idler = idlers[2]
+        ixIdler = alpha.ixes[idler.ca]
+        idler.close()
+        while not ixIdler.cutoff:
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.05)
+        alpha.removeIx(idler.ca)
+        self.assertEqual(len(alpha.selector.get_map()), 9)
+
+        # incomer removed without server is dropped when selected
+        idler = idlers[1]
+        ixIdler = alpha.ixes[idler.ca]
+        del alpha.ixes[idler.ca]
+        idler.tx(b"Lost")
+        idler.serviceTxes()
+        time.sleep(0.05)
+        alpha.serviceAll()
+        self.assertEqual(len(alpha.selector.get_map()), 8)
+        self.assertEqual(ixIdler.rxbs, b"")
+        ixIdler.close()
+
+        alpha.closeAll()
+        self.assertIsNone(alpha.selector)
+        beta.close()
+        self.assertIsNone(beta.selector)
+        for idler in idlers:
+            idler.close()
+
+    def testTcpClientServerViewable(self):
+        """
+        Test Classes Server and Client viewable receives into Bytebuffer
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerViewable.__doc__))
+        console.reinit(verbosity=console.Wordage.profuse)
+
+        wireLog = wiring.WireLog(buffify=True)
+        result = wireLog.reopen()
+
+        alpha = serving.Server(port = 6101, bufsize=1024, viewable=True)
+        self.assertIs(alpha.reopen(), True)
+
+        beta = clienting.Client(ha=alpha.eha, bufsize=1024, wlog=wireLog,
+                                viewable=True)
+        self.assertIsInstance(beta.rxbs, byting.Bytebuffer)
+        self.assertIs(beta.reopen(), True)
+
+        console.terse("Connecting beta to alpha\n")
+        while True:
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            if beta.connected and beta.ca in alpha.ixes:
+                break
+            time.sleep(0.05)
+
+        ixBeta = alpha.ixes[beta.ca]
+        self.assertIs(ixBeta.viewable, True)
+        self.assertIsInstance(ixBeta.rxbs, byting.Bytebuffer)
+
+        msgOut = b"Beta sends to Alpha"
+        beta.tx(msgOut)
+        while len(ixBeta.rxbs) < len(msgOut):
+            beta.serviceTxes()
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.05)
+        tail, index = ixBeta.tailRxbs(5)
+        self.assertIsInstance(tail, memoryview)
+        self.assertEqual(tail, msgOut[5:])
+        self.assertEqual(index, len(msgOut))
+        msgIn = ixBeta.catRxbs()
+        self.assertIsInstance(msgIn, memoryview)
+        self.assertEqual(msgIn, msgOut)
+        self.assertEqual(len(ixBeta.rxbs), 0)
+
+        # message bigger than buffer grows buffer
+        msgOutBig = b"".join(ns2b("{0:0>7d} ".format(i)) for i in range(1024))
+        ixBeta.tx(msgOutBig)
+        while len(beta.rxbs) < len(msgOutBig):
+            alpha.serviceTxesAllIx()
+            beta.serviceReceives()
+            time.sleep(0.05)
+        self.assertGreaterEqual(beta.rxbs.capacity, len(msgOutBig))
+        self.assertEqual(bytes(beta.catRxbs()), msgOutBig)
+
+        alpha.close()
+        beta.close()
+
+        self.assertTrue(wireLog.getRx().startswith(b"RX ('127.0.0.1', 6101)\n0000000 "))
+        wireLog.close()
+        console.reinit(verbosity=console.Wordage.concise)
+
+    def testTcpClientServerVectored(self):
+        """
+        Test Classes Server and Client vectored sends gather txes
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerVectored.__doc__))
+
+        wireLog = wiring.WireLog(buffify=True)
+        result = wireLog.reopen()
+
+        alpha = serving.Server(port = 6101, bufsize=131072, vectored=True)
+        self.assertIs(alpha.reopen(), True)
+
+        beta = clienting.Client(ha=alpha.eha, bufsize=131072, wlog=wireLog,
+                                vectored=True)
+        self.assertIs(beta.reopen(), True)
+
+        console.terse("Connecting beta to alpha\n")
+        while True:
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            if beta.connected and beta.ca in alpha.ixes:
+                break
+            time.sleep(0.05)
+
+        ixBeta = alpha.ixes[beta.ca]
+        self.assertIs(ixBeta.vectored, True)
+
+        msgOuts = [b"First Message", bytearray(b" Second"), memoryview(b" Third")]
+        for msg in msgOuts:
+            beta.tx(msg)
+        self.assertEqual(beta.unsent, 26)
+        beta.serviceTxes()  # one gathered send
+        self.assertEqual(beta.unsent, 0)
+        self.assertEqual(len(beta.txes), 0)
+        msgIn = b''
+        while len(msgIn) < 26:
+            alpha.serviceReceivesAllIx()
+            msgIn += ixBeta.catRxbs()
+            time.sleep(0.05)
+        self.assertEqual(msgIn, b"First Message Second Third")
+        self.assertEqual(wireLog.getTx(),
+                         b"TX ('127.0.0.1', 6101)\nFirst Message Second Third\n")
+
+        # partial sends of more than socket buffer keep unsent as memoryview
+        size = ixBeta.cs.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        chunk = b"".join(ns2b("{0:0>7d} ".format(i)) for i in range(1024))
+        count = 0
+        while len(chunk) * count <= size * 4:
+            ixBeta.tx(chunk)
+            count += 1
+        msgOutBig = chunk * count
+        ixBeta.serviceTxes()
+        self.assertGreater(ixBeta.unsent, 0)
+        self.assertLess(ixBeta.unsent, len(msgOutBig))
+        msgIn = b''
+        while len(msgIn) < len(msgOutBig):
+            alpha.serviceTxesAllIx()
+            beta.serviceReceives()
+            msgIn += beta.catRxbs()
+        self.assertEqual(msgIn, msgOutBig)
+        self.assertEqual(ixBeta.unsent, 0)
+
+        # unsent tracks partial sends without gathering too
+        ixBeta.vectored = False
+        for i in range(count):
+            ixBeta.tx(chunk)
+        ixBeta.serviceTxes()
+        self.assertGreater(ixBeta.unsent, 0)
+        self.assertEqual(ixBeta.unsent, sum(len(data) for data in ixBeta.txes))
+        msgIn = b''
+        while len(msgIn) < len(msgOutBig):
+            alpha.serviceTxesAllIx()
+            self.assertEqual(ixBeta.unsent, sum(len(data) for data in ixBeta.txes))
+            beta.serviceReceives()
+            msgIn += beta.catRxbs()
+        self.assertEqual(msgIn, msgOutBig)
+        self.assertEqual(ixBeta.unsent, 0)
+
+        alpha.close()
+        beta.close()
+        wireLog.close()
+
     def testClientAutoReconnect(self):
         """
         Test Classes Client/Outgoer reconnectable
@@ -1765,6 +2038,9 @@ def runSome():
              'testTcpClientServer',
              'testTcpClientServerServiceCat',
              'testTcpClientServerService',
+             'testTcpClientServerSelected',
+             'testTcpClientServerViewable',
+             'testTcpClientServerVectored',
              'testClientAutoReconnect',
              'testTLSConnectionDefault',
              'testTLSConnectionVerifyNeither',
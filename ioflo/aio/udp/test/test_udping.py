@@ -119,6 +119,36 @@ class BasicTestCase(unittest.TestCase):
         shutil.rmtree(tempDirpath)
         console.reinit(verbosity=console.Wordage.concise)
 
+    def testSocketUdpNbBatch(self):
+        """
+        Test Class SocketUdpNb batched receive and send
+        """
+        console.terse("{0}\n".format(self.testSocketUdpNbBatch.__doc__))
+        console.reinit(verbosity=console.Wordage.concise)
+
+        alpha = udping.SocketUdpNb(port = 6101, bufsize=131072)
+        self.assertIs(alpha.reopen(), True)
+        self.assertEqual(len(alpha.rxbuf), 131072)
+
+        beta = udping.SocketUdpNb(port = 6102, bufsize=131072)
+        self.assertIs(beta.reopen(), True)
+
+        self.assertEqual(beta.receiveBatch(), [])  # nothing yet
+
+        msgs = [ns2b("alpha sends to beta {0}".format(i)) for i in range(100)]
+        self.assertEqual(alpha.sendBatch([(msg, beta.ha) for msg in msgs]), 100)
+        time.sleep(0.05)
+
+        grams = beta.receiveBatch()
+        self.assertEqual(len(grams), udping.SocketUdpNb.Budget)
+        grams.extend(beta.receiveBatch(budget=100))
+        self.assertEqual([data for data, sa in grams], msgs)
+        self.assertEqual(set(sa[1] for data, sa in grams), set([alpha.ha[1]]))
+        self.assertEqual(beta.receiveBatch(), [])
+
+        alpha.close()
+        beta.close()
+
     def testBroadcast(self):
         """
         Test Class SocketUdpNb
@@ -209,6 +239,7 @@ def runSome():
     tests =  []
     names = [
              'testSocketUdpNb',
+             'testSocketUdpNbBatch',
              'testBroadcast',
             ]
     tests.extend(map(BasicTestCase, names))
@@ -26,6 +26,7 @@ class SocketUdpNb(object):
     """
     Class to manage non blocking I/O on UDP socket.
     """
+    Budget = 64  # default max datagrams per batch receive or send
 
     def __init__(self,
                  ha=None,
@@ -52,6 +53,7 @@ class SocketUdpNb(object):
 
         self.ss = None #server's socket needs to be opened
         self.opened = False
+        self.rxbuf = bytearray(self.bs)  # preallocated batch receive buffer
 
     def actualBufSizes(self):
         """
@@ -177,6 +179,88 @@ class SocketUdpNb(object):
 
         return result
 
+    def receiveBatch(self, budget=None):
+        """
+        Perform non blocking reads on socket of up to budget datagrams
+        into preallocated .rxbuf in one call.
+
+        returns list of duples of form (data, sa) which is empty if no data
+        """
+        budget = budget if budget is not None else self.Budget
+        recv = self.ss.recvfrom_into
+        buf = self.rxbuf
+        view = memoryview(buf)
+        size = len(buf)
+        grams = []
+        while len(grams) < budget:
+            try:
+                count, sa = recv(view, size)  # sa is source (host, port)
+            except socket.error as ex:
+                # ex.args[0] is always ex.errno for better compat
+                if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break  # nothing more to receive
+                emsg = "socket.error = {0}: receiving at {1}\n".format(ex, self.ha)
+                console.profuse(emsg)
+                if grams:
+                    break  # return received so raised again on next call
+                raise #re raise exception ex1
+            grams.append((bytes(view[:count]), sa))
+        view.release()
+
+        if grams and (self.wlog or console._verbosity >= console.Wordage.profuse):
+            for data, sa in grams:
+                if console._verbosity >= console.Wordage.profuse:
+                    try:
+                        load = data.decode("UTF-8")
+                    except UnicodeDecodeError as ex:
+                        load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    cmsg = ("Server at {0}, received from {1}:\n------------\n"
+                               "{2}\n\n".format(self.ha, sa, load))
+                    console.profuse(cmsg)
+
+                if self.wlog:  # log over the wire rx
+                    self.wlog.writeRx(sa, data)
+
+        return grams
+
+    def sendBatch(self, grams):
+        """
+        Perform non blocking sends on socket of sequence of datagram duples of
+        form (data, da) in one call.
+        da is destination address tuple (destHost, destPort)
+
+        returns number of datagrams sent. Stops at first that errors which is
+        raised only when first so remainder may be retried by caller
+        """
+        sendto = self.ss.sendto
+        sent = 0
+        for data, da in grams:
+            try:
+                sendto(data, da)
+            except socket.error as ex:
+                emsg = "socket.error = {0}: sending from {1} to {2}\n".format(ex, self.ha, da)
+                console.profuse(emsg)
+                if sent:
+                    break
+                raise
+            sent += 1
+
+        if sent and (self.wlog or console._verbosity >= console.Wordage.profuse):
+            for data, da in grams[:sent]:
+                if console._verbosity >= console.Wordage.profuse:
+                    try:
+                        load = data.decode("UTF-8")
+                    except UnicodeDecodeError as ex:
+                        load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    cmsg = ("Server at {0}, sent {1} bytes to {2}:\n------------\n"
+                            "{3}\n\n".format(self.ha, len(data), da, load))
+                    console.profuse(cmsg)
+
+                if self.wlog:
+                    self.wlog.writeTx(da, data)
+
+        return sent
+
 
 PeerUdp = SocketUdpNb  # alias
 
@@ -81,6 +81,35 @@ def parseArgs(version=__version__):
             help=("Profile and compute performance statistics. "
             "Put statistics into file path given by optional argument. "
             "Default statistics file path is /tmp/ioflo/profile/NAME. "))
+    p.add_argument('-H', '--heaped',
+            action='store_const',
+            const=True,
+            default=False,
+            help="Schedule taskers with priority queue so only due taskers are visited.")
+    p.add_argument('-C', '--compiled',
+            action='store_const',
+            const=True,
+            default=False,
+            help="Run frames from compiled act plans with prebound actions and parms.")
+    p.add_argument('--policy',
+            action='store',
+            choices=skedding.Policies,
+            default="burst",
+            help=("Real time overrun catch up policy. burst runs missed "
+                  "iterations back to back, skip drops them, stretch stretches "
+                  "the overrun period."))
+    p.add_argument('-T', '--profiled',
+            action='store_const',
+            const=True,
+            default=False,
+            help=("Time skedder iterations, taskers and frame acts into "
+                  "the .meta.profile node of each house store."))
+    p.add_argument('-W', '--workers',
+            action='store',
+            type=int,
+            default=0,
+            help=("Number of worker processes to run houses in. "
+                  "Default 0 runs all houses in one process."))
     args = p.parse_args()
 
     if args.verbose in consoling.VERBIAGE_NAMES:
@@ -110,7 +139,12 @@ def run(name="skedder",
         statistics="",
         houses=None,
         metas=None,
-        preloads=None,        ):
+        preloads=None,
+        heaped=False,
+        compiled=False,
+        profiled=False,
+        policy="burst",
+        workers=0,      ):
     """ Run Skedder"""
     console = consoling.getConsole(verbosity=consoling.Console.Wordage[verbose],
                                    path=consolepath)
@@ -129,7 +163,12 @@ def run(name="skedder",
                                password=password,
                                houses=houses,
                                metas=metas,
-                               preloads=preloads)
+                               preloads=preloads,
+                               heaped=heaped,
+                               compiled=compiled,
+                               profiled=profiled,
+                               policy=policy,
+                               workers=workers)
     if skedder.build():
         console.terse("\n----------------------\n")
         console.terse("Starting mission plan '{0}' from file:\n    {1}\n".format(
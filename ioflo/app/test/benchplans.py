@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks the example FloScripts
+
+Reports the mean real time cost per skedder iteration of each plan at the
+given console verbosity. Build time is excluded.
+When compiled is 1 frames run from compiled act plans.
+
+$ python benchplans.py [verbosity] [repeats] [compiled]
+
+"""
+import sys
+import os
+import time
+
+from ioflo.aid import consoling
+from ioflo.base import skedding
+
+from runplans import getPlanFiles
+
+
+def bench(plan, verbose=1, repeats=5, compiled=False):
+    """
+    Returns duple (iterations, seconds) where iterations is the number of
+    skedder iterations of plan and seconds is the best run time of repeats runs
+    """
+    name, ext = os.path.splitext(os.path.basename(plan))
+    best = None
+    iterations = 0
+    for i in range(repeats):
+        skedder = skedding.Skedder(name=name,
+                                   period=0.0625,
+                                   filepath=plan,
+                                   real=False,
+                                   compiled=compiled)
+        if not skedder.build():
+            return (0, 0.0)
+        start = time.perf_counter()
+        skedder.run()
+        seconds = time.perf_counter() - start
+        iterations = int(round(skedder.stamp / skedder.period)) + 1
+        if best is None or seconds < best:
+            best = seconds
+    return (iterations, best)
+
+
+def main(verbose=1, repeats=5, compiled=False):
+    """ Benchmark example scripts"""
+    console = consoling.getConsole(verbosity=consoling.Console.Wordage[verbose],
+                                   path=os.devnull)
+    total = 0.0
+    count = 0
+    results = []
+    for plan in sorted(getPlanFiles()):
+        iterations, seconds = bench(plan,
+                                    verbose=verbose,
+                                    repeats=repeats,
+                                    compiled=compiled)
+        if not iterations:
+            continue
+        results.append((os.path.basename(plan), iterations, seconds))
+        total += seconds
+        count += iterations
+
+    console.reinit(path='')
+    for name, iterations, seconds in results:
+        print("{0:<28} {1:>6d} iterations {2:>10.1f} us/iteration".format(
+                name, iterations, 1e6 * seconds / iterations))
+    print("{0:<28} {1:>6d} iterations {2:>10.1f} us/iteration".format(
+            "all", count, 1e6 * total / count))
+
+
+if __name__ == '__main__':
+    verbose = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    compiled = bool(int(sys.argv[3])) if len(sys.argv) > 3 else False
+    main(verbose=verbose, repeats=repeats, compiled=compiled)
@@ -7,7 +7,7 @@ import importlib
 
 _modules = ['globaling', 'excepting', 'interfacing',
            'registering', 'storing', 'skedding',
-           'tasking', 'framing', 'logging', 'serving', 'monitoring',
+           'tasking', 'profiling', 'framing', 'logging', 'serving', 'monitoring',
            'acting', 'poking', 'goaling', 'needing', 'traiting',
            'fiating', 'wanting','completing','doing', 'deeding', 'arbiting',
            'housing', 'building']
@@ -16,5 +16,5 @@ _modules = ['globaling', 'excepting', 'interfacing',
 for m in _modules:
     importlib.import_module(".{0}".format(m), package='ioflo.base')
 
-from .storing import Store, Node, Share, Data, Deck
+from .storing import Store, Node, Share, Clock, Data, Record, Deck
 from .doing import doify, Doer, DoerParam, DoerSince, DoerLapse
@@ -7,7 +7,7 @@ import time
 import struct
 from collections import deque
 from collections.abc import Mapping
-from functools import wraps
+from functools import wraps, partial
 import inspect
 import copy
 try:
@@ -109,6 +109,21 @@ class Act(object):
         """ Define act as callable object """
         return (self.actor(**self.parms))
 
+    def compile(self):
+        """
+        Return callable that behaves as self() with .actor.action and .parms
+        prebound so calling it skips the Act and Actor call dispatch.
+        Returns self when self or .actor overrides __call__ or .actor is
+        unresolved
+        """
+        if (type(self).__call__ is Act.__call__ and
+                isinstance(self.actor, Actor) and
+                type(self.actor).__call__ is Actor.__call__):
+            if self.parms:
+                return partial(self.actor.action, **self.parms)
+            return self.actor.action
+        return self
+
     def expose(self):
         """ Show attributes"""
         console.terse("Act Actor {0} Parms {1} in Frame {2} Context {3} SuperAct {4}\n".format(
@@ -446,7 +461,7 @@ class Act(object):
                 ipath = self.frame.store.createNode(ipath.rstrip('.'))
                 if warn:
                     console.profuse( "     Warning: Non-existent node '{0}' "
-                                        "... creating anyway\n".format(ipath))
+                                        "... creating anyway\n", ipath)
             else: # Share
                 ipath = self.frame.store.create(ipath)
                 if ival is not None:
@@ -456,7 +471,7 @@ class Act(object):
                         ipath.create(ival)
                 if warn:
                     console.profuse( "     Warning: Non-existent node '{0}' "
-                                     "... creating anyway\n".format(ipath))
+                                     "... creating anyway\n", ipath)
 
         return ipath
 
@@ -525,6 +540,17 @@ class SideAct(Act):
         """ Define call method named .action of .actor """
         return (getattr(self.actor, self.action)(**self.parms))
 
+    def compile(self):
+        """
+        Return callable that behaves as self() with method named .action of
+        .actor and .parms prebound. Returns self if .actor is unresolved
+        """
+        if type(self).__call__ is SideAct.__call__ and isinstance(self.actor, Actor):
+            if self.parms:
+                return partial(getattr(self.actor, self.action), **self.parms)
+            return getattr(self.actor, self.action)
+        return self
+
     def resolve(self, **kwa):
         """ Assumes all has been resolved.
             Check for valid action
@@ -627,10 +653,11 @@ class Actor(object):
 
     def action(self, **kwa):
         """Action called by Actor. Should override in subclass."""
-        console.profuse("Actioning {0} in {1} of {2} with {3}\n".format(self.name,
-                                                                        self._act.frame.name,
-                                                                        self._act.frame.framer.name,
-                                                                        str(kwa)))
+        console.profuse("Actioning {0} in {1} of {2} with {3}\n",
+                        self.name,
+                        self._act.frame.name,
+                        self._act.frame.framer.name,
+                        kwa)
         pass
 
     def _expose(self):
@@ -845,14 +872,14 @@ class Actor(object):
         for dstField, srcField in izip(dstFields, srcFields):
             if (dstField != srcField) and (srcField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' ... creating anyway".format(
-                                  dstField, dst.name, srcField))
+                                "from '{2}' ... creating anyway",
+                                  dstField, dst.name, srcField)
 
         #create any non existent destination fields
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' in "
-                       "share {1} ... creating anyway\n".format(field, dst.name))
+                       "share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return dstFields
@@ -901,20 +928,20 @@ class Actor(object):
         for dstField, srcField in izip(dstFields, srcFields):
             if (dstField != srcField) and (srcField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' in {3}  ... creating anyway".format(
-                                    dstField, dst.name, srcField, src.name))
+                                "from '{2}' in {3}  ... creating anyway",
+                                    dstField, dst.name, srcField, src.name)
 
         #create any non existent source or destination fields
         for field in srcFields: #use source fields for source data
             if field not in src:
                 console.profuse("     Warning: Transfer from non-existent field '{0}' "
-                        "in share {1} ... creating anyway".format(field, src.name))
+                        "in share {1} ... creating anyway", field, src.name)
                 src[field] = None #create
 
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' "
-                        "in share {1} ... creating anyway\n".format(field, dst.name))
+                        "in share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return (srcFields, dstFields)
@@ -1044,14 +1071,15 @@ class Transiter(Interrupter):
 
         framer = near.framer #to speed up
 
-        console.profuse("Attempt segue from {0} to {1}\n".format(near.name, far.name))
+        console.profuse("Attempt segue from {0} to {1}\n", near.name, far.name)
 
         for act in needs:
             if not act(): #return None if not all true
                 return None
 
-        console.profuse("     active outline: {0}\n".format([frame.name for frame in framer.actives]))
-        console.profuse("     far outline: {0}\n".format([frame.name for frame in far.outline]))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("     active outline: {0}\n".format([frame.name for frame in framer.actives]))
+            console.profuse("     far outline: {0}\n".format([frame.name for frame in far.outline]))
 
         #find uncommon entry and exit lists associated with transition
         #exits, enters = framing.Framer.Uncommon(framer.actives,far.outline)
@@ -1067,9 +1095,10 @@ class Transiter(Interrupter):
             framer.human, framer.elapsed)
         console.terse(msg)
 
-        console.profuse("     exits: {0}\n".format([frame.name for frame in exits]))
-        console.profuse("     enters: {0}\n".format([frame.name for frame in enters]))
-        console.profuse("     reexens: {0}\n".format([frame.name for frame in reexens]))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("     exits: {0}\n".format([frame.name for frame in exits]))
+            console.profuse("     enters: {0}\n".format([frame.name for frame in enters]))
+            console.profuse("     reexens: {0}\n".format([frame.name for frame in reexens]))
 
         for act in self._tracts:  # transit sub-context of segue precur
             act()
@@ -1136,8 +1165,8 @@ class Suspender(Interrupter):
                         human=self._act.human,
                         count=self._act.count)
         self._act.frame.addExact(deAct)
-        console.profuse("{0}Added exact {1} SideAct for {2} with {3} in {4}\n".format(
-                INDENT_ADD, 'deactivize', self.name, deAct.parms, self._act.frame.name))
+        console.profuse("{0}Added exact {1} SideAct for {2} with {3} in {4}\n",
+                INDENT_ADD, 'deactivize', self.name, deAct.parms, self._act.frame.name)
         deAct.resolve()
 
         return parms
@@ -1149,7 +1178,7 @@ class Suspender(Interrupter):
 
         if aux.done: #not active
 
-            console.profuse("Attempt segue from {0} to aux {1}\n".format(main.name, aux.name))
+            console.profuse("Attempt segue from {0} to aux {1}\n", main.name, aux.name)
 
             for act in needs:
                 if not act(): #return None if not all true
@@ -1208,12 +1237,12 @@ class Suspender(Interrupter):
     def deactivize(self, aux, **kwa):
         """ If not aux.done Then force deactivate. Used in exit action."""
         if not aux.done:
-            console.profuse("{0} deactivate {1}\n".format(self.name, aux.name))
+            console.profuse("{0} deactivate {1}\n", self.name, aux.name)
             self.deactivate(aux)
 
     def deactivate(self, aux):
         """Called by deactivator actor to cleanly exit      """
-        console.profuse("Deactivating {0}\n".format(aux.name))
+        console.profuse("Deactivating {0}\n", aux.name)
 
         aux.exitAll() # also sets .done = True
         if aux.original:
@@ -1260,8 +1289,8 @@ class MarkerUpdate(Marker):
 
             only one mark per marker per share is needed
         """
-        console.profuse("{0} mark {1} in {2} on {3}\n".format(
-            self.name, share.name, marker, 'update' ))
+        console.profuse("{0} mark {1} in {2} on {3}\n",
+            self.name, share.name, marker, 'update' )
 
         mark = share.marks.get(marker)
         if mark:
@@ -1292,8 +1321,8 @@ class MarkerChange(Marker):
 
             only one mark per marker per share is needed
         """
-        console.profuse("{0} mark {1} in {2} on {3}\n".format(
-            self.name, share.name, marker, 'change' ))
+        console.profuse("{0} mark {1} in {2} on {3}\n",
+            self.name, share.name, marker, 'change' )
 
         mark = share.marks.get(marker)
         if mark:
@@ -1394,8 +1423,9 @@ class Rearer(Actor):
 
         """
 
-        console.profuse("         Cloning '{0}' as '{1}' be '{2}'\n".format(
-                original.name, clone, ScheduleNames.get(schedule, schedule)))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("         Cloning '{0}' as '{1}' be '{2}'\n".format(
+                    original.name, clone, ScheduleNames.get(schedule, schedule)))
 
         if schedule == AUX:
             if frame in self._act.frame.outline:
@@ -333,15 +333,19 @@ class Builder(object):
     """
 
     """
-    def __init__(self, fileName='', mode=None, metas=None, preloads=None, behaviors=None):
+    def __init__(self, fileName='', mode=None, metas=None, preloads=None,
+                 behaviors=None, compiled=False, profiled=False):
         """
-
+        compiled = built houses run frames from compiled act plans IF True
+        profiled = built houses are profiled IF True
         """
         self.fileName = fileName #initial name of file to start building from
         self.mode = mode or []
         self.metas = metas or []
         self.preloads = preloads or []
         self.behaviors = behaviors or []
+        self.compiled = compiled
+        self.profiled = profiled
         self.files = [] #list of open file objects, appended to by load commands
         self.counts = [] #list of linectr s for open file objects
 
@@ -591,7 +595,9 @@ class Builder(object):
 
             self.verifyName(name, command, tokens, index)
 
-            self.currentHouse = housing.House(name = name) #also creates .store
+            self.currentHouse = housing.House(name = name,
+                                              compiled=self.compiled,
+                                              profiled=self.profiled) #also creates .store
             self.houses.append(self.currentHouse)
             self.currentStore = self.currentHouse.store
 
@@ -101,7 +101,7 @@ class DoerSince(Doer):
 
     def action(self, **kw):
         """Should call this on superclass  as first step of subclass action method  """
-        console.profuse("Actioning DoerSince  {0}\n".format(self.name))
+        console.profuse("Actioning DoerSince  {0}\n", self.name)
         self.stamp = self.store.stamp
 
     def _expose(self):
@@ -134,7 +134,7 @@ class DoerLapse(Doer):
         Override in subclass
         This is called by restarter action in enter context
         """
-        console.profuse("Restarting DoerLapse  {0}\n".format(self.name))
+        console.profuse("Restarting DoerLapse  {0}\n", self.name)
 
     def updateLapse(self):
         """
@@ -156,7 +156,7 @@ class DoerLapse(Doer):
 
     def action(self, **kwa):
         """    """
-        console.profuse("Actioning DoerLapse  {0}\n".format(self.name))
+        console.profuse("Actioning DoerLapse  {0}\n", self.name)
         self.updateLapse()
 
     def _expose(self):
@@ -183,7 +183,7 @@ class DoerLapse(Doer):
         if not found:
             self._act.frame.addEnact(restartAct)
 
-        console.profuse("{0}Added enact {1} SideAct for {2} with {3} in {4}\n".format(
-                INDENT_ADD, 'restart', self.name, restartAct.parms, self._act.frame.name))
+        console.profuse("{0}Added enact {1} SideAct for {2} with {3} in {4}\n",
+                INDENT_ADD, 'restart', self.name, restartAct.parms, self._act.frame.name)
         restartAct.resolve()
         return parms
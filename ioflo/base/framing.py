@@ -16,6 +16,7 @@ from . import excepting
 from . import registering
 from . import storing
 from . import tasking
+from . import profiling
 
 from ..aid.consoling import getConsole
 console = getConsole()
@@ -186,7 +187,7 @@ class Framer(tasking.Tasker):
         Called by Razer Actor when razing insular auxes from frame
         """
         if not self.done:
-            console.profuse("Force exiting '{0}'\n".format(self.name))
+            console.profuse("Force exiting '{0}'\n", self.name)
             self.exitAll()
 
         for frame in self.frameNames.values():
@@ -242,6 +243,22 @@ class Framer(tasking.Tasker):
 
         self.resolved = True
 
+    def compile(self, compiled=True, profiled=False):
+        """
+        Compile act plans of all frames in this framer's name space
+        See Frame.compile. Moot framers are not profiled since never run
+        """
+        profiled = profiled and self.schedule != MOOT
+        for frame in self.frameNames.values():
+            frame.compile(compiled=compiled, profiled=profiled)
+
+    def decompile(self):
+        """
+        Discard act plans of all frames in this framer's name space
+        """
+        for frame in self.frameNames.values():
+            frame.decompile()
+
     def resolveMoots(self):
         """
         Resolves .moots by cloning as appropriate.
@@ -404,8 +421,8 @@ class Framer(tasking.Tasker):
         """update store value of the elapsed time of framer in  current outline
 
         """
-        console.profuse("     Updating {0} from {1:0.4f} to {2:0.4f}\n".format(
-            self.elapsedShr.name, self.elapsedShr.value, self.elapsed))
+        console.profuse("     Updating {0} from {1:0.4f} to {2:0.4f}\n",
+            self.elapsedShr.name, self.elapsedShr.value, self.elapsed)
         self.elapsedShr.update(value = self.elapsed)
 
     def restartCounter(self):
@@ -427,8 +444,8 @@ class Framer(tasking.Tasker):
         """update store value of the recurred count of framer in  current outline
 
         """
-        console.profuse("     Updating {0} from {1:d} to {2:d}\n".format(
-            self.recurredShr.name, self.recurredShr.value, self.recurred))
+        console.profuse("     Updating {0} from {1:d} to {2:d}\n",
+            self.recurredShr.name, self.recurredShr.value, self.recurred)
         self.recurredShr.update(value = self.recurred)
 
     def change(self, actives, human = ''):
@@ -478,10 +495,10 @@ class Framer(tasking.Tasker):
            exits list is used by frame.checkEnters to test for original auxiliaries
            that would be exited from thier main frame if transition where allowed
         """
-        console.profuse("{0}Check enters of {1} Framer {2}\n".format(
+        console.profuse("{0}Check enters of {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         if not enters:  #don't want to make transition if no change in outline
             console.profuse("    False, empty enters\n")
@@ -490,7 +507,7 @@ class Framer(tasking.Tasker):
         for frame in enters:
             if not frame.checkEnter(exits=exits):
                 return False
-        console.profuse("    True all {0}\n".format(self.name))
+        console.profuse("    True all {0}\n", self.name)
         return True
 
     def enterAll(self):
@@ -499,10 +516,10 @@ class Framer(tasking.Tasker):
            calls enterActions for frames in active outline
 
         """
-        console.profuse("{0}Enter All {1} Framer {2}\n".format(
+        console.profuse("{0}Enter All {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         self.done = False #reset done state
         self.activate(self.first)
@@ -533,10 +550,10 @@ class Framer(tasking.Tasker):
            assumes actives outline is in top down order
 
         """
-        console.profuse("{0}Recur {1} Framer {2}\n".format(
+        console.profuse("{0}Recur {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         for frame in self.actives:  #recur actions top to bottom so all actions get run before trans
             frame.recur()
@@ -549,10 +566,10 @@ class Framer(tasking.Tasker):
            Start performing transitions for frames in active outline top down until
              find successful transition or complete without finding
         """
-        console.profuse("{0}Segue {1} Framer {2}\n".format(
+        console.profuse("{0}Segue {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         self.updateTimer() #this also updates share
         self.updateCounter() #this also updates share
@@ -577,10 +594,10 @@ class Framer(tasking.Tasker):
            sets .done to True
            deactivates so restart required to run again
         """
-        console.profuse("{0}Exit All {1} Framer {2}\n".format(
+        console.profuse("{0}Exit All {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         exits = self.actives[:]  #make copy of self.actives so can reverse it
         self.exit(exits) #exits is reversed in place in exit()
@@ -656,7 +673,7 @@ class Framer(tasking.Tasker):
            yields next frame on a trans(ition)
         """
         #do any on creation initialization here
-        console.profuse("   Making Framer '{0}' runner\n".format(self.name))
+        console.profuse("   Making Framer '{0}' runner\n", self.name)
 
         self.status = STOPPED #operational status of framer
         self.desire = STOP
@@ -668,57 +685,60 @@ class Framer(tasking.Tasker):
 
                 status = self.status #for speed
 
-                console.profuse("\n   Iterate Framer '{0}' with control = {1} status = {2}\n".format(
-                    self.name,
-                    ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(status, 'Unknown')))
+                if console._verbosity >= console.Wordage.profuse:
+                    console.profuse("\n   Iterate Framer '{0}' with control = {1} status = {2}\n".format(
+                        self.name,
+                        ControlNames.get(control, 'Unknown'),
+                        StatusNames.get(status, 'Unknown')))
 
                 if control == RUN:
                     if status == RUNNING or status == STARTED:
                         #self.desire = RUN
                         self.segue()
                         self.recur() #.desire may change here
-                        console.profuse("     Ran Framer '{0}'\n".format(self.name))
+                        console.profuse("     Ran Framer '{0}'\n", self.name)
                         self.status = RUNNING
 
                     elif status == STOPPED or status == READIED:
-                        console.profuse("   Need to Start Framer '{0}'\n".format(self.name))
+                        console.profuse("   Need to Start Framer '{0}'\n", self.name)
                         self.desire = START
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
-                            self.name,
-                            StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                        if console._verbosity >= console.Wordage.profuse:
+                            console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                                self.name,
+                                StatusNames.get(status, "Unknown"),
+                                ControlNames.get(control, "Unknown")))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 elif control == READY:
                     if status == STOPPED or status == READIED:
-                        console.profuse("   Attempting Ready Framer '{0}'\n".format(self.name))
+                        console.profuse("   Attempting Ready Framer '{0}'\n", self.name)
 
                         if self.checkStart(): #checks enters
-                            console.profuse("   Readied Framer '{0}' ...\n".format(self.name))
+                            console.profuse("   Readied Framer '{0}' ...\n", self.name)
                             self.status = READIED
                         else:  #checkStart failed
-                            console.profuse("   Failed Ready Framer '{0}'\n".format(self.name))
+                            console.profuse("   Failed Ready Framer '{0}'\n", self.name)
                             self.desire = STOP
                             self.status = STOPPED
 
                     elif status == RUNNING or status == STARTED:
-                        console.profuse("   Framer '{0}', aleady Started\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Started\n", self.name)
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
-                            self.name,
-                            StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                        if console._verbosity >= console.Wordage.profuse:
+                            console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                                self.name,
+                                StatusNames.get(status, "Unknown"),
+                                ControlNames.get(control, "Unknown")))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 elif control == START:
                     if status == STOPPED or status == READIED:
-                        console.profuse("   Attempting Start Framer '{0}'\n".format(self.name))
+                        console.profuse("   Attempting Start Framer '{0}'\n", self.name)
 
                         if self.checkStart(): #checks enters
                             console.terse("   Starting Framer '{0}' ...\n".format(self.name))
@@ -731,19 +751,20 @@ class Framer(tasking.Tasker):
                             self.recur() #.desire may change here
                             self.status = STARTED
                         else:  #checkStart failed
-                            console.profuse("   Failed Start Framer {0}\n".format(self.name))
+                            console.profuse("   Failed Start Framer {0}\n", self.name)
                             self.desire = STOP
                             self.status = STOPPED
 
                     elif status == RUNNING or status == STARTED:
-                        console.profuse("   Framer '{0}', aleady Started\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Started\n", self.name)
                         self.desire = RUN
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
-                            self.name,
-                            StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                        if console._verbosity >= console.Wordage.profuse:
+                            console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                                self.name,
+                                StatusNames.get(status, "Unknown"),
+                                ControlNames.get(control, "Unknown")))
                         self.desire = ABORT
                         self.status = ABORTED
 
@@ -755,24 +776,26 @@ class Framer(tasking.Tasker):
                         console.terse(msg)
                         #self.done = False set in exitAll(abort=True) when abort == True
                         self.exitAll(abort=True)  #self.desire may change,
-                        console.profuse("   Stopped Framer '{0}'\n".format(self.name))
+                        console.profuse("   Stopped Framer '{0}'\n", self.name)
                         self.status = STOPPED
 
                     elif status == STOPPED or status == READIED:
-                        console.profuse("   Framer '{0}', aleady Stopped\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Stopped\n", self.name)
                         #self.desire = STOP
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
-                            self.name,
-                            StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                        if console._verbosity >= console.Wordage.profuse:
+                            console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                                self.name,
+                                StatusNames.get(status, "Unknown"),
+                                ControlNames.get(control, "Unknown")))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 else: #control == ABORT or unknown
-                    console.profuse("   Framer '{0}' aborting with control = {1}\n".format(
-                        self.name, ControlNames.get(control, "Unknown")))
+                    if console._verbosity >= console.Wordage.profuse:
+                        console.profuse("   Framer '{0}' aborting with control = {1}\n".format(
+                            self.name, ControlNames.get(control, "Unknown")))
 
                     if status == RUNNING or status == STARTED:
                         msg = "   Aborting %s in %s at %0.3f\n" %\
@@ -784,13 +807,13 @@ class Framer(tasking.Tasker):
                             (self.name, self.store.stamp)
                         console.terse(msg)
                     elif status == ABORTED:
-                        console.profuse("   Framer '{0}', aleady Aborted\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Aborted\n", self.name)
 
                     self.desire = ABORT
                     self.status = ABORTED
 
         finally: #in case uncaught exception
-            console.profuse("   Exception causing Abort Framer '{0}' ...\n".format(self.name))
+            console.profuse("   Exception causing Abort Framer '{0}' ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
 
@@ -874,6 +897,9 @@ class Frame(registering.StoriedRegistrar):
 
             .auxes = auxiliary framers
 
+            .plan = odict of compiled act callables lists keyed by act list name
+                    or None when not compiled. See .compile
+
     """
     Counter = 0
     Names = odict()
@@ -906,6 +932,7 @@ class Frame(registering.StoriedRegistrar):
         self.rexacts = [] #list of re-exit acts callables upon re-exit
 
         self.auxes = [] #list of auxilary framers for this frame
+        self.plan = None  # odict of compiled act lists when compiled
 
     def clone(self, framer):
         """ Return clone of self by creating new frame in framer and by
@@ -1316,9 +1343,10 @@ class Frame(registering.StoriedRegistrar):
            exits is list of exit frames to test if aux main frame would be exited
            if transition allowed
         """
-        console.profuse("    Check enter into {0}\n".format(self.name))
+        console.profuse("    Check enter into {0}\n", self.name)
 
-        for need in self.beacts:  #could use generator expression and all()
+        beacts = self.beacts if self.plan is None else self.plan["beacts"]
+        for need in beacts:  #could use generator expression and all()
             if not need(): #evaluate need Act if failed
                 return False #return False on first failure
 
@@ -1334,16 +1362,17 @@ class Frame(registering.StoriedRegistrar):
             if not aux.checkStart(): #performs entry checks beacts
                 return False
 
-        console.profuse("    True all {0}\n".format(self.name))
+        console.profuse("    True all {0}\n", self.name)
 
         return True #since no failues return True
 
     def enter(self):
         """calls enacts enter  acts for self and auxes
         """
-        console.profuse("    Enter {0}\n".format(self.name))
+        console.profuse("    Enter {0}\n", self.name)
 
-        for act in self.enacts: #could use generator expression
+        enacts = self.enacts if self.plan is None else self.plan["enacts"]
+        for act in enacts: #could use generator expression
             act() #call entryAction
 
         for aux in self.auxes:
@@ -1358,16 +1387,18 @@ class Frame(registering.StoriedRegistrar):
     def renter(self):
         """calls  renacts renter acts for self
         """
-        console.profuse("    Renter {0}\n".format(self.name))
-        for act in self.renacts: #could use generator expression
+        console.profuse("    Renter {0}\n", self.name)
+        renacts = self.renacts if self.plan is None else self.plan["renacts"]
+        for act in renacts: #could use generator expression
             act() #call renter actions
 
     def recur(self):
         """calls reacts recurring acts for self and runs auxes
         """
-        console.profuse("    Recur {0}\n".format(self.name))
+        console.profuse("    Recur {0}\n", self.name)
 
-        for act in self.reacts:
+        reacts = self.reacts if self.plan is None else self.plan["reacts"]
+        for act in reacts:
             act()
 
         for aux in self.auxes:
@@ -1378,7 +1409,7 @@ class Frame(registering.StoriedRegistrar):
            called by self.framer.segue()
            segue Auxes is its own context
         """
-        console.profuse("    Seque auxes of {0}\n".format(self.name))
+        console.profuse("    Seque auxes of {0}\n", self.name)
 
         for aux in self.auxes:
             aux.segue()
@@ -1401,9 +1432,10 @@ class Frame(registering.StoriedRegistrar):
 
            called by self.framer.segue()
         """
-        console.profuse("    Precur {0}\n".format(self.name))
+        console.profuse("    Precur {0}\n", self.name)
 
-        for act in self.preacts:
+        preacts = self.preacts if self.plan is None else self.plan["preacts"]
+        for act in preacts:
             if act():
                 return True
 
@@ -1412,69 +1444,121 @@ class Frame(registering.StoriedRegistrar):
     def exit(self):
         """calls exacts exit acts for self
         """
-        console.profuse("    Exit {0}\n".format(self.name))
+        console.profuse("    Exit {0}\n", self.name)
 
         for aux in self.auxes: #since auxes entered last must be exited first
             aux.exitAll()
             if aux.original:
                 aux.main = None #release aux to be used by another frame
 
-        for act in self.exacts:
+        exacts = self.exacts if self.plan is None else self.plan["exacts"]
+        for act in exacts:
             act() #call Exit Action
 
     def rexit(self):
         """calls  rexacts rexit acts for self
         """
-        console.profuse("    Rexit {0}\n".format(self.name))
+        console.profuse("    Rexit {0}\n", self.name)
 
-        for act in self.rexacts:
+        rexacts = self.rexacts if self.plan is None else self.plan["rexacts"]
+        for act in rexacts:
             act() #call rexit Action
 
+    def compile(self, compiled=True, profiled=False):
+        """
+        Compile .plan from resolved act lists.
+        If compiled then each act is replaced by its act.compile() callable
+        with prebound action and parms.
+        If profiled then each act or its compiled callable is wrapped by a
+        profiling.Timing that tallies its calls into the store share
+        .meta.profile.act.<framer>.<frame>.<acts><index>
+        If neither then .plan is None.
+        The act lists are left as is for cloning and introspection.
+        Adding an act clears .plan so the act lists are run until recompiled
+        """
+        if not (compiled or profiled):
+            self.plan = None
+            return
+
+        self.plan = odict()
+        for name in ("beacts", "preacts", "enacts", "renacts",
+                     "reacts", "exacts", "rexacts"):
+            calls = []
+            for index, act in enumerate(getattr(self, name)):
+                call = act.compile() if compiled else act
+                if profiled:
+                    call = profiling.Timing(call,
+                                            self.store,
+                                            "act.{0}.{1}.{2}{3}".format(
+                                                self.framer.name,
+                                                self.name,
+                                                name,
+                                                index),
+                                            actor=getattr(act.actor,
+                                                          "name",
+                                                          act.actor))
+                calls.append(call)
+            self.plan[name] = calls
+
+    def decompile(self):
+        """
+        Discard .plan so act lists are run
+        """
+        self.plan = None
+
     def addBeact(self, act):
         """        """
         self.beacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[BENTER]
 
     def addEnact(self, act):
         """         """
         self.enacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[ENTER]
 
     def insertEnact(self, act, index=0):
         """         """
         self.enacts.insert(index, act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[ENTER]
 
     def addRenact(self, act):
         """         """
         self.renacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[RENTER]
 
     def addReact(self, act):
         """         """
         self.reacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[RECUR]
 
     def addPreact(self, act):
         """         """
         self.preacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[PRECUR]
 
     def addExact(self, act):
         """         """
         self.exacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[EXIT]
 
     def addRexact(self, act):
         """         """
         self.rexacts.append(act)
+        self.plan = None
         act.frame = self.name #resolve later
         act.context = ActionContextNames[REXIT]
 
@@ -80,14 +80,24 @@ class House(registering.StoriedRegistrar):
 
           .metas = dictionary of (name, share) items of meta data for access by skedder
                   name is how skedder accesses the associated share
+
+          .compiled = frames run from compiled act plans IF True
+          .profiled = taskers and frame acts are timed into .meta.profile IF True
     """
     Counter = 0
     Names = {}
 
-    def __init__(self, **kw):
-        """Initialize instance. """
+    def __init__(self, compiled=False, profiled=False, **kw):
+        """Initialize instance.
+
+           compiled = compile frame act plans when resolved IF True
+           profiled = profile taskers and frame acts IF True
+        """
         super(House,self).__init__(**kw)
 
+        self.compiled = True if compiled else False
+        self.profiled = True if profiled else False
+
         self.taskers = [] #all taskers, framers servers loggers etc needed for resolving links
         self.framers = [] #list of all framers in house needed for tracing outlines
 
@@ -167,9 +177,31 @@ class House(registering.StoriedRegistrar):
         Because a tasker (framer) may clone new framers
         each resolve may add more resolvables
         """
+        resolveds = []
         while self.resolvables:
             tasker = self.resolvables.popleft()
             tasker.resolve()
+            resolveds.append(tasker)
+
+        if self.compiled or self.profiled:
+            self.compile(taskers=resolveds)
+
+    def compile(self, taskers=None):
+        """
+        Compile frame act plans of .framers and of any framers in taskers
+        as per .compiled and .profiled. Run time clones may only be in taskers.
+        May be called after changing .compiled or .profiled to switch on demand
+        """
+        for tasker in self.framers + list(taskers or []):
+            if isinstance(tasker, framing.Framer):
+                tasker.compile(compiled=self.compiled, profiled=self.profiled)
+
+    def decompile(self):
+        """
+        Discard frame act plans of .framers so frames run their act lists
+        """
+        for framer in self.framers:
+            framer.decompile()
 
     def showAllTaskers(self):
         """Show all Taskers and Slaves and Auxes and Moots and Framers."""
@@ -92,7 +92,7 @@ class NeedAlways(Need):
     def action(self, **kw):
         """Always return true"""
         result = True
-        console.profuse("Need Always = {0}\n".format(result))
+        console.profuse("Need Always = {0}\n", result)
         return result
 
 class NeedDone(Need):
@@ -121,7 +121,7 @@ class NeedDone(Need):
             tasker
         """
         result = tasker.done
-        console.profuse("Need Tasker {0} done = {1}\n".format(tasker.name, result))
+        console.profuse("Need Tasker {0} done = {1}\n", tasker.name, result)
         return result
 
 class NeedDoneAux(Need):
@@ -185,13 +185,14 @@ class NeedDoneAux(Need):
             else:
                 result = False
             name = tasker if tasker in ('any', 'all') else tasker.tag
-            console.profuse("Need Aux {0} done = {1} in {2}<{3}\n".format(name,
-                                                                          result,
-                                                                          framer.name,
-                                                                          frame.name))
+            console.profuse("Need Aux {0} done = {1} in {2}<{3}\n",
+                            name,
+                            result,
+                            framer.name,
+                            frame.name)
         else:
             result = tasker.done
-            console.profuse("Need Aux {0} done = {1}\n".format(tasker.name, result))
+            console.profuse("Need Aux {0} done = {1}\n", tasker.name, result)
 
         return result
 
@@ -224,8 +225,8 @@ class NeedStatus(Need):
         # maybe should add check for auxiliary since status never changes for auxiliary
 
         result = (tasker.status == status)
-        console.profuse("Need Tasker {0} status is {1} = {2}\n".format(
-            tasker.name, StatusNames[status], result))
+        console.profuse("Need Tasker {0} status is {1} = {2}\n",
+            tasker.name, StatusNames[status], result)
 
         return result
 
@@ -263,7 +264,7 @@ class NeedState(Need):
 
         if stateField not in state:
             console.profuse("     Warning: Non-existent field '{0}' in state {1}"
-                            " ... creating anyway".format(stateField, state.name))
+                            " ... creating anyway", stateField, state.name)
             state[stateField] = 0.0 #create
 
         parms['stateField'] = stateField
@@ -287,8 +288,8 @@ class NeedBoolean(NeedState):
             result = True
         else:
             result = False
-        console.profuse("Need Boolean, if {0}[{1}]: = {2}\n".format(
-            state.name, stateField, result))
+        console.profuse("Need Boolean, if {0}[{1}]: = {2}\n",
+            state.name, stateField, result)
 
         return result
 
@@ -309,8 +310,8 @@ class NeedDirect(NeedState):
 
         """
         result = self.Check(state[stateField], comparison, goal, tolerance)
-        console.profuse("Need Direct, if {0}[{1}] {2} {3} +- {4}: = {5}\n".format(
-            state.name, stateField, comparison, goal, tolerance, result))
+        console.profuse("Need Direct, if {0}[{1}] {2} {3} +- {4}: = {5}\n",
+            state.name, stateField, comparison, goal, tolerance, result)
 
         return result
 
@@ -348,7 +349,7 @@ class NeedIndirect(NeedState):
 
         if goalField not in goal:
             console.profuse("     Warning: Non-existent field '{0}' in goal"
-                    " {1} ... creating anyway".format(goalField, goal.name))
+                    " {1} ... creating anyway", goalField, goal.name)
             goal[goalField] = 0.0 #create
 
         parms['goalField'] = goalField
@@ -368,8 +369,8 @@ class NeedIndirect(NeedState):
         """
 
         result = self.Check(state[stateField], comparison, goal[goalField], tolerance)
-        console.profuse("Need Indirect, if {0}[{1}] {2} {3}[{4}] +- %s: = {5}\n".format(
-            state.name, stateField, comparison, goal, goalField, tolerance, result))
+        console.profuse("Need Indirect, if {0}[{1}] {2} {3}[{4}] +- %s: = {5}\n",
+            state.name, stateField, comparison, goal, goalField, tolerance, result)
 
         return result
 
@@ -444,13 +445,13 @@ class NeedMarker(Need):
 
         self.addTract(markerAct)  # sets act.context to 'transit'
         console.profuse("     Added {0} {1} with {2} at {3} in {4} of "
-                        "framer {5}\n".format(
+                        "framer {5}\n",
                                 'tract',
                                 markerAct,
                                 markerAct.parms['share'].name,
                                 markerAct.parms['marker'],
                                 self._act.frame.name,
-                                framer.name))
+                                framer.name)
         markerAct.resolve()
 
         if enacted:  # only add enact marker if original provided frame not empty
@@ -473,13 +474,13 @@ class NeedMarker(Need):
 
                 frame.insertEnact(markerAct)
                 console.profuse("     Added {0} {1} with {2} at {3} in {4} of "
-                                "framer {5}\n".format(
+                                "framer {5}\n",
                                         'enact',
                                         markerAct,
                                         markerAct.parms['share'].name,
                                         markerAct.parms['marker'],
                                         frame.name,
-                                        framer.name))
+                                        framer.name)
                 markerAct.resolve()  # resolves .actor given by actor kind name into actor class
 
         return parms #return items are updated in original ._act parms
@@ -510,14 +511,15 @@ class NeedUpdate(NeedMarker):
                       (share.stamp == mark.stamp and mark.used != mark.stamp))
 
         console.profuse("Marker update {0} for {1} of Share {2} {3} "
-                        " {4} mark {5} used {6} at {7}\n".format(result,
-                                                     marker,
-                                                     share.name,
-                                                     share.stamp,
-                                                     '>=',
-                                                     mark.stamp,
-                                                     mark.used,
-                                                     self.store.stamp))
+                        " {4} mark {5} used {6} at {7}\n",
+                        result,
+                        marker,
+                        share.name,
+                        share.stamp,
+                        '>=',
+                        mark.stamp,
+                        mark.used,
+                        self.store.stamp)
 
         return result
 
@@ -550,7 +552,7 @@ class NeedChange(NeedMarker):
                         break
 
 
-        console.profuse("Marker change {0} for {1} of data {2} of share {3} at {4}\n".format(
-            result, marker, mark.data if mark else None, share.name, self.store.stamp))
+        console.profuse("Marker change {0} for {1} of data {2} of share {3} at {4}\n",
+            result, marker, mark.data if mark else None, share.name, self.store.stamp)
 
         return result
@@ -0,0 +1,114 @@
+"""profiling.py run time instrumentation of skedder iterations, taskers and acts
+
+Statistics are accumulated directly into fixed schema shares in the
+.meta.profile node of each house store so they may be logged by a Logger or
+exposed by a Monitor like any other share.
+
+    .meta.profile.skedder = skedder iterations with overruns field
+    .meta.profile.tasker.<tasker> = runner sends of tasker
+    .meta.profile.act.<framer>.<frame>.<acts><index> = calls of act at index
+        in frame act list such as reacts with actor field
+
+Each timing share has fields
+    count = number of timed calls
+    total = cumulative duration seconds
+    max = maximum duration seconds
+    last = duration seconds of latest call
+
+"""
+#print("module {0}".format(__name__))
+
+import time
+
+from ..aid.sixing import *
+
+from ..aid.consoling import getConsole
+console = getConsole()
+
+PROFILE_PATH = "meta.profile"  # store node path of profile shares
+
+
+class Timing(object):
+    """
+    Timing callable wraps .call so each call is timed and tallied into the
+    fields of .share
+
+    instance attributes:
+        .call = callable to time
+        .store = store holding .share
+        .share = fixed schema share of statistics
+    """
+    __slots__ = ('call', 'store', 'share')
+    Fields = ("count", "total", "max", "last")
+
+    def __init__(self, call, store, name, **kwa):
+        """
+        Initialize instance
+
+        Parameters:
+            call = callable to time or None if tallied explicitly
+            store = store to create share in
+            name = path name of share relative to PROFILE_PATH
+            kwa = extra fields of share and their initial values
+        """
+        self.call = call
+        self.store = store
+        path = "{0}.{1}".format(PROFILE_PATH, name)
+        self.share = store.create(path, fields=self.Fields + tuple(kwa))
+        self.share.create(count=0, total=0.0, max=0.0, last=0.0, **kwa)
+
+    def __call__(self, *pa, **kwa):
+        """ Call .call and tally its duration """
+        start = time.perf_counter()
+        try:
+            return self.call(*pa, **kwa)
+        finally:
+            self.tally(time.perf_counter() - start)
+
+    def tally(self, elapsed):
+        """ Tally elapsed duration seconds into share """
+        data = self.share.data
+        data.count += 1
+        data.total += elapsed
+        data.last = elapsed
+        if elapsed > data.max:
+            data.max = elapsed
+        self.share.stamp = self.store.stamp
+
+
+class Runner(Timing):
+    """
+    Runner wraps tasker runner generator .call so each send is timed
+    """
+    __slots__ = ()
+
+    def send(self, control):
+        """ Send control to runner generator and tally its duration """
+        start = time.perf_counter()
+        try:
+            return self.call.send(control)
+        finally:
+            self.tally(time.perf_counter() - start)
+
+
+def profileTasker(tasker):
+    """
+    Wrap .runner of tasker with Runner if not already and return Runner
+    """
+    if not isinstance(tasker.runner, Runner):
+        tasker.runner = Runner(tasker.runner,
+                               tasker.store,
+                               "tasker.{0}".format(tasker.name))
+    return tasker.runner
+
+
+def walkShares(node):
+    """
+    Generator of the shares in store node and its descendant nodes in order
+    """
+    for value in node.values():
+        if isinstance(value, dict):  # node
+            for share in walkShares(value):
+                yield share
+        else:
+            yield value
@@ -8,6 +8,11 @@ import sys
 
 import os
 import time
+import heapq
+import signal
+import threading
+import multiprocessing
+import queue
 from collections import deque
 
 from ..aid.consoling import getConsole
@@ -22,6 +27,7 @@ from . import excepting
 from . import registering
 from . import storing
 from . import tasking
+from . import profiling
 from . import building
 
 from ..__metadata__ import __version__
@@ -29,6 +35,22 @@ from ..__metadata__ import __version__
 from ..aid.consoling import getConsole
 console = getConsole()
 
+# real time overrun catch up policies
+#    burst = run missed iterations back to back until caught up
+#    skip = drop missed iterations and advance stamp by whole periods
+#    stretch = stretch overrun iteration period to the real time it took
+Policies = ("burst", "skip", "stretch")
+
+# fields of real time .meta.deadline share
+#    policy = overrun policy name
+#    ticks = number of real time iterations
+#    overruns = number of iterations that finished after their deadline
+#    missed = number of iterations dropped by skip policy
+#    lag = seconds past deadline of latest overrun, maxLag = maximum lag
+#    jitter = seconds late waking from latest deadline wait, maxJitter = maximum
+DEADLINE_FIELDS = ("policy", "ticks", "overruns", "missed",
+                   "lag", "maxLag", "jitter", "maxJitter")
+
 
 class Skedder(object):
     """Schedules weightless tasker objects based on generators.
@@ -70,6 +92,13 @@ class Skedder(object):
           addStoppedTask(tasker) adds tasker to stopped list
           addReadyTask(tasker) adds tasker to ready list
 
+          When heaped is True the ready taskers are instead kept in .heap,
+          a priority queue of tuples (retime, order, tasker, period)
+             order is the sequence number the tasker was added in so taskers
+                with the same retime run in the same order as the ready deque
+          Each iteration only pops the taskers that are due so the cost of an
+          iteration depends on the number of due taskers not total taskers.
+
        Everytime a tasker runs it yields a status that the skedder uses to determine
        what to do with the tasker
 
@@ -83,7 +112,16 @@ class Skedder(object):
 
        .houses = list of houses to be scheduled
 
+       .heaped = use priority queue .heap instead of .ready IF True
+       .compiled = compile frame act plans of built houses IF True
+       .profiled = profile iterations, taskers and acts of built houses IF True
+       .policy = real time overrun catch up policy name in Policies
+       .workers = number of worker processes to run houses in IF > 0
+       .stats = list of worker statistics odicts from latest run with workers
+
        .ready = deque of tasker  tuples ready to run
+       .heap = priority queue list of tasker tuples ready to run when .heaped
+       .live = count of taskers in .heap that are RUNNING or STARTED
        .aborted = deque of tasker tuples aborted
     """
 
@@ -100,7 +138,12 @@ class Skedder(object):
                    mode=None,
                    houses=None,
                    metas=None,
-                   preloads=None, ):
+                   preloads=None,
+                   heaped=False,
+                   compiled=False,
+                   profiled=False,
+                   policy="burst",
+                   workers=0, ):
         """
         Initialize Skedder instance.
         parameters:
@@ -119,7 +162,30 @@ class Skedder(object):
                 name = name string of house attribute, path = path string, data = odict
             preloads = list of duples of (path, data) to preload Store where
                path = path string, data = odict
+            heaped = schedule ready taskers with priority queue IF True
+            compiled = run frames from compiled act plans in built houses IF True
+            profiled = time iterations, taskers and acts of built houses into
+                       .meta.profile node of house store IF True
+            policy = real time overrun catch up policy name in Policies
+                burst = run missed iterations back to back until caught up
+                skip = drop missed iterations, stamp advances by whole periods
+                stretch = stretch overrun iteration period to its real duration
+                In real time the deadline statistics are published into the
+                .meta.deadline share of each house store
+            workers = number of worker processes to run houses in.
+                0 runs all houses in this process. Otherwise houses are
+                dealt round robin into at most workers groups and each group
+                is run in its own forked process in lock step with the
+                shared clock of this process.
         """
+        if policy not in Policies:
+            raise ValueError("Invalid policy '{0}' not in {1}".format(policy,
+                                                                     Policies))
+        workers = int(workers)
+        if workers < 0:
+            raise ValueError("Invalid workers '{0}' not >= 0".format(workers))
+        if workers and "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("Worker processes need fork start method")
         self.name = name
         self.period = float(abs(period))
 
@@ -165,7 +231,16 @@ class Skedder(object):
         if preloads:
             self.preloads.extend(preloads)
 
+        self.heaped = True if heaped else False
+        self.compiled = True if compiled else False
+        self.profiled = True if profiled else False
+        self.policy = policy
+        self.workers = workers
+        self.stats = []
         self.ready = deque() # deque of taskers in run order
+        self.heap = []  # priority queue of taskers in retime, run order
+        self.order = 0  # sequence number of next tasker added to .heap
+        self.live = 0  # count of .heap taskers RUNNING or STARTED
         self.aborted = deque() # deque of aborted taskers
         self.built = False  # True when successfully built
 
@@ -180,10 +255,14 @@ class Skedder(object):
         tasker.status = STOPPED
         retime = tasker.store.stamp
         period = tasker.period
-        trp = (tasker, retime, period)
-        self.ready.append(trp)
-        console.profuse("     Add ready: {0} retime: {1} period: {2} desire {3}\n".format(
-            tasker.name, retime, period, ControlNames[tasker.desire]))
+        if self.heaped:
+            heapq.heappush(self.heap, (retime, self.order, tasker, period))
+            self.order += 1
+        else:
+            trp = (tasker, retime, period)
+            self.ready.append(trp)
+        console.profuse("     Add ready: {0} retime: {1} period: {2} desire {3}\n",
+            tasker.name, retime, period, ControlNames[tasker.desire])
 
     def build(self, filepath='', mode=None, metas=None, preloads=None):
         """ Build houses from file given by filepath """
@@ -204,7 +283,9 @@ class Skedder(object):
                              mode=self.mode,
                              metas = self.metas,
                              preloads =self.preloads,
-                             behaviors=self.behaviors)
+                             behaviors=self.behaviors,
+                             compiled=self.compiled,
+                             profiled=self.profiled)
 
         if not b.build():
             return False
@@ -213,8 +294,8 @@ class Skedder(object):
         self.houses = b.houses
 
         for house in self.houses:
-            console.profuse("Meta Data for House '{0}':\n{1}\n".format(
-                house.name, house.metas))
+            console.profuse("Meta Data for House '{0}':\n{1}\n",
+                house.name, house.metas)
 
         return True
 
@@ -228,23 +309,26 @@ class Skedder(object):
            if growable is True then allow adding new taskers at runtime
               via  house metas['taskables']
 
+           When .workers then houses are run in worker processes instead
+
         """
 
         console.terse("Starting Skedder '{0}' ...\n".format(self.name))
 
-        stamp = self.stamp
-        for house in self.houses:
-            house.store.changeStamp(stamp)
-            ("Initialized store {0}:  stamp = {1} with {2}\n".format(
-                house.store.name,  house.store.stamp, stamp))
+        if self.workers:
+            self.runWorkers()
+            return
 
-            for tasker in house.taskables:
-                self.addReadyTask(tasker)
+        stamp = self.stamp
+        profiles = self._readyHouses(stamp)  # iteration Timings of profiled houses
+        deadlines = self._createDeadlines() if self.real else []
 
-        console.profuse("Ready Taskers: {0}\n".format(
-            ', '.join([tasker.name for tasker,r,p in self.ready])))
-        console.profuse("Aborted Taskers: {0}\n".format(
-            ', '.join([tasker.name for tasker,r,p in self.aborted])))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("Ready Taskers: {0}\n".format(
+                ', '.join([tasker.name for tasker,r,p in self.ready] +
+                          [tasker.name for r,o,tasker,p in sorted(self.heap)])))
+            console.profuse("Aborted Taskers: {0}\n".format(
+                ', '.join([tasker.name for tasker,r,p in self.aborted])))
 
 
         self.timer.restart()
@@ -252,48 +336,31 @@ class Skedder(object):
 
         #make local reference for speed put out side loop?
         ready = self.ready
-        #stopped = self.stopped
-        aborted = self.aborted
+        heap = self.heap
 
         try: #so always clean up resources if exception
             while True:
                 try: #CNTL-C generates keyboardInterrupt to break out of while loop
-                    console.profuse("\nRunning Skedder '{0}' at stamp = {1} real elapsed = {2:0.4f}\n".format(
-                        self.name, self.stamp,  self.elapsed.elapsed))
+                    if profiles:
+                        begin = time.perf_counter()
 
-                    more = False #are any taskers RUNNING or STARTED
-
-                    for i in range(len(ready)): #attempt to run each ready tasker
-                        tasker, retime, period = ready.popleft() #pop it off
+                    if console._verbosity >= console.Wordage.profuse:
+                        console.profuse("\nRunning Skedder '{0}' at stamp = {1} real elapsed = {2:0.4f}\n".format(
+                            self.name, self.stamp,  self.elapsed.elapsed))
 
-                        if retime > stamp: #not time yet
-                            ready.append((tasker, retime, period)) #reappend it
-                            status = tasker.status
-
-                        else: #run it
-                            try:
-                                status = tasker.runner.send(tasker.desire)
-                                if status == ABORTED: #aborted so abort tasker
-                                    aborted.append((tasker, stamp, period))
-                                    console.profuse("     Tasker Self Aborted: {0}\n".format(tasker.name))
-                                else:
-                                    ready.append((tasker,
-                                                  retime + tasker.period,
-                                                  tasker.period))  # append allows for period change
+                    more = False #are any taskers RUNNING or STARTED
 
-                            except StopIteration: #generator returned instead of yielded
-                                aborted.append((tasker, stamp, period))
-                                console.profuse("     Tasker Aborted due to StopIteration: {0}\n".format(tasker.name))
+                    if heap: #only pop taskers that are due
+                        more = self._runHeap(stamp)
 
-                        if status == RUNNING or status == STARTED:
-                            more = True
+                    more = self._runReady(stamp) or more
 
                     if growable:
                         # todo from each house.metas fetch new taskables
                         # add to ready
                         pass
 
-                    if not ready: #no pending taskers so done
+                    if not (ready or heap): #no pending taskers so done
                         console.terse("No ready taskers. Shutting down skedder ...\n")
                         break
 
@@ -301,17 +368,21 @@ class Skedder(object):
                         console.terse("No running or started taskers. Shutting down skedder ...\n")
                         break
 
+                    if profiles:
+                        self._tallyProfiles(profiles, time.perf_counter() - begin)
+
                     #update time stamps
                     if self.real:
-                        console.profuse("     Time remaining skedder = {0:0.4f}\n".format(self.timer.remaining))
-                        while not self.timer.expired:
-                            time.sleep(self.timer.remaining)
-                        self.timer.repeat()
-
-                    self.stamp += self.period
+                        if console._verbosity >= console.Wordage.profuse:
+                            console.profuse("     Time remaining skedder = {0:0.4f}\n".format(self.timer.remaining))
+                        self.stamp += self._keepDeadline(deadlines)
+                    else:
+                        self.stamp += self.period
                     stamp = self.stamp
                     for house in self.houses:
                         house.store.changeStamp(stamp)
+                    for share in deadlines:
+                        share.stamp = stamp
 
                 except KeyboardInterrupt: #CNTL-C shutdown skedder
                     console.terse("KeyboardInterrupt forcing shutdown of Skedder ...\n")
@@ -332,19 +403,255 @@ class Skedder(object):
             #Stopped or aborted taskers should have already released resources
             #if last run tasker exited due to exception then try finally clause in
             #its generator is responsible for releasing resources
+            self._abortReady()
 
-            console.terse("Aborting all ready Taskers ...\n")
-            for i in range(len(ready)): #run each ready tasker once
-                tasker,retime,period = ready.popleft() #pop it off
+        self._exposeHouses()
 
+    def runWorkers(self):
+        """
+        Runs .houses in .workers forked worker processes in lock step.
+
+        This process keeps the shared clock. Each iteration it publishes
+        .stamp, releases the workers to run their houses at that stamp and
+        waits until all are done before advancing .stamp in real or
+        simulated time. Shuts down when no worker has running or started
+        taskers, on keyboard interrupt (cntl-c) or when any worker fails.
+        Shutdown aborts the ready taskers in every worker.
+
+        Worker statistics are collected into .stats and the .meta.profile
+        shares of profiled worker houses are copied into the corresponding
+        house stores of this process. Deadline statistics in real time are
+        kept in this process.
+        """
+        groups = [self.houses[i::self.workers]
+                  for i in range(min(self.workers, len(self.houses)))]
+        if not groups:
+            console.terse("No houses. Shutting down skedder ...\n")
+            return
+
+        context = multiprocessing.get_context("fork")
+        clock = context.Value('d', self.stamp, lock=False)  # shared stamp
+        states = context.Array('b', len(groups), lock=False)  # 1 if worker more
+        barrier = context.Barrier(len(groups) + 1)  # lock step with workers
+        reports = context.Queue()  # worker statistics
+        deadlines = self._createDeadlines() if self.real else []
+
+        workers = []
+        for index, houses in enumerate(groups):
+            worker = context.Process(target=self._work,
+                                     name="{0}.{1}".format(self.name, index),
+                                     args=(index, houses, clock, states,
+                                           barrier, reports))
+            worker.daemon = True
+            workers.append(worker)
+            console.terse("Starting worker {0} for houses {1} ...\n".format(
+                    worker.name, ', '.join([house.name for house in houses])))
+            worker.start()
+
+        self.timer.restart()
+        self.elapsed.restart()
+
+        try: #so always shutdown workers
+            while True:
+                try: #CNTL-C generates keyboardInterrupt to break out of while loop
+                    clock.value = self.stamp
+                    barrier.wait()  # release workers to run iteration
+                    barrier.wait()  # all workers done with iteration
+
+                    if not any(states): #all taskers stopped or aborted
+                        console.terse("No running or started taskers. Shutting down skedder ...\n")
+                        break
+
+                    #update time stamps
+                    if self.real:
+                        self.stamp += self._keepDeadline(deadlines)
+                    else:
+                        self.stamp += self.period
+                    for share in deadlines:
+                        share.stamp = self.stamp
+
+                except KeyboardInterrupt: #CNTL-C shutdown skedder
+                    console.terse("KeyboardInterrupt forcing shutdown of Skedder ...\n")
+                    break
+
+                except threading.BrokenBarrierError: #worker failed
+                    console.terse("Worker failure forcing shutdown of Skedder ...\n")
+                    break
+
+            console.terse("Total elapsed real time = {0:0.4f}\n".format(self.elapsed.elapsed))
+
+        finally: #workers abort their taskers when barrier broken
+            barrier.abort()
+            stats = []
+            for worker in workers:
                 try:
-                    status = tasker.runner.send(ABORT)
-                    console.terse("Tasker '{0}' aborted\n".format(tasker.name))
-                except StopIteration: #generator returned instead of yielded
-                    console.terse("Tasker '{0}' generator already exited\n".format(tasker.name))
+                    stats.append(reports.get(timeout=10.0))
+                except queue.Empty:  # worker died without report
+                    break
+            for worker in workers:
+                worker.join(timeout=10.0)
+
+        self.stats = sorted(stats, key=lambda stat: stat["index"])
+        houses = dict((house.name, house) for house in self.houses)
+        for stat in self.stats:
+            if stat["failure"]:
+                console.terse("Worker {0} failed with {1}\n".format(stat["name"],
+                                                                  stat["failure"]))
+            for name, profile in stat["profiles"].items():
+                store = houses[name].store
+                store.changeStamp(self.stamp)
+                for path, stamp, fields in profile:
+                    share = store.create(path)
+                    share.update(fields)
+                    share.stamp = stamp
+            console.terse("Worker {0} ran {1} iterations in {2:0.4f} seconds\n".format(
+                    stat["name"], stat["iterations"], stat["elapsed"]))
+
+    def _work(self, index, houses, clock, states, barrier, reports):
+        """
+        Worker process target that runs houses in lock step with the clock
+        process given by .runWorkers and puts its statistics into reports
+        when the barrier is broken by shutdown.
+
+        Parameters:
+            index = index of worker into states
+            houses = list of houses to run
+            clock = shared value of clock stamp
+            states = shared array set to 1 while worker has running taskers
+            barrier = barrier shared with clock process and other workers
+            reports = queue for statistics odict
+        """
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # clock process handles cntl-c
+        self.houses = houses
+        self.stamp = clock.value
+        profiles = self._readyHouses(self.stamp)
+        iterations = 0
+        failure = ""
+        self.elapsed.restart()
+
+        try:
+            while True:
+                barrier.wait()  # clock released iteration
+                if clock.value != self.stamp:
+                    self.stamp = clock.value
+                    for house in houses:
+                        house.store.changeStamp(self.stamp)
+
+                if profiles:
+                    begin = time.perf_counter()
+
+                more = False
+                if self.heap:
+                    more = self._runHeap(self.stamp)
+                more = self._runReady(self.stamp) or more
+
+                if profiles:
+                    self._tallyProfiles(profiles, time.perf_counter() - begin)
+
+                iterations += 1
+                states[index] = 1 if more and (self.ready or self.heap) else 0
+                barrier.wait()  # iteration done
+
+        except threading.BrokenBarrierError:  # shutdown
+            pass
+
+        except Exception as ex:  # fail all workers
+            failure = "{0}: {1}".format(ex.__class__.__name__, ex)
+            console.terse("Surprise exception forcing shutdown of worker {0}\n{1}\n".format(
+                    index, failure))
+            barrier.abort()
+
+        finally:
+            self._abortReady()
+
+        self._exposeHouses()
+
+        stat = odict()
+        stat["index"] = index
+        stat["name"] = multiprocessing.current_process().name
+        stat["pid"] = os.getpid()
+        stat["houses"] = [house.name for house in houses]
+        stat["iterations"] = iterations
+        stat["elapsed"] = self.elapsed.elapsed
+        stat["stamp"] = self.stamp
+        stat["aborted"] = [tasker.name for tasker, r, p in self.aborted]
+        stat["failure"] = failure
+        stat["profiles"] = odict()
+        for house in houses:
+            node = house.store.fetchNode(profiling.PROFILE_PATH)
+            if node is not None:
+                stat["profiles"][house.name] = [(share.name, share.stamp, list(share.items()))
+                                                for share in profiling.walkShares(node)]
+        reports.put(stat)
+
+    def _readyHouses(self, stamp):
+        """
+        Initialize store stamps of .houses to stamp, profile the profiled
+        houses and add their taskables to ready.
+
+        Returns list of iteration Timings of profiled houses
+        """
+        profiles = []
+        for house in self.houses:
+            house.store.changeStamp(stamp)
+
+            if house.profiled:
+                profiles.append(profiling.Timing(None,
+                                                 house.store,
+                                                 "skedder",
+                                                 overruns=0))
+                for tasker in house.taskables + house.slaves:
+                    profiling.profileTasker(tasker)
+
+            for tasker in house.taskables:
+                self.addReadyTask(tasker)
+        return profiles
+
+    def _createDeadlines(self):
+        """
+        Returns list of real time deadline shares, one per house in .houses
+        """
+        deadlines = []
+        for house in self.houses:
+            share = house.store.create("meta.deadline", fields=DEADLINE_FIELDS)
+            share.update(policy=self.policy, ticks=0, overruns=0, missed=0,
+                         lag=0.0, maxLag=0.0, jitter=0.0, maxJitter=0.0)
+            deadlines.append(share)
+        return deadlines
+
+    def _abortReady(self):
+        """
+        Abort every tasker in .ready and .heap to reclaim resources
+        """
+        ready = self.ready
+        heap = self.heap
+
+        console.terse("Aborting all ready Taskers ...\n")
+        for i in range(len(ready)): #run each ready tasker once
+            tasker,retime,period = ready.popleft() #pop it off
+
+            try:
+                status = tasker.runner.send(ABORT)
+                console.terse("Tasker '{0}' aborted\n".format(tasker.name))
+            except StopIteration: #generator returned instead of yielded
+                console.terse("Tasker '{0}' generator already exited\n".format(tasker.name))
 
-                #tasker.runner.close() #kill generator
+            #tasker.runner.close() #kill generator
 
+        while heap: #run each heaped tasker once in retime order
+            retime, order, tasker, period = heapq.heappop(heap)
+
+            try:
+                status = tasker.runner.send(ABORT)
+                console.terse("Tasker '{0}' aborted\n".format(tasker.name))
+            except StopIteration: #generator returned instead of yielded
+                console.terse("Tasker '{0}' generator already exited\n".format(tasker.name))
+        self.live = 0
+
+    def _exposeHouses(self):
+        """
+        Show store hierarchy of each house in .houses when concise
+        """
         if console._verbosity >= console.Wordage.concise:
             for house in self.houses:
                 #show store hierarchy
@@ -352,6 +659,155 @@ class Skedder(object):
                 house.store.expose(valued=(console._verbosity >= console.Wordage.terse))
 
 
+    def _keepDeadline(self, deadlines):
+        """
+        Wait for the real time deadline of the current iteration given by
+        .timer or when overrun apply .policy. Restarts .timer for the next
+        iteration and tallies the deadline statistics into each share in
+        deadlines.
+
+        Returns stamp delta seconds to the next iteration
+        """
+        timer = self.timer
+        period = self.period
+        timer.update()
+        lag = timer.latest - timer.stop  # positive when overrun
+        missed = 0
+        jitter = None
+
+        if lag > 0.0:  # overrun
+            if self.policy == "skip":
+                missed = int(lag // period) if period > 0.0 else 0
+                timer.restart(start=timer.stop + missed * period)
+                delta = period * (missed + 1)
+            elif self.policy == "stretch":
+                timer.restart()  # next deadline one period from now
+                delta = period + lag
+            else:  # burst
+                timer.repeat()  # deadline still past so runs immediately
+                delta = period
+
+        else:
+            while not timer.expired:
+                time.sleep(timer.remaining)
+            jitter = timer.latest - timer.stop  # wake up lateness
+            timer.repeat()
+            delta = period
+
+        for share in deadlines:
+            data = share.data
+            data.ticks += 1
+            if lag > 0.0:
+                data.overruns += 1
+                data.missed += missed
+                data.lag = lag
+                if lag > data.maxLag:
+                    data.maxLag = lag
+            elif jitter is not None:
+                data.jitter = jitter
+                if jitter > data.maxJitter:
+                    data.maxJitter = jitter
+
+        if lag > 0.0:
+            console.profuse("     Overrun skedder by {0:0.4f} missed {1} {2}\n",
+                            lag, missed, self.policy)
+        return delta
+
+    def _tallyProfiles(self, profiles, elapsed):
+        """
+        Tally elapsed iteration seconds into each Timing in profiles and
+        count an overrun when elapsed exceeds .period
+        """
+        overrun = elapsed > self.period
+        for profile in profiles:
+            profile.tally(elapsed)
+            if overrun:
+                profile.share.data.overruns += 1
+
+    def _runReady(self, stamp):
+        """
+        Run each tasker in .ready whose retime is due at stamp once.
+        Taskers not due are reappended and taskers run are reappended at
+        retime plus their current .period which allows for period change.
+
+        Returns True if any tasker in .ready is RUNNING or STARTED
+        """
+        ready = self.ready
+        aborted = self.aborted
+        more = False
+
+        for i in range(len(ready)): #attempt to run each ready tasker
+            tasker, retime, period = ready.popleft() #pop it off
+
+            if retime > stamp: #not time yet
+                ready.append((tasker, retime, period)) #reappend it
+                status = tasker.status
+
+            else: #run it
+                try:
+                    status = tasker.runner.send(tasker.desire)
+                    if status == ABORTED: #aborted so abort tasker
+                        aborted.append((tasker, stamp, period))
+                        console.profuse("     Tasker Self Aborted: {0}\n", tasker.name)
+                    else:
+                        ready.append((tasker,
+                                      retime + tasker.period,
+                                      tasker.period))  # append allows for period change
+
+                except StopIteration: #generator returned instead of yielded
+                    aborted.append((tasker, stamp, period))
+                    console.profuse("     Tasker Aborted due to StopIteration: {0}\n", tasker.name)
+                    continue
+
+            if status == RUNNING or status == STARTED:
+                more = True
+
+        return more
+
+    def _runHeap(self, stamp):
+        """
+        Run each tasker in .heap whose retime is due at stamp once.
+        Due taskers are run in the order they were added so ties behave the
+        same as the .ready deque. Taskers are rescheduled at retime plus their
+        current .period which allows for period change.
+
+        Heaped tasker status only changes when run here so .live is updated
+        from the status before and after each run instead of scanning .heap.
+
+        Returns True if any tasker in .heap is RUNNING or STARTED
+        """
+        heap = self.heap
+        aborted = self.aborted
+
+        due = []
+        while heap and heap[0][0] <= stamp:
+            due.append(heapq.heappop(heap))
+        due.sort(key=lambda entry: entry[1])  # run order
+
+        for retime, order, tasker, period in due:
+            was = tasker.status == RUNNING or tasker.status == STARTED
+            try:
+                status = tasker.runner.send(tasker.desire)
+                if status == ABORTED: #aborted so abort tasker
+                    aborted.append((tasker, stamp, period))
+                    console.profuse("     Tasker Self Aborted: {0}\n", tasker.name)
+                else:
+                    heapq.heappush(heap, (retime + tasker.period,
+                                          order,
+                                          tasker,
+                                          tasker.period))  # allows for period change
+
+            except StopIteration: #generator returned instead of yielded
+                aborted.append((tasker, stamp, period))
+                console.profuse("     Tasker Aborted due to StopIteration: {0}\n", tasker.name)
+                self.live -= was
+                continue
+
+            self.live += (tasker.status == RUNNING or tasker.status == STARTED) - was
+
+        return self.live > 0
+
+
 def Test(real = False, verbose = False):
     """Module Common self test
 
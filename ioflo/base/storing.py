@@ -65,6 +65,9 @@ class Store(registering.Registrar):
         .stamp = global time stamp for store
         .house = reference to house owning this store
         .shares = dictionary of shared data store items
+        .paths = flat index of resolved path names to nodes and shares
+        .pathHits = count of fetches resolved by .paths
+        .pathMisses = count of fetches that traversed .shares
         .metaShr = share for meta data
         .realTimeShr = share whose value is realtime time when .stamp is updated
         .timeShr = share whose value is copy of stamp when .stamp is updated
@@ -89,6 +92,9 @@ class Store(registering.Registrar):
         self.stamp = stamp #must be None or number
         self.house = house
         self.shares = Node().byName('') #dictionary of data store shares indexed by name
+        self.paths = dict()  # index of path names to nodes and shares
+        self.pathHits = 0  # fetches found in .paths
+        self.pathMisses = 0  # fetches that traversed .shares
 
         #create node for meta data
         self.metaShr = self.createNode('.meta')
@@ -97,18 +103,10 @@ class Store(registering.Registrar):
         #create share for realtime
         rt = time.time()
         self.realTimeShr = self.create('.realtime').update(value=rt)
-        #create share for realtime datetime ascii
-        dt = datetime.datetime.fromtimestamp(rt)
-        self.dateTimeShr = self.create('.datetime').update([("iso", dt.isoformat()),
-                                                            ("dt", dt),
-                                                            ("year", dt.year),
-                                                            ("month", dt.month),
-                                                            ("day", dt.day),
-                                                            ("hour", dt.hour),
-                                                            ("minute", dt.minute),
-                                                            ("second", dt.second),
-                                                            ("micro", dt.microsecond)
-                                                           ])
+        #create share for realtime datetime fields computed only when read
+        self.dateTimeShr = self.add(Clock(name='datetime',
+                                              stamp=self.stamp,
+                                              realtime=rt))
 
     def changeStamp(self, stamp):
         """change time stamp for this store """
@@ -117,18 +115,7 @@ class Store(registering.Registrar):
             self.timeShr.update(value=self.stamp)
             rt = time.time()
             self.realTimeShr.update(value=rt)
-            dt = datetime.datetime.fromtimestamp(rt)
-            self.dateTimeShr.update([("iso", dt.isoformat()),
-                                        ("dt", dt),
-                                        ("year", dt.year),
-                                        ("month", dt.month),
-                                        ("day", dt.day),
-                                        ("hour", dt.hour),
-                                        ("minute", dt.minute),
-                                        ("second", dt.second),
-                                        ("micro", dt.microsecond)
-                                       ])
-
+            self.dateTimeShr.tick(rt)
 
         except TypeError:
             self.stamp = None
@@ -143,17 +130,7 @@ class Store(registering.Registrar):
             self.timeShr.update(value=self.stamp)
             rt = time.time()
             self.realTimeShr.update(value=rt)
-            dt = datetime.datetime.fromtimestamp(rt)
-            self.dateTimeShr.update([("iso", dt.isoformat()),
-                                        ("dt", dt),
-                                        ("year", dt.year),
-                                        ("month", dt.month),
-                                        ("day", dt.day),
-                                        ("hour", dt.hour),
-                                        ("minute", dt.minute),
-                                        ("second", dt.second),
-                                        ("micro", dt.microsecond)
-                                       ])
+            self.dateTimeShr.tick(rt)
 
         except TypeError:
             console.verbose("Error: Store {0}, Can't advance stamp={1}"
@@ -170,16 +147,26 @@ class Store(registering.Registrar):
            isinstance(nos, Share)
 
            since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           need to traverse the hirearchy unless name is already in .paths
+           index of names to nodes and shares
         """
         try:
-            levels = name.strip('.').split('.')
-            nos = self.shares #start at top where nos is node dict or share
-            for level in levels:
-                nos = nos[level] #attempt dict reference
+            nos = self.paths[name]  # single lookup of previously resolved name
+        except (KeyError, TypeError):  # not indexed so traverse hierarchy
+            self.pathMisses += 1
+            try:
+                levels = name.strip('.').split('.')
+                nos = self.shares #start at top where nos is node dict or share
+                for level in levels:
+                    nos = nos[level] #attempt dict reference
 
-        except KeyError: #key error when level not in dict so bad name
-            return None
+            except KeyError: #key error when level not in dict so bad name
+                return None
+
+            if isinstance(nos, (Node, Share)):  # do not index share field values
+                self.paths[name] = nos
+        else:
+            self.pathHits += 1
 
         return nos #node or share
 
@@ -189,16 +176,9 @@ class Store(registering.Registrar):
               return None
 
            since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           need to traverse the hirearchy unless name is already in .paths
         """
-        try:
-            levels = name.strip('.').split(".")
-            nos = self.shares #start at top where nos =node dict or share
-            for level in levels:
-                nos = nos[level]
-
-        except KeyError:
-            return None
+        nos = self.fetch(name)
 
         if not isinstance(nos, Share):
             return None
@@ -211,18 +191,11 @@ class Store(registering.Registrar):
               return None
 
            since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           need to traverse the hirearchy unless name is already in .paths
         """
-        try:
-            levels = name.strip('.').split(".")
-            nos = self.shares
-            for level in levels:
-                nos = nos[level]
-
-        except KeyError:
-            return None
+        nos = self.fetch(name)
 
-        if isinstance(nos, Share):
+        if not isinstance(nos, Node):
             return None
 
         return nos # this is a node
@@ -262,6 +235,7 @@ class Store(registering.Registrar):
 
         node[tail] = share
         share.changeStore(self)
+        self.paths[share.name] = share
 
         console.profuse("{0}Added share {1} to store {2}\n".format(INDENT_ADD,
                                                                    share.name,
@@ -323,21 +297,24 @@ class Store(registering.Registrar):
             raise ValueError("No share with name '%s'" % share.name)
 
         node[tail] = share
+        self.paths.clear()  # stale entries for replaced share reindex on fetch
 
         share.changeStore(self)
 
         return share
 
-    def create(self, name):
+    def create(self, name, fields=None):
         """Retrieve share with name if it exits
            otherwise create a share with  name
               and add to store
+           If fields is not None then new share data is a slotted Record
+              with schema fields
         """
         share = self.fetchShare(name)  #does share already exist
         if share is not None: #must compare to none since empty container would also be false
             return share
 
-        return self.add(Share(name = name.strip('.')))
+        return self.add(Share(name = name.strip('.'), fields=fields))
 
     def createNode(self, name):
         """Retrieve node with name if it exits
@@ -469,7 +446,8 @@ class Share(object):
                  stamp=None,
                  unit=None,
                  owner=None,
-                 deck=None):
+                 deck=None,
+                 fields=None):
         """
         Initialize instance
 
@@ -482,9 +460,11 @@ class Share(object):
            stamp = time stamp for this share
            unit = measurement units for this share dict (preferably ordered) of fields and values
            owner = owner framework for this share
+           deck = iterable of initial deck entries
+           fields = sequence of field names to fix data schema as slotted Record
         """
 
-        self._data = Data()  # new data object
+        self._data = Data() if fields is None else Record.Fix(fields)()
         self._truth = None
         self._unit = None
         self._owner = None
@@ -659,17 +639,19 @@ class Share(object):
         if not isinstance(other, odict):
             raise ValueError('other must be an odict')
 
-        if other is self:
-            #raise ValueError('other cannot be the same odict')
-            pass #updating with self makes no changes
-
-        dict.update(self, other)
-        keys = self._keys
+        self._data.__dict__.reorder(other)
 
-        for key in other:
-            if key in keys:
-                keys.remove(key)
-            keys.append(key)
+    def fix(self, fields=None):
+        """
+        Fix data schema by replacing ._data with slotted Record with fields
+        keeping current values. Fields defaults to current field names.
+        Raises AttributeError if a current field is not in fields
+        Returns self so can chain
+        """
+        if fields is None:
+            fields = self._data.__dict__.keys()
+        self._data = Record.Fix(fields)(self._data.__dict__.items())
+        return self
 
     def changeStore(self, store = None):  # store management
         """Replace .store """
@@ -750,7 +732,7 @@ class Share(object):
     @data.setter
     def data(self, data):  # data property
         """Set data property """
-        if not isinstance(data, Data):
+        if not isinstance(data, (Data, Record)):
             raise ValueError("Not Data object %s" % data)
         self._data = data
         try:
@@ -897,6 +879,64 @@ class Share(object):
         result = ("{0}{1}\n".format(result, " ".join(entries)))
         return result
 
+class Clock(Share):
+    """
+    Share of local calendar date time fields of a realtime
+    Fields are iso, dt, year, month, day, hour, minute, second, micro
+
+    .tick(realtime) only saves realtime and stamps the share so per iteration
+    cost is small. The fields are computed from the last realtime the first
+    time ._data is accessed after a tick, that is, only when read.
+
+    instance attributes:
+        ._realtime = realtime not yet materialized into fields or None
+        ._clock = Data instance returned by ._data
+
+    """
+    def __init__(self, realtime=None, **kwa):
+        """
+        Initialize instance
+
+        Parameters:
+            realtime = realtime seconds from epoch for fields, time.time() if None
+        """
+        self._realtime = None
+        super(Clock, self).__init__(**kwa)
+        self._realtime = realtime if realtime is not None else time.time()
+
+    @property
+    def _data(self):
+        """
+        Materialize fields of pending ._realtime if any and return data object
+        """
+        if self._realtime is not None:
+            dt = datetime.datetime.fromtimestamp(self._realtime)
+            self._realtime = None
+            self._clock.__dict__.update([("iso", dt.isoformat()),
+                                         ("dt", dt),
+                                         ("year", dt.year),
+                                         ("month", dt.month),
+                                         ("day", dt.day),
+                                         ("hour", dt.hour),
+                                         ("minute", dt.minute),
+                                         ("second", dt.second),
+                                         ("micro", dt.microsecond)
+                                        ])
+        return self._clock
+
+    @_data.setter
+    def _data(self, data):
+        """ Set data object """
+        self._clock = data
+
+    def tick(self, realtime, stamp=None):
+        """
+        Defer update of fields to realtime until read and
+        set .stamp to stamp if not None else store stamp
+        """
+        self._realtime = realtime
+        self.stamp = stamp if stamp is not None else self.store.stamp
+
 class Data(object):
     """
     Data class
@@ -1037,6 +1077,183 @@ class Data(object):
         return result
 
 
+class Record(object):
+    """
+    Fixed schema Record class
+    Slotted alternative to Data for shares whose fields are known up front.
+    Record.Fix(fields) returns the Record subclass whose __slots__ are fields
+    so writes are plain slot stores and instances carry no per instance dict.
+
+    Setting an attribute that is not a field raises AttributeError.
+    A field is present once set and may be deleted. Field order is the schema
+    order of fields.
+
+    .__dict__ is a Fields view of the present fields so that Share accessors
+    work the same with Record as with Data
+    """
+    __slots__ = ()
+    Schemas = {}  # Record subclasses keyed by tuple of field names
+
+    @classmethod
+    def Fix(cls, fields):
+        """
+        Returns Record subclass with slotted schema given by fields sequence
+        Raises ValueError if a field is not a python public identifier
+        or is repeated
+        """
+        fields = tuple(fields)
+        klas = cls.Schemas.get(fields)
+        if klas is None:
+            for field in fields:
+                if not REO_IdentPub.match(field):
+                    raise ValueError("Invalid field name '{0}'".format(field))
+            if len(set(fields)) != len(fields):
+                raise ValueError("Repeated field name in {0}".format(fields))
+            klas = type(cls.__name__, (cls, ), dict(__slots__=fields))
+            cls.Schemas[fields] = klas
+        return klas
+
+    def __init__(self, *pa, **kwa):
+        """
+        Record() -> new Record with no fields present.
+
+        Record(pa1, pa2, ...) where pa = tuple of positional args, (pa1, pa2, ...)
+              each paX may be  a sequence of duples (k,v) or a dict
+
+        Record(k1 = v1, k2 = v2, ...) where kwa = dictionary of keyword args, {k1: v1, k2 : v2, ...}
+        """
+        self._change(*pa, **kwa)
+
+    @property
+    def __dict__(self):
+        """
+        Returns Fields mapping view of present fields
+        """
+        return Fields(self)
+
+    def __reduce__(self):
+        """
+        Pickle by schema and items since schema subclasses are made at runtime
+        """
+        return (_remakeRecord, (self.__slots__, self.__dict__.items()))
+
+    def __repr__(self):
+        """
+        Representation
+        """
+        return ("{0}({1})".format(self.__class__.__name__,
+                                  repr(self.__dict__.items())))
+
+    _change = Data._change
+    _sift = Data._sift
+    _show = Data._show
+
+
+def _remakeRecord(fields, items):
+    """
+    Returns Record with schema fields and items for unpickling
+    """
+    return Record.Fix(fields)(items)
+
+
+class Fields(object):
+    """
+    Mapping view of the present fields of a Record
+    Provides the odict methods used by Share on ._data.__dict__
+    Writes go to the record slots. .insert ignores index and .reorder is
+    not supported since field order is the fixed schema order.
+    """
+    __slots__ = ('record', )
+
+    def __init__(self, record):
+        """
+        Initialize instance
+
+        Parameters:
+            record = Record instance viewed
+        """
+        self.record = record
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self.record.__slots__ and hasattr(self.record, key)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self.record, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self.record, key, value)
+
+    def __delitem__(self, key):
+        try:
+            delattr(self.record, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, repr(self.items()))
+
+    def keys(self):
+        record = self.record
+        return [key for key in record.__slots__ if hasattr(record, key)]
+
+    def values(self):
+        return [getattr(self.record, key) for key in self.keys()]
+
+    def items(self):
+        return [(key, getattr(self.record, key)) for key in self.keys()]
+
+    def get(self, key, default=None):
+        return getattr(self.record, key, default) if key in self else default
+
+    def copy(self):
+        return odict(self.items())
+
+    def clear(self):
+        for key in self.keys():
+            delattr(self.record, key)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = getattr(self.record, key)
+        delattr(self.record, key)
+        return value
+
+    def popitem(self, last=True):
+        keys = self.keys()
+        if not keys:
+            raise KeyError('popitem(): record is empty')
+        key = keys[-1] if last else keys[0]
+        return (key, self.pop(key))
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            setattr(self.record, key, default)
+        return getattr(self.record, key)
+
+    def update(self, *pa, **kwa):
+        self.record._change(*pa, **kwa)
+
+    def insert(self, index, key, value):
+        if key in self:
+            raise KeyError('Key %r already exists.' % key)
+        setattr(self.record, key, value)
+
+    def reorder(self, other):
+        raise ValueError("Record field order is fixed by its schema")
+
+
 
 class Deck(deque):
     """
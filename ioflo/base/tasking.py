@@ -138,7 +138,7 @@ class Tasker(registering.StoriedRegistrar):
            Should be overridden in sub class
         """
         #do any on creation initialization here
-        console.profuse("     Making Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
         self.desire = STOP #default what to do next time, override below
@@ -149,21 +149,22 @@ class Tasker(registering.StoriedRegistrar):
         try:
             while (True):
                 control = (yield (self.status)) #accept control and yield status
-                console.profuse("\n     Iterate Tasker {0} with control = {1} status = {2}\n".format(
-                    self.name,
-                    ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(self.status, 'Unknown')))
+                if console._verbosity >= console.Wordage.profuse:
+                    console.profuse("\n     Iterate Tasker {0} with control = {1} status = {2}\n".format(
+                        self.name,
+                        ControlNames.get(control, 'Unknown'),
+                        StatusNames.get(self.status, 'Unknown')))
 
                 if control == RUN:
                     if self.status == STARTED or self.status == RUNNING:
-                        console.profuse("     Running Tasker {0} ...\n".format(self.name))
+                        console.profuse("     Running Tasker {0} ...\n", self.name)
                         self.status = RUNNING
                     else:
-                        console.profuse("     Need to Start Tasker {0}\n".format(self.name))
+                        console.profuse("     Need to Start Tasker {0}\n", self.name)
                         self.desire = START
 
                 elif control == READY:
-                    console.profuse("     Readying Tasker {0} ...\n".format(self.name))
+                    console.profuse("     Readying Tasker {0} ...\n", self.name)
                     self.desire = START
                     self.status = READIED
 
@@ -183,7 +184,7 @@ class Tasker(registering.StoriedRegistrar):
                         console.terse("     Tasker {0} not started or running.\n".format(self.name))
 
                 elif control == ABORT:
-                    console.profuse("     Aborting Tasker {0} ...\n".format(self.name))
+                    console.profuse("     Aborting Tasker {0} ...\n", self.name)
                     self.desire = ABORT
                     self.status = ABORTED
                     self.done = True #only done if complete successfully
@@ -191,14 +192,14 @@ class Tasker(registering.StoriedRegistrar):
                 else: #control == unknown error condition bad control
                     self.desire = ABORT
                     self.status = ABORTED
-                    console.profuse("     Aborting Tasker {0}, bad control = {1}\n".format(
-                        self.name,  CommandNames[control]))
+                    console.profuse("     Aborting Tasker {0}, bad control = {1}\n",
+                        self.name,  CommandNames[control])
                     break #break out of while loop. this will cause stopIteration
 
                 self.stamp = self.store.stamp
 
         finally: #in case uncaught exception
-            console.profuse("     Exception causing Abort Tasker {0} ...\n".format(self.name))
+            console.profuse("     Exception causing Abort Tasker {0} ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
 
@@ -161,6 +161,50 @@ class BasicTestCase(testing.FrameIofloTestCase):
         self.assertEqual(share.value, "Felgercarb")
 
 
+    def testFrameCompile(self):
+        """
+        Test compiled frame act plans run like the act lists
+        """
+        console.terse("{0}\n".format(self.testFrameCompile.__doc__))
+        @doing.doify("CompiledDoer")
+        def action(self, a="Felgercarb", b=1, **kwa):
+            """
+            Doer action method
+            """
+            share = self.store.create(".test.a")
+            share.update(value=a, count=share.get("count", 0) + b)
+
+        act = self.addDoer("CompiledDoer", parms=dict(b=2))
+        self.house.compiled = True
+        self.resolve()  # resolve and compile House
+        self.assertIsNotNone(self.frame.plan)
+        self.assertEqual(len(self.frame.plan["reacts"]), 1)
+        compiled = self.frame.plan["reacts"][0]
+        self.assertNotIsInstance(compiled, acting.Act)
+        self.assertIs(compiled.func.__self__, act.actor)
+        self.assertEqual(compiled.keywords, dict(b=2))
+
+        side = acting.SideAct(actor=act.actor, action="action")
+        self.assertEqual(side.compile(), side.actor.action)  # no parms
+
+        self.frame.recur()  # run compiled reacts in frame
+        share = self.store.fetch(".test.a")
+        self.assertEqual(share.value, "Felgercarb")
+        self.assertEqual(share["count"], 2)
+
+        self.frame.addReact(acting.Nact(actor=act.actor, parms=dict(b=3)))
+        self.assertIsNone(self.frame.plan)  # adding act discards plan
+        self.frame.recur()  # runs act lists
+        self.assertEqual(share["count"], 7)
+
+        self.house.compile()
+        self.assertIs(self.frame.plan["reacts"][1], self.frame.reacts[1])  # Nact
+        self.frame.recur()
+        self.assertEqual(share["count"], 12)
+
+        self.house.decompile()
+        self.assertIsNone(self.frame.plan)
+
 def runOne(test):
     '''
     Unittest Runner
@@ -174,7 +218,8 @@ def runSome():
     tests =  []
     names = ['testActify',
              'testDoify',
-             'testFrameDoer', ]
+             'testFrameDoer',
+             'testFrameCompile', ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for profiling module
+"""
+
+import sys
+import unittest
+
+import os
+
+from ioflo.test import testing
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import storing
+from ioflo.base import acting
+from ioflo.base import doing
+from ioflo.base import skedding
+from ioflo.base import profiling
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class BasicTestCase(testing.FrameIofloTestCase):
+    """
+    Profiling Test Case
+    """
+
+    def setUp(self):
+        super(BasicTestCase, self).setUp()
+
+    def tearDown(self):
+        super(BasicTestCase, self).tearDown()
+
+    def testTiming(self):
+        """
+        Test Timing tallies calls into profile share
+        """
+        console.terse("{0}\n".format(self.testTiming.__doc__))
+        self.store.changeStamp(1.0)
+        timing = profiling.Timing(lambda x, y=1: x + y, self.store, "calls.add", kind="add")
+        share = self.store.fetch(".meta.profile.calls.add")
+        self.assertIs(timing.share, share)
+        self.assertIsInstance(share.data, storing.Record)
+        self.assertEqual(share.keys(), ["count", "total", "max", "last", "kind"])
+        self.assertEqual(share["count"], 0)
+
+        self.assertEqual(timing(2, y=3), 5)
+        self.assertEqual(timing(2), 3)
+        self.assertEqual(share["count"], 2)
+        self.assertGreater(share["total"], 0.0)
+        self.assertGreaterEqual(share["max"], share["last"])
+        self.assertEqual(share["kind"], "add")
+        self.assertEqual(share.stamp, 1.0)
+
+        with self.assertRaises(TypeError):
+            timing()  # still tallied
+        self.assertEqual(share["count"], 3)
+
+        again = profiling.Timing(None, self.store, "calls.add", kind="add")
+        self.assertIs(again.share, share)
+        self.assertEqual(share["count"], 3)  # existing share keeps statistics
+
+    def testFrameProfile(self):
+        """
+        Test profiled house times frame acts and tasker runners
+        """
+        console.terse("{0}\n".format(self.testFrameProfile.__doc__))
+        @doing.doify("ProfiledDoer")
+        def action(self, a="Felgercarb", **kwa):
+            """
+            Doer action method
+            """
+            self.store.create(".test.a").update(value=a)
+
+        act = self.addDoer("ProfiledDoer")
+        self.house.profiled = True
+        self.resolve()  # resolve and profile House
+        timing = self.frame.plan["reacts"][0]
+        self.assertIsInstance(timing, profiling.Timing)
+        self.assertIs(timing.call, act)  # not compiled
+        path = ".meta.profile.act.{0}.{1}.reacts0".format(self.framer.name,
+                                                           self.frame.name)
+        share = self.store.fetch(path)
+        self.assertIs(timing.share, share)
+        self.assertEqual(share["actor"], "ProfiledDoer")
+
+        self.frame.recur()
+        self.frame.recur()
+        self.assertEqual(share["count"], 2)
+        self.assertEqual(self.store.fetch(".test.a").value, "Felgercarb")
+
+        self.house.compiled = True
+        self.house.compile()
+        timing = self.frame.plan["reacts"][0]
+        self.assertIsNot(timing.call, act)  # compiled
+        self.assertIs(timing.share, share)
+        self.frame.recur()
+        self.assertEqual(share["count"], 3)
+
+        self.store.changeStamp(0.0)
+        runner = profiling.profileTasker(self.framer)
+        self.assertIs(self.framer.runner, runner)
+        self.assertIs(profiling.profileTasker(self.framer), runner)  # once only
+        status = self.framer.runner.send(START)
+        share = self.store.fetch(".meta.profile.tasker.{0}".format(self.framer.name))
+        self.assertEqual(share["count"], 1)
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testTiming',
+             'testFrameProfile', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testBasic')
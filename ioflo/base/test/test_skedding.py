@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for skedding module
+"""
+
+import sys
+import time
+import unittest
+
+import os
+
+from ioflo.test import testing
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import housing
+from ioflo.base import tasking
+from ioflo.base import skedding
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class Counter(tasking.Tasker):
+    """
+    Tasker that records its runs in .log and exits after .limit runs
+    Changes its period to .change after half its runs when .change not None
+    Sleeps for .stall[1] seconds on run .stall[0] when .stall not None
+    Raises ValueError on run .fail when .fail not None
+    """
+    def __init__(self, log, limit=8, change=None, stall=None, fail=None, **kw):
+        self.log = log
+        self.limit = limit
+        self.change = change
+        self.stall = stall
+        self.fail = fail
+        super(Counter, self).__init__(**kw)
+
+    def makeRunner(self):
+        """
+        Generator that records each run
+        """
+        self.status = STOPPED
+        self.desire = STOP
+        count = 0
+        while count < self.limit:
+            control = (yield (self.status))
+            if control == ABORT:
+                self.status = ABORTED
+                continue
+            self.status = RUNNING
+            self.desire = RUN
+            self.log.append((self.name, self.store.stamp))
+            count += 1
+            if self.change is not None and count == self.limit // 2:
+                self.period = self.change
+            if self.stall is not None and count == self.stall[0]:
+                time.sleep(self.stall[1])
+            if self.fail is not None and count == self.fail:
+                raise ValueError("Failed on run {0}".format(count))
+
+
+class BasicTestCase(testing.IofloTestCase):
+    """
+    Skedder Test Case
+    """
+
+    def setUp(self):
+        super(BasicTestCase, self).setUp()
+
+    def tearDown(self):
+        super(BasicTestCase, self).tearDown()
+
+    def runSkedder(self, heaped):
+        """
+        Returns log of runs of skedder with a mix of tasker periods
+        """
+        housing.House.Clear()
+        housing.ClearRegistries()
+        house = housing.House(name="test")
+        log = []
+        specs = [("t1", 0.0, 16, None),
+                 ("t2", 0.5, 4, None),
+                 ("t3", 0.125, 8, 0.375),
+                 ("t4", 0.25, 6, None),
+                 ("t5", 0.5, 4, 0.0),
+                 ("t6", 0.0625, 12, None)]
+        for name, period, limit, change in specs:
+            tasker = Counter(log=log,
+                             limit=limit,
+                             change=change,
+                             name=name,
+                             store=house.store,
+                             period=period,
+                             schedule=ACTIVE)
+            house.taskables.append(tasker)
+        skedder = skedding.Skedder(name="TestSkedder",
+                                   period=0.125,
+                                   houses=[house],
+                                   heaped=heaped)
+        skedder.run()
+        return (skedder, log)
+
+    def testHeapedOrder(self):
+        """
+        Test heaped skedder runs the same taskers in the same order as ready deque
+        """
+        console.terse("{0}\n".format(self.testHeapedOrder.__doc__))
+
+        skedder, readyLog = self.runSkedder(heaped=False)
+        self.assertIs(skedder.heaped, False)
+        self.assertEqual(len(skedder.aborted), 6)
+
+        skedder, heapLog = self.runSkedder(heaped=True)
+        self.assertIs(skedder.heaped, True)
+        self.assertEqual(len(skedder.aborted), 6)
+        self.assertEqual(len(skedder.ready), 0)
+        self.assertEqual(len(skedder.heap), 0)
+
+        self.assertEqual(heapLog, readyLog)
+        self.assertEqual(heapLog[:7], [('t1', 0.0),
+                                       ('t2', 0.0),
+                                       ('t3', 0.0),
+                                       ('t4', 0.0),
+                                       ('t5', 0.0),
+                                       ('t6', 0.0),
+                                       ('t1', 0.125)])
+        # period changed from 0.125 to 0.375 after 4 runs
+        self.assertEqual([stamp for name, stamp in heapLog if name == 't3'],
+                         [0.0, 0.125, 0.25, 0.375, 0.75, 1.125, 1.5, 1.875])
+
+    def testHeapedLive(self):
+        """
+        Test heaped skedder live count tracks running taskers without scans
+        """
+        console.terse("{0}\n".format(self.testHeapedLive.__doc__))
+
+        housing.House.Clear()
+        housing.ClearRegistries()
+        house = housing.House(name="test")
+        log = []
+        for name, period, limit in [("t1", 0.0, 3),
+                                    ("t2", 0.5, 3),
+                                    ("t3", 0.125, 5)]:
+            tasker = Counter(log=log,
+                             limit=limit,
+                             name=name,
+                             store=house.store,
+                             period=period,
+                             schedule=ACTIVE)
+            house.taskables.append(tasker)
+        skedder = skedding.Skedder(name="TestSkedder",
+                                   period=0.125,
+                                   houses=[house],
+                                   heaped=True)
+        skedder._readyHouses(0.0)
+        self.assertEqual(skedder.live, 0)
+
+        stamp = 0.0
+        lives = []
+        while skedder.heap:
+            house.store.changeStamp(stamp)
+            more = skedder._runHeap(stamp)
+            live = len([tasker for r, o, tasker, p in skedder.heap
+                        if tasker.status in (RUNNING, STARTED)])
+            self.assertEqual(skedder.live, live)
+            self.assertEqual(more, live > 0)
+            lives.append(live)
+            stamp += 0.125
+        # t2 not due but still running after t1 and t3 exit
+        self.assertEqual(lives, [3, 3, 2, 2, 1, 1, 1, 1, 0])
+        self.assertEqual(len(skedder.aborted), 3)
+
+    def runPolicy(self, policy):
+        """
+        Returns duple (stamps, deadline) of real time skedder with policy
+        where stamps is list of run stamps of a tasker that overruns on
+        its third run and deadline is the .meta.deadline share
+        """
+        housing.House.Clear()
+        housing.ClearRegistries()
+        house = housing.House(name="test")
+        log = []
+        tasker = Counter(log=log,
+                         limit=6,
+                         stall=(3, 0.11),
+                         name="t1",
+                         store=house.store,
+                         period=0.0,
+                         schedule=ACTIVE)
+        house.taskables.append(tasker)
+        skedder = skedding.Skedder(name="TestSkedder",
+                                   period=0.05,
+                                   real=True,
+                                   houses=[house],
+                                   policy=policy)
+        skedder.run()
+        return ([stamp for name, stamp in log], house.store.fetch(".meta.deadline"))
+
+    def testPolicy(self):
+        """
+        Test real time overrun policies and deadline statistics
+        """
+        console.terse("{0}\n".format(self.testPolicy.__doc__))
+        with self.assertRaises(ValueError):
+            skedding.Skedder(policy="hurry")
+
+        stamps, deadline = self.runPolicy("burst")
+        self.assertEqual([round(stamp, 6) for stamp in stamps],
+                         [0.0, 0.05, 0.1, 0.15, 0.2, 0.25])
+        self.assertEqual(deadline["policy"], "burst")
+        self.assertGreaterEqual(deadline["overruns"], 2)  # bursts until caught up
+        self.assertEqual(deadline["missed"], 0)
+        self.assertGreater(deadline["maxLag"], 0.05)
+        self.assertGreaterEqual(deadline["maxJitter"], 0.0)
+
+        stamps, deadline = self.runPolicy("skip")
+        self.assertEqual(deadline["overruns"], 1)
+        self.assertEqual(deadline["missed"], 1)  # skipped 0.15
+        self.assertEqual([round(stamp, 6) for stamp in stamps],
+                         [0.0, 0.05, 0.1, 0.2, 0.25, 0.3])
+
+        stamps, deadline = self.runPolicy("stretch")
+        self.assertEqual(deadline["overruns"], 1)
+        self.assertEqual(deadline["missed"], 0)
+        self.assertGreater(stamps[3] - stamps[2], 0.1)  # stretched
+        self.assertAlmostEqual(stamps[4] - stamps[3], 0.05)
+        self.assertEqual(deadline.stamp, stamps[-1])
+
+    def runWorkers(self, workers, fail=None):
+        """
+        Returns duple (skedder, counts) of skedder with workers running two
+        profiled houses where counts is dict of tasker profile counts
+        keyed by house name
+        """
+        housing.House.Clear()
+        housing.ClearRegistries()
+        houses = []
+        for name, period, limit in (("h1", 0.0, 4), ("h2", 0.25, 8)):
+            house = housing.House(name=name)
+            house.profiled = True
+            tasker = Counter(log=[],
+                             limit=limit,
+                             fail=fail if name == "h2" else None,
+                             name="t{0}".format(name),
+                             store=house.store,
+                             period=period,
+                             schedule=ACTIVE)
+            house.taskables.append(tasker)
+            houses.append(house)
+        skedder = skedding.Skedder(name="TestSkedder",
+                                   period=0.125,
+                                   houses=houses,
+                                   workers=workers)
+        skedder.run()
+        counts = {}
+        for house in houses:
+            share = house.store.fetch(".meta.profile.tasker.t{0}".format(house.name))
+            counts[house.name] = share["count"] if share is not None else None
+        return (skedder, counts)
+
+    def testWorkers(self):
+        """
+        Test skedder runs houses in worker processes in lock step
+        """
+        console.terse("{0}\n".format(self.testWorkers.__doc__))
+        with self.assertRaises(ValueError):
+            skedding.Skedder(workers=-1)
+
+        skedder, counts = self.runWorkers(workers=0)
+        self.assertEqual(skedder.stats, [])
+        self.assertEqual(counts, {"h1": 4, "h2": 8})
+
+        skedder, workerCounts = self.runWorkers(workers=4)  # at most one per house
+        self.assertEqual(workerCounts, counts)
+        self.assertEqual(len(skedder.stats), 2)
+        first, second = skedder.stats
+        self.assertEqual(first["houses"], ["h1"])
+        self.assertEqual(second["houses"], ["h2"])
+        self.assertNotEqual(first["pid"], os.getpid())
+        self.assertNotEqual(first["pid"], second["pid"])
+        self.assertEqual(first["iterations"], second["iterations"])  # lock step
+        self.assertEqual(first["stamp"], second["stamp"])
+        self.assertEqual(skedder.stamp, second["stamp"])
+        self.assertEqual(first["failure"], "")
+        self.assertEqual(second["failure"], "")
+
+        skedder, counts = self.runWorkers(workers=1)  # both houses in one worker
+        self.assertEqual(counts, workerCounts)
+        self.assertEqual(len(skedder.stats), 1)
+        self.assertEqual(skedder.stats[0]["houses"], ["h1", "h2"])
+
+        skedder, counts = self.runWorkers(workers=2, fail=2)
+        first, second = skedder.stats
+        self.assertTrue(second["failure"].startswith("ValueError"))
+        self.assertEqual(first["failure"], "")  # aborted by failure of other
+        self.assertLess(first["iterations"], 5)
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = [
+                'testHeapedOrder',
+                'testHeapedLive',
+                'testPolicy',
+                'testWorkers',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testBasic')
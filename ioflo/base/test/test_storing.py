@@ -255,6 +255,152 @@ class BasicTestCase(unittest.TestCase):
         store.expose(valued=True)
         storing.Store.Clear()
 
+    def testStorePaths(self):
+        """
+        Test Store path index for fetch fetchShare fetchNode
+        """
+        console.terse("{0}\n".format(self.testStorePaths.__doc__))
+        storing.Store.Clear()  # clear registry of Store instance entries
+
+        store = storing.Store()
+        share = store.create('auto.depth').update(value=10.0)
+        self.assertIs(store.paths['auto.depth'], share)
+
+        hits = store.pathHits
+        misses = store.pathMisses
+        self.assertIs(store.fetchShare('auto.depth'), share)
+        self.assertEqual(store.pathHits, hits + 1)
+        self.assertEqual(store.pathMisses, misses)
+
+        self.assertIs(store.fetchShare('.auto.depth'), share)  # new name form misses
+        self.assertEqual(store.pathMisses, misses + 1)
+        self.assertIs(store.fetchShare('.auto.depth'), share)
+        self.assertEqual(store.pathHits, hits + 2)
+
+        node = store.fetchNode('auto')
+        self.assertIsInstance(node, storing.Node)
+        self.assertIs(store.paths['auto'], node)
+        self.assertIs(store.fetchShare('auto'), None)
+        self.assertIs(store.fetchNode('auto.depth'), None)
+
+        # share fields and missing names are not indexed
+        self.assertEqual(store.fetch('auto.depth.value'), 10.0)
+        self.assertNotIn('auto.depth.value', store.paths)
+        self.assertIs(store.fetch('auto.speed'), None)
+        self.assertNotIn('auto.speed', store.paths)
+
+        speed = store.create('auto.speed')
+        self.assertIs(store.fetch('auto.speed'), speed)
+
+        shareA = storing.Share(name='auto.depth')
+        store.change(shareA)
+        self.assertIs(store.fetchShare('auto.depth'), shareA)
+        self.assertIs(store.fetchShare('.auto.depth'), shareA)
+        self.assertIs(store.fetchNode('auto'), node)
+
+        storing.Store.Clear()
+
+    def testStoreClock(self):
+        """
+        Test Store .datetime Clock share fields materialized lazily
+        """
+        console.terse("{0}\n".format(self.testStoreClock.__doc__))
+        import datetime
+        storing.Store.Clear()  # clear registry of Store instance entries
+
+        store = storing.Store(stamp=0.0)
+        clock = store.dateTimeShr
+        self.assertIsInstance(clock, storing.Clock)
+        self.assertIs(store.fetchShare('.datetime'), clock)
+        self.assertEqual(clock.stamp, 0.0)
+        self.assertEqual(list(clock.keys()), ["iso", "dt", "year", "month", "day",
+                                              "hour", "minute", "second", "micro"])
+
+        store.changeStamp(1.0)
+        self.assertEqual(clock.stamp, 1.0)
+        self.assertIsNotNone(clock._realtime)  # fields not yet computed
+        rt = store.realTimeShr.value
+        dt = datetime.datetime.fromtimestamp(rt)
+        self.assertEqual(clock['dt'], dt)
+        self.assertIsNone(clock._realtime)
+        self.assertEqual(clock.data.iso, dt.isoformat())
+        self.assertEqual(clock['micro'], dt.microsecond)
+
+        store.advanceStamp(0.5)
+        self.assertEqual(clock.stamp, 1.5)
+        rt = store.realTimeShr.value
+        dt = datetime.datetime.fromtimestamp(rt)
+        self.assertEqual(dict(clock.items())['iso'], dt.isoformat())
+        self.assertEqual(len(clock), 9)
+
+        storing.Store.Clear()
+
+    def testRecord(self):
+        """
+        Test fixed schema Record data for Share
+        """
+        console.terse("{0}\n".format(self.testRecord.__doc__))
+        import pickle
+
+        Record = storing.Record.Fix(("value", "x", "y"))
+        self.assertIs(storing.Record.Fix(["value", "x", "y"]), Record)
+        self.assertTrue(issubclass(Record, storing.Record))
+        with self.assertRaises(ValueError):
+            storing.Record.Fix(("value", "_x"))
+        with self.assertRaises(ValueError):
+            storing.Record.Fix(("value", "value"))
+
+        record = Record(y=3, value=1)
+        self.assertFalse(hasattr(record, "__weakref__"))
+        self.assertEqual(record.__dict__.items(), [("value", 1), ("y", 3)])
+        with self.assertRaises(AttributeError):
+            record.z = 4
+        self.assertEqual(repr(record), "Record([('value', 1), ('y', 3)])")
+        self.assertEqual(pickle.loads(pickle.dumps(record)).__dict__.items(),
+                         record.__dict__.items())
+
+        share = storing.Share(name="auto.depth", fields=("value", "x", "y"))
+        self.assertIsInstance(share.data, storing.Record)
+        self.assertEqual(len(share), 0)
+        share.update(value=10.0, y=2.0)
+        self.assertEqual(share.value, 10.0)
+        self.assertEqual(share.keys(), ["value", "y"])
+        self.assertEqual(share.items(), [("value", 10.0), ("y", 2.0)])
+        self.assertEqual(share.copy(), odict([("value", 10.0), ("y", 2.0)]))
+        self.assertEqual(share.sift(["y"]), odict([("y", 2.0)]))
+        self.assertFalse("x" in share)
+        self.assertEqual(share.get("x", 5), 5)
+        with self.assertRaises(KeyError):
+            share["z"] = 1
+        with self.assertRaises(AttributeError):
+            share.update(z=1)
+
+        share.insert(0, "x", 1.0)  # schema order not index
+        self.assertEqual(share.keys(), ["value", "x", "y"])
+        self.assertEqual(share.pop("x"), 1.0)
+        self.assertEqual(share.pop("x", None), None)
+        self.assertEqual(share.popitem(), ("y", 2.0))
+        self.assertEqual(share.setdefault("x", 3.0), 3.0)
+        self.assertEqual(share.items(), [("value", 10.0), ("x", 3.0)])
+        with self.assertRaises(ValueError):
+            share.reorder(odict(x=1, value=2))
+        share.clear()
+        self.assertEqual(len(share), 0)
+
+        share = storing.Share(name="auto.speed").update(value=1.0, heading=2.0)
+        share.fix()
+        self.assertIsInstance(share.data, storing.Record)
+        self.assertEqual(share.items(), [("value", 1.0), ("heading", 2.0)])
+        share.fix(("heading", "value", "rate"))
+        self.assertEqual(share.items(), [("heading", 2.0), ("value", 1.0)])
+        with self.assertRaises(AttributeError):
+            share.fix(("rate", ))
+
+        store = storing.Store()
+        share = store.create("auto.pitch", fields=("value", ))
+        self.assertIsInstance(share.data, storing.Record)
+        self.assertIs(store.create("auto.pitch"), share)
+
     def testMark(self):
         """
         Test Mark Class
@@ -300,6 +446,9 @@ def runSome():
                 'testData',
                 'testShare',
                 'testStore',
+                'testStorePaths',
+                'testStoreClock',
+                'testRecord',
                 'testMark',
                 'testDeck',
             ]